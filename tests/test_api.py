@@ -1,6 +1,7 @@
 """Tests for the ZORA Flask API — exercises the full request pipeline."""
 import base64
 from collections.abc import Generator
+from typing import Any
 
 import pytest
 from flask.testing import FlaskClient
@@ -16,6 +17,31 @@ def client() -> Generator[FlaskClient, None, None]:
         yield c
 
 
+def test_unknown_fill_engine_is_rejected_at_startup() -> None:
+    with pytest.raises(ValueError, match="FILL_ENGINE"):
+        create_app({"TESTING": True, "FILL_ENGINE": "nope"})
+
+
+def test_negative_fill_backtracks_is_rejected_at_startup() -> None:
+    with pytest.raises(ValueError, match="FILL_BACKTRACKS"):
+        create_app({"TESTING": True, "FILL_BACKTRACKS": -1})
+
+
+def test_negative_dungeon_shuffle_workers_is_rejected_at_startup() -> None:
+    with pytest.raises(ValueError, match="DUNGEON_SHUFFLE_WORKERS"):
+        create_app({"TESTING": True, "DUNGEON_SHUFFLE_WORKERS": -1})
+
+
+def test_non_bool_legacy_enemy_sampling_is_rejected_at_startup() -> None:
+    with pytest.raises(ValueError, match="LEGACY_ENEMY_SAMPLING"):
+        create_app({"TESTING": True, "LEGACY_ENEMY_SAMPLING": "yes"})
+
+
+def test_non_bool_legacy_cave_shuffle_is_rejected_at_startup() -> None:
+    with pytest.raises(ValueError, match="LEGACY_CAVE_SHUFFLE"):
+        create_app({"TESTING": True, "LEGACY_CAVE_SHUFFLE": "yes"})
+
+
 # ---------------------------------------------------------------------------
 # GET /health
 # ---------------------------------------------------------------------------
@@ -90,6 +116,78 @@ def test_generate_with_explicit_seed(client: FlaskClient) -> None:
     assert data["seed"] == "42"
 
 
+def test_generate_passes_fill_backtracks(monkeypatch: pytest.MonkeyPatch) -> None:
+    from zora.api import routes
+    from zora.generate_game import generate_game
+
+    seen: dict[str, Any] = {}
+
+    def spy(*args: Any, **kwargs: Any) -> Any:
+        seen.update(kwargs)
+        return generate_game(*args, **kwargs)
+
+    monkeypatch.setattr(routes, "generate_game", spy)
+    app = create_app({"TESTING": True, "FILL_BACKTRACKS": 5})
+    with app.test_client() as c:
+        r = c.post("/generate", json={"flag_string": "AAAAAAAA", "seed": 42})
+    assert r.status_code == 200
+    assert seen["max_fill_backtracks"] == 5
+
+
+def test_generate_passes_dungeon_shuffle_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    from zora.api import routes
+    from zora.generate_game import generate_game
+
+    seen: dict[str, Any] = {}
+
+    def spy(*args: Any, **kwargs: Any) -> Any:
+        seen.update(kwargs)
+        return generate_game(*args, **kwargs)
+
+    monkeypatch.setattr(routes, "generate_game", spy)
+    app = create_app({"TESTING": True, "DUNGEON_SHUFFLE_WORKERS": 1})
+    with app.test_client() as c:
+        r = c.post("/generate", json={"flag_string": "AAAAAAAA", "seed": 42})
+    assert r.status_code == 200
+    assert seen["dungeon_shuffle_workers"] == 1
+
+
+def test_generate_passes_legacy_enemy_sampling(monkeypatch: pytest.MonkeyPatch) -> None:
+    from zora.api import routes
+    from zora.generate_game import generate_game
+
+    seen: dict[str, Any] = {}
+
+    def spy(*args: Any, **kwargs: Any) -> Any:
+        seen.update(kwargs)
+        return generate_game(*args, **kwargs)
+
+    monkeypatch.setattr(routes, "generate_game", spy)
+    app = create_app({"TESTING": True, "LEGACY_ENEMY_SAMPLING": True})
+    with app.test_client() as c:
+        r = c.post("/generate", json={"flag_string": "AAAAAAAA", "seed": 42})
+    assert r.status_code == 200
+    assert seen["legacy_enemy_sampling"] is True
+
+
+def test_generate_passes_legacy_cave_shuffle(monkeypatch: pytest.MonkeyPatch) -> None:
+    from zora.api import routes
+    from zora.generate_game import generate_game
+
+    seen: dict[str, Any] = {}
+
+    def spy(*args: Any, **kwargs: Any) -> Any:
+        seen.update(kwargs)
+        return generate_game(*args, **kwargs)
+
+    monkeypatch.setattr(routes, "generate_game", spy)
+    app = create_app({"TESTING": True, "LEGACY_CAVE_SHUFFLE": True})
+    with app.test_client() as c:
+        r = c.post("/generate", json={"flag_string": "AAAAAAAA", "seed": 42})
+    assert r.status_code == 200
+    assert seen["legacy_cave_shuffle"] is True
+
+
 def test_generate_seed_as_string(client: FlaskClient) -> None:
     r = client.post("/generate", json={"flag_string": "AAAAAAAA", "seed": "99999"})
     assert r.status_code == 200
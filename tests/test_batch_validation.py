@@ -0,0 +1,70 @@
+"""
+Batch validation tests: seed/ROM corpora are validated and summarized.
+"""
+from pathlib import Path
+
+from flags.flags_generated import Flags
+from zora import batch_validation
+from zora.batch_validation import (
+    BatchReport,
+    ValidationResult,
+    is_world_valid,
+    parse_seed_range,
+    validate_rom_files,
+    validate_seeds,
+)
+from zora.game_validator import room_layout_key
+from zora.parser import load_bin_files, parse_game_world
+
+TEST_DATA = Path(__file__).parent.parent / "rom_data"
+
+
+def test_parse_seed_range():
+    assert parse_seed_range("1-3,10, 12-12") == [1, 2, 3, 10, 12]
+
+
+def test_worlds_with_same_layout_share_room_tables():
+    """Two parses of the same ROM data validate against one compiled table set."""
+    batch_validation._room_table_cache.clear()
+    bins = load_bin_files(TEST_DATA)
+    assert is_world_valid(parse_game_world(bins), avoid_required_hard_combat=False)
+    assert is_world_valid(parse_game_world(bins), avoid_required_hard_combat=False)
+    assert len(batch_validation._room_table_cache) == 1
+    assert next(iter(batch_validation._room_table_cache.values()))
+
+
+def test_room_table_cache_is_bounded(monkeypatch):
+    """Distinct layouts evict the least recently used tables."""
+    batch_validation._room_table_cache.clear()
+    monkeypatch.setattr(batch_validation, "_ROOM_TABLE_CACHE_SIZE", 1)
+    world = parse_game_world(load_bin_files(TEST_DATA))
+    assert is_world_valid(world, avoid_required_hard_combat=False)
+    assert is_world_valid(world, avoid_required_hard_combat=True)
+    assert list(batch_validation._room_table_cache) == [(room_layout_key(world), True)]
+
+
+def test_validate_seeds_in_process():
+    report = validate_seeds(Flags(), [1], max_workers=1)
+    assert [r.source for r in report.results] == ["seed 1"]
+    assert len(report.passed) == 1
+
+
+def test_validate_rom_files_reports_unreadable_input(tmp_path):
+    bad = tmp_path / "not_a_rom.nes"
+    bad.write_bytes(b"\x00" * 16)
+    report = validate_rom_files([bad, tmp_path / "missing.nes"], max_workers=1)
+    assert len(report.errored) == 2
+    assert not report.passed
+
+
+def test_report_summary_counts():
+    report = BatchReport([
+        ValidationResult("seed 1", True, None, 1.0),
+        ValidationResult("seed 2", False, None, 1.0),
+        ValidationResult("seed 3", False, "RuntimeError: boom", 1.0),
+    ], seconds=3.0)
+    summary = report.summary()
+    assert "passed:  1" in summary
+    assert "failed:  1" in summary
+    assert "errored: 1" in summary
+    assert "RuntimeError: boom" in summary
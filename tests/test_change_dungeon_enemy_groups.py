@@ -30,7 +30,10 @@ from zora.enemy.change_dungeon_enemy_groups import (
     _STAT_OFFSETS,
     _GROUP_SPRITE_ATTR,
     _SPRITE_BANK_BASES,
-    _read_enemy_tiles,
+    _OW_RESERVED_SLOTS_MASK,
+    _claim_slots,
+    _read_all_enemy_tiles,
+    _slot_mask,
 )
 from zora.data_model import EnemySpriteSet
 
@@ -426,7 +429,7 @@ class TestChangeDungeonEnemyGroups(unittest.TestCase):
                             continue
 
                         # Build the set of all 16-byte source tiles for this enemy
-                        src_data = _read_enemy_tiles(gw_vanilla.sprites, enemy)
+                        src_data = _read_all_enemy_tiles(gw_vanilla.sprites)[enemy]
                         num_src_tiles = len(src_data) // 16
                         src_tiles = set()
                         for t in range(num_src_tiles):
@@ -453,5 +456,29 @@ class TestChangeDungeonEnemyGroups(unittest.TestCase):
                             )
 
 
+
+class TestSpritePacking(unittest.TestCase):
+
+    def test_claim_slots_skips_reserved_slots_in_order(self):
+        slots, used = _claim_slots(_slot_mask([158, 160, 161]), 4)
+        self.assertEqual(slots, [159, 162, 163, 164])
+        self.assertEqual(used, _slot_mask([158, 159, 160, 161, 162, 163, 164]))
+
+    def test_claim_slots_only_opens_ow_regions(self):
+        slots, _ = _claim_slots(_OW_RESERVED_SLOTS_MASK, 40)
+        self.assertEqual(slots, list(range(202, 222)) + list(range(240, 256)))
+
+    def test_tile_cache_follows_bank_contents(self):
+        gw = _load_game_world()
+        tiles = _read_all_enemy_tiles(gw.sprites)
+        self.assertIs(_read_all_enemy_tiles(_load_game_world().sprites), tiles)
+
+        # Rope's tiles come from enemy_set_a.
+        gw.sprites.enemy_set_a[:] = bytes(len(gw.sprites.enemy_set_a))
+        rope = _read_all_enemy_tiles(gw.sprites)[Enemy.ROPE]
+        self.assertNotEqual(rope, tiles[Enemy.ROPE])
+        self.assertEqual(rope, bytes(len(tiles[Enemy.ROPE])))
+
+
 if __name__ == '__main__':
     unittest.main()
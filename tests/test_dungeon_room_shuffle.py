@@ -1,7 +1,26 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
 from pathlib import Path
 
+from flags.flags_generated import Flags
 from zora.data_model import RoomType, WallType
-from zora.dungeon.shuffle_dungeon_rooms import shuffle_dungeon_rooms, _is_level_connected
+from zora.dungeon import shuffle_dungeon_rooms as sdr
+from zora.dungeon.dungeon import randomize_dungeons
+from zora.dungeon.shuffle_dungeon_rooms import (
+    DungeonShuffleStats,
+    _check_adjacency_constraints,
+    _fix_horizontal_door_pairs,
+    _fix_vertical_door_pairs,
+    _horizontal_door_pairs,
+    _is_level_connected,
+    _level_room_nums,
+    _LevelSnapshot,
+    _shuffle_level,
+    _vertical_door_pairs,
+    shuffle_dungeon_rooms,
+)
+from zora.game_config import resolve_game_config
 from zora.parser import load_bin_files, parse_game_world
 from zora.rng import SeededRng
 
@@ -94,6 +113,68 @@ def test_all_levels_connected():
             )
 
 
+def test_shuffled_room_types_satisfy_adjacency_constraints():
+    """The content shuffle never gets stuck and only makes valid placements."""
+    for seed in range(50):
+        gw = _parse()
+        rng = SeededRng(seed)
+        for level in gw.levels:
+            assert _shuffle_level(level, rng), f"seed {seed} L{level.level_num}: shuffle got stuck"
+            room_nums = _level_room_nums(level)
+            for room in level.rooms:
+                assert _check_adjacency_constraints(room.room_type, room.room_num, room_nums), (
+                    f"seed {seed} L{level.level_num}: {room.room_type.name} at {room.room_num:#04x}"
+                )
+
+
+def test_connectivity_with_vertical_walls_assumed_open():
+    """assume_vertical_open ignores north/south walls but still honours east/west ones."""
+    gw = _parse()
+    level = gw.levels[0]
+    assert _is_level_connected(level)
+
+    for room in level.rooms:
+        room.walls.north = WallType.SOLID_WALL
+        room.walls.south = WallType.SOLID_WALL
+    assert not _is_level_connected(level)
+    assert _is_level_connected(level, assume_vertical_open=True)
+
+    for room in level.rooms:
+        room.walls.east = WallType.SOLID_WALL
+        room.walls.west = WallType.SOLID_WALL
+    assert not _is_level_connected(level, assume_vertical_open=True)
+
+
+def test_door_pair_tables_reused_across_retries():
+    """Pair tables built once per level give the same walls as building them
+    from the current walls on every retry, and keep locked pairs sealed."""
+    reused_world, fresh_world = _parse(), _parse()
+    for reused, fresh in zip(reused_world.levels, fresh_world.levels, strict=True):
+        reused_snap, fresh_snap = _LevelSnapshot(reused), _LevelSnapshot(fresh)
+        horizontal = _horizontal_door_pairs(reused, reused_snap.shufflable)
+        vertical = _vertical_door_pairs(reused, reused_snap.shufflable, True)
+        reused_rng, fresh_rng = SeededRng(reused.level_num), SeededRng(reused.level_num)
+        for _ in range(20):
+            reused_snap.restore(reused)
+            fresh_snap.restore(fresh)
+            assert _shuffle_level(reused, reused_rng, reused_snap)
+            assert _shuffle_level(fresh, fresh_rng, fresh_snap)
+            _fix_horizontal_door_pairs(reused, reused_rng, horizontal)
+            _fix_horizontal_door_pairs(fresh, fresh_rng)
+            _fix_vertical_door_pairs(reused, reused_rng, True, vertical)
+            _fix_vertical_door_pairs(fresh, fresh_rng, True)
+            assert reused == fresh, f"L{reused.level_num}: reused pair tables changed the walls"
+
+            room_nums = _level_room_nums(reused)
+            for room in reused.rooms:
+                if room.room_type != RoomType.ZELDA_ROOM:
+                    continue
+                if room.room_num - 1 in room_nums:
+                    assert room.walls.west == WallType.SOLID_WALL
+                if room.room_num + 1 in room_nums:
+                    assert room.walls.east == WallType.SOLID_WALL
+
+
 def test_staircase_refs_unchanged_without_shuffle():
     """Without shuffling, staircase refs should match vanilla positions."""
     gw = _parse()
@@ -114,3 +195,69 @@ def test_staircase_refs_unchanged_without_shuffle():
                     f"Vanilla L{level.level_num}: right_exit {sr.right_exit:#04x} "
                     f"not in stairway rooms (parser bug?)"
                 )
+
+
+def test_parallel_levels_connected():
+    """Per-level RNG substreams still produce fully connected levels."""
+    for seed in range(30):
+        gw = _parse()
+        assert shuffle_dungeon_rooms(gw, SeededRng(seed), parallel=True), f"shuffle failed for seed {seed}"
+        for level in gw.levels:
+            assert _is_level_connected(level), (
+                f"seed {seed} L{level.level_num}: level is not fully connected"
+            )
+
+
+def test_parallel_levels_same_with_and_without_process_pool():
+    """Running the level substreams in worker processes must not change the result."""
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        for seed in range(3):
+            in_process = _parse()
+            assert shuffle_dungeon_rooms(in_process, SeededRng(seed), parallel=True)
+            pooled = _parse()
+            levels, rooms = list(pooled.levels), [list(level.rooms) for level in pooled.levels]
+            assert shuffle_dungeon_rooms(pooled, SeededRng(seed), parallel=True, executor=pool)
+            assert pooled.levels == in_process.levels
+            # Shuffled in place: the caller's Level and Room objects are the live ones.
+            assert all(a is b for a, b in zip(pooled.levels, levels, strict=True))
+            assert all(a is b for level, before in zip(pooled.levels, rooms, strict=True)
+                       for a, b in zip(level.rooms, before, strict=True))
+
+
+def test_randomize_dungeons_pool_does_not_outlive_the_call():
+    """dungeon_shuffle_workers > 1 gives the in-process result and leaves no worker processes behind."""
+    config = replace(resolve_game_config(Flags(), SeededRng(0)), shuffle_dungeon_rooms=True)
+    in_process = _parse()
+    randomize_dungeons(in_process, replace(config, dungeon_shuffle_workers=1), SeededRng(5))
+    pooled = _parse()
+    randomize_dungeons(pooled, replace(config, dungeon_shuffle_workers=2), SeededRng(5))
+    assert pooled.levels == in_process.levels
+    assert multiprocessing.active_children() == []
+
+
+def test_retry_stats_account_for_every_attempt(monkeypatch):
+    """Each level shuffle records one outcome per attempt, in and out of process."""
+    for parallel in (False, True):
+        monkeypatch.setattr(sdr, "stats", DungeonShuffleStats())
+        for seed in range(5):
+            assert shuffle_dungeon_rooms(_parse(), SeededRng(seed), parallel=parallel)
+        assert sorted(sdr.stats.levels) == list(range(1, 10))
+        for level_num, s in sdr.stats.levels.items():
+            assert s.shuffles == 5 and s.exhausted == 0
+            assert sum(s.attempts.values()) == 5
+            rejected = s.stuck + s.early_aborts + s.disconnected
+            assert sum(n * count for n, count in s.attempts.items()) == rejected + 5, f"L{level_num}"
+
+
+def test_exhausted_retries_log_this_call_only(monkeypatch, caplog):
+    """The out-of-attempts log counts this call's attempts, not the process-wide totals."""
+    monkeypatch.setattr(sdr, "stats", DungeonShuffleStats())
+    sdr.stats.levels[1].stuck = 1000
+    monkeypatch.setattr(sdr, "_shuffle_level", lambda level, rng, snapshot: False)
+    level = _parse().levels[0]
+    with caplog.at_level("INFO", logger=sdr.__name__):
+        assert not sdr._shuffle_level_until_connected(level, [level], SeededRng(0), True)
+    retries = sdr._MAX_CONNECTIVITY_RETRIES
+    assert f"({retries} stuck, 0 aborted early, 0 disconnected)" in caplog.text
+    assert sdr.stats.levels[1].stuck == 1000 + retries
+    assert sdr.stats.levels[1].exhausted == 1
@@ -3,6 +3,8 @@ Entrance shuffle tests: verify shuffle_caves produces correct, glitch-free resul
 """
 from pathlib import Path
 
+import pytest
+
 from flags.flags_generated import CaveShuffleMode, Flags
 from zora.data_model import Destination, GameWorld, QuestVisibility
 from zora.entrance_randomizer import shuffle_caves
@@ -285,3 +287,101 @@ def test_full_cave_shuffle_produces_beatable_seeds():
         assert success, f"Seed {seed}: assumed fill failed with full cave shuffle"
         assert GameValidator(world, config.avoid_required_hard_combat).is_seed_valid(), \
             f"Seed {seed}: seed invalid after full cave shuffle"
+
+
+# ---------------------------------------------------------------------------
+# Requirement masks
+# ---------------------------------------------------------------------------
+
+def test_location_requirement_masks_combine_all_lists():
+    """A screen listed under several requirements carries every matching bit;
+    unlisted screens are absent (need no item)."""
+    from zora.entrance_randomizer import _build_location_requirement_masks, _need_no_item_to_enter
+    from zora.overworld_requirements import REQ_LADDER, REQ_LOST_HILLS_HINT, REQ_RAFT, REQ_RECORDER
+
+    masks = _build_location_requirement_masks(
+        raft_locations=[0x2F, 0x45],
+        recorder_locations=[0x42, 0x2F],
+        bracelet_locations=[],
+        lost_hills_screens=frozenset([0x0B]),
+    )
+    assert masks[0x2F] == REQ_RAFT | REQ_RECORDER
+    assert masks[0x18] == REQ_LADDER
+    assert masks[0x0B] == REQ_LOST_HILLS_HINT
+    assert _need_no_item_to_enter(0x77, masks)
+    assert not _need_no_item_to_enter(0x45, masks)
+
+
+def test_overworld_block_bracelet_exemption():
+    """A dungeon on a bracelet screen counts as a block, except on screens 0x20/0x21."""
+    from zora.entrance_randomizer import _build_location_requirement_masks, _overworld_block_exists
+
+    masks = _build_location_requirement_masks([], [], bracelet_locations=[0x20, 0x09])
+    assert not _overworld_block_exists([1], [0x20], masks)
+    assert _overworld_block_exists([1], [0x09], masks)
+    # Non-dungeon, non-letter caves never count.
+    assert not _overworld_block_exists([Destination.SHOP_1.value], [0x09], masks)
+
+
+# ---------------------------------------------------------------------------
+# Constructive shuffle
+# ---------------------------------------------------------------------------
+
+def test_constructive_shuffle_satisfies_placement_rules_first_time():
+    """With the maze screens and extra raft screens gated, every seed must
+    succeed in one call with a block, a safe wood sword cave and no dungeon
+    on its own entrance_room screen."""
+    from zora.entrance_randomizer import _build_location_requirement_masks, _overworld_block_exists
+
+    raft_locations = [0x2F, 0x45, 0x0E, 0x0F, 0x1F, 0x34, 0x44, 0x1E]
+    for seed in range(20):
+        world = _fresh_world()
+        lost_hills = frozenset(s.screen_num for s in world.overworld.screens
+                               if s.destination == Destination.LOST_HILLS_HINT)
+        result = shuffle_caves(
+            world, SeededRng(seed),
+            shuffle=True, include_bracelet_caves=False,
+            include_wood_sword_cave=True, shuffle_armos=False,
+            add_armos_item=False, mirror_ow=False,
+            just_dungeons=False, shuffle_dungeons=True, overworld_block_needed=True,
+            raft_locations=raft_locations, lost_hills_screens=lost_hills,
+        )
+        assert result is not None, f"Seed {seed}: constructive shuffle returned None"
+        masks = _build_location_requirement_masks(
+            raft_locations, [66, 6, 41, 43, 48, 58, 60, 88, 96, 110, 114], [], lost_hills,
+        )
+        assert result.wood_sword_screen not in masks, f"Seed {seed}: wood sword cave needs an item"
+        screens = [s for s in world.overworld.screens
+                   if s.destination != Destination.NONE and s.quest_visibility != QuestVisibility.SECOND_QUEST]
+        assert _overworld_block_exists([s.destination.value for s in screens],
+                                       [s.screen_num for s in screens], masks), f"Seed {seed}: no block"
+        for dungeon_num, screen_num in _dungeon_screens(world).items():
+            assert world.levels[dungeon_num - 1].entrance_room != screen_num
+
+
+def test_place_cave_types_block_from_fixed_slots_or_error():
+    """A block already formed by a fixed slot needs no placement; with no
+    block screen anywhere there is no arrangement and the error says why."""
+    from zora.entrance_randomizer import _place_cave_types
+    from zora.overworld_requirements import REQ_RAFT
+
+    types = [1, Destination.SHOP_1.value, Destination.SHOP_2.value, 2]
+    screens = [0x20, 0x21, 0x22, 0x30]
+    entrance_rooms = [0, 0x50, 0x51]  # index 0 unused
+    with pytest.raises(RuntimeError, match="no block cave can go on a free block screen"):
+        _place_cave_types(types, screens, [0, 1, 2], {}, entrance_rooms, True, SeededRng(1))
+
+    placed = _place_cave_types(types, screens, [0, 1, 2], {0x30: REQ_RAFT}, entrance_rooms, True, SeededRng(1))
+    assert placed[3] == 2
+    assert sorted(placed[:3]) == sorted(types[:3])
+
+
+def test_place_cave_types_reports_why_the_wood_sword_cave_has_no_screen():
+    from zora.entrance_randomizer import _place_cave_types
+    from zora.overworld_requirements import REQ_RAFT
+
+    types = [Destination.SHOP_1.value, Destination.WOOD_SWORD_CAVE.value]
+    screens = [0x20, 0x30]
+    masks = {0x20: REQ_RAFT, 0x30: REQ_RAFT}
+    with pytest.raises(RuntimeError, match="wood sword cave"):
+        _place_cave_types(types, screens, [0, 1], masks, [0], False, SeededRng(1))
@@ -0,0 +1,57 @@
+"""
+Feasibility gate tests: doomed entrance layouts are rejected, everything else passes.
+"""
+from pathlib import Path
+
+import pytest
+
+from flags.flags_generated import Flags, Tristate
+from zora import feasibility_check
+from zora.data_model import Destination, EntranceType, GameWorld
+from zora.feasibility_check import check_entrance_feasibility
+from zora.game_config import resolve_game_config
+from zora.parser import load_bin_files, parse_game_world
+from zora.rng import SeededRng
+
+TEST_DATA = Path(__file__).parent.parent / "rom_data"
+
+
+def _fresh_world() -> GameWorld:
+    return parse_game_world(load_bin_files(TEST_DATA))
+
+
+def _close_cave(world: GameWorld, dest: Destination) -> None:
+    """Put the screen holding dest behind a bombable wall."""
+    for screen in world.overworld.screens:
+        if screen.destination == dest:
+            screen.entrance_type = EntranceType.BOMB
+
+
+def test_vanilla_layout_passes():
+    world = _fresh_world()
+    checked = feasibility_check.stats.checked
+    check_entrance_feasibility(world, resolve_game_config(Flags(), SeededRng(0)), SeededRng(0))
+    assert feasibility_check.stats.checked == checked + 1
+
+
+def test_no_open_sword_or_wand_cave_is_rejected():
+    world = _fresh_world()
+    _close_cave(world, Destination.WOOD_SWORD_CAVE)
+    rejected = feasibility_check.stats.rejected
+    with pytest.raises(RuntimeError, match="no sword or wand"):
+        check_entrance_feasibility(world, resolve_game_config(Flags(), SeededRng(0)), SeededRng(0))
+    assert feasibility_check.stats.rejected == rejected + 1
+
+
+def test_open_letter_cave_passes_only_if_it_can_hold_a_sword_or_wand():
+    world = _fresh_world()
+    _close_cave(world, Destination.WOOD_SWORD_CAVE)
+
+    # Unshuffled, the letter cave holds the letter: doomed.
+    with pytest.raises(RuntimeError):
+        check_entrance_feasibility(world, resolve_game_config(Flags(), SeededRng(0)), SeededRng(0))
+
+    # Shuffled, assumed fill may put a sword or wand there.
+    config = resolve_game_config(Flags(shuffle_letter=Tristate.ON), SeededRng(0))
+    check_entrance_feasibility(world, config, SeededRng(0))
+
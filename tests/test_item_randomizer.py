@@ -2,18 +2,27 @@
 Randomizer tests: verify assumed fill produces valid, beatable seeds.
 """
 import time
+from dataclasses import replace
 from pathlib import Path
 
 from flags.flags_generated import Flags, Tristate
 from flags.flags_generated import Item as FlagItem
 from zora.data_model import Destination, GameWorld, Item
 from zora.game_config import GameConfig, resolve_game_config
-from zora.game_validator import GameValidator
+from zora.game_validator import CaveLocation, GameValidator
 from zora.item_randomizer import (
+    Constraints,
+    FillStats,
+    ShuffleSurface,
     _collect_item_pool,
     assumed_fill,
+    build_validity_matrix,
     collect_all_placed_items,
     collect_item_locations,
+    compute_self_blocking_locations,
+    forward_fill,
+    is_item_valid_for_location,
+    randomize_items,
 )
 from zora.parser import load_bin_files, parse_game_world
 from zora.rng import SeededRng
@@ -128,6 +137,124 @@ def test_shop_shuffle_pool_matches_location_count():
     )
 
 
+def test_shuffle_surface_reads_writes_and_restores_locations():
+    """Surface accessors hit the world's own objects; restore undoes a fill."""
+    flags = Flags(shuffle_major_shop_items=Tristate.ON, shuffle_letter=Tristate.ON)
+    config = _config(flags)
+    gw = _fresh_world()
+    surface = ShuffleSurface(gw, config)
+    assert len(surface.pool) == len(surface.locations)
+    before = collect_all_placed_items(gw)
+    snapshot = surface.snapshot()
+    assert sorted(snapshot) == sorted(surface.pool)
+
+    letter = next(loc for loc in surface.locations
+                  if isinstance(loc, CaveLocation) and loc.destination == Destination.LETTER_CAVE)
+    surface.set(letter, Item.RAFT)
+    assert surface.get(letter) == Item.RAFT
+    assert Item.RAFT in collect_all_placed_items(gw)
+
+    assert assumed_fill(gw, config, SeededRng(3), surface=surface)
+    surface.restore(snapshot)
+    assert collect_all_placed_items(gw) == before
+
+
+def test_validity_matrix_matches_per_pair_checks():
+    """Each matrix bit agrees with is_item_valid_for_location and self-blocking."""
+    flags = Flags(shuffle_major_shop_items=Tristate.ON)
+    config = _config(flags)
+    gw = _fresh_world()
+    pool = _collect_item_pool(gw, config)
+    locations = collect_item_locations(gw, config)
+    assert len(set(locations)) == len(locations)
+    constraints = Constraints.from_config(config)
+    self_blocking = compute_self_blocking_locations(gw, locations)
+
+    matrix = build_validity_matrix(pool, locations, constraints, self_blocking)
+    assert set(matrix) == set(pool)
+    for item, row in matrix.items():
+        for i, loc in enumerate(locations):
+            expected = (is_item_valid_for_location(item, loc, constraints)
+                        and loc not in self_blocking.get(item, set()))
+            assert bool(row >> i & 1) == expected, (item, loc)
+
+
+# Item-placement flags from the kitchen-sink set; about a quarter of seeds hit
+# a dead end on a fresh world without backtracking.
+_TIGHT_FILL_FLAGS = Flags(
+    shuffle_dungeon_items=Tristate.ON,
+    shuffle_dungeon_hearts=Tristate.ON,
+    shuffle_within_dungeons=Tristate.ON,
+    allow_triforces_in_stairways=Tristate.ON,
+    add_l4_sword=True,
+    shuffle_wood_sword=Tristate.ON,
+    shuffle_magical_sword=Tristate.ON,
+    shuffle_letter=Tristate.ON,
+    shuffle_major_shop_items=Tristate.ON,
+    shuffle_blue_potion=Tristate.ON,
+    add_extra_candles=Tristate.ON,
+    progressive_items=Tristate.ON,
+    allow_important_in_l9=Tristate.ON,
+    force_rr_to_l9=Tristate.ON,
+    force_sa_to_l9=Tristate.ON,
+    white_sword_item=FlagItem.RANDOM,
+    armos_item=FlagItem.RANDOM,
+    coast_item=FlagItem.RANDOM,
+    avoid_required_hard_combat=Tristate.ON,
+)
+
+
+def test_backtracking_budget_does_not_change_fills_without_dead_ends():
+    """A fill that never gets stuck places the same items with or without a budget."""
+    config = _config(Flags(), seed=5)
+    gw1 = _fresh_world()
+    assert assumed_fill(gw1, config, SeededRng(5))
+
+    gw2 = _fresh_world()
+    stats = FillStats()
+    assert assumed_fill(gw2, config, SeededRng(5), max_backtracks=20, stats=stats)
+    assert stats == FillStats()
+    assert collect_all_placed_items(gw1) == collect_all_placed_items(gw2)
+
+
+def test_backtracking_recovers_from_dead_end():
+    """A seed that dead-ends without backtracking completes with a budget."""
+    seed = 16
+    config = _config(_TIGHT_FILL_FLAGS, seed)
+    assert not assumed_fill(_fresh_world(), config, SeededRng(seed))
+
+    gw = _fresh_world()
+    stats = FillStats()
+    assert assumed_fill(gw, config, SeededRng(seed), max_backtracks=20, stats=stats)
+    assert 0 < stats.backtracks <= 20
+    assert stats.max_backtrack_depth >= 1
+    validator = GameValidator(gw, config.avoid_required_hard_combat, progressive_items=config.progressive_items)
+    assert validator.is_seed_valid()
+
+
+def test_forward_fill_produces_valid_seeds():
+    """Forward fill places the same items as assumed fill and the seed is beatable."""
+    flags = Flags(shuffle_major_shop_items=Tristate.ON)
+    for seed in range(3):
+        config = _config(flags, seed)
+        gw = _fresh_world()
+        expected = sorted(ShuffleSurface(gw, config).pool, key=lambda i: i.name)
+        assert forward_fill(gw, config, SeededRng(seed)), f"Seed {seed} failed with forward fill"
+        surface = ShuffleSurface(gw, config)
+        assert sorted(map(surface.get, surface.locations), key=lambda i: i.name) == expected
+        assert GameValidator(gw, config.avoid_required_hard_combat).is_seed_valid()
+
+
+def test_randomize_items_uses_configured_fill_engine():
+    config = replace(_config(Flags(), seed=3), fill_engine="forward")
+    gw1 = _fresh_world()
+    randomize_items(gw1, config, SeededRng(3))
+
+    gw2 = _fresh_world()
+    assert forward_fill(gw2, config, SeededRng(3))
+    assert collect_all_placed_items(gw1) == collect_all_placed_items(gw2)
+
+
 def test_shop_shuffle_produces_beatable_seeds():
     """Seeds with shop shuffle enabled must be beatable."""
     flags = Flags(shuffle_major_shop_items=Tristate.ON)
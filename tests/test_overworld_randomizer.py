@@ -240,8 +240,9 @@ def test_extra_raft_blocks_screen_unreachable_without_raft():
     screen = next(s for s in world.overworld.screens if s.screen_num == sample_screen_num)
 
     validator = GameValidator(world, avoid_required_hard_combat=False)
+    inventory = validator.new_state().inventory
     # No items in inventory — raft not present
-    assert not validator._can_access_screen(screen), (
+    assert not validator._can_access_screen(inventory, screen), (
         f"Screen {sample_screen_num:#04x} should be inaccessible without raft"
     )
 
@@ -256,8 +257,9 @@ def test_extra_raft_blocks_screen_reachable_with_raft():
     screen = next(s for s in world.overworld.screens if s.screen_num == sample_screen_num)
 
     validator = GameValidator(world, avoid_required_hard_combat=False)
-    validator.inventory.add_item(Item.RAFT)
-    assert validator._can_access_screen(screen), (
+    inventory = validator.new_state().inventory
+    inventory.add_item(Item.RAFT)
+    assert validator._can_access_screen(inventory, screen), (
         f"Screen {sample_screen_num:#04x} should be accessible with raft"
     )
 
@@ -273,7 +275,8 @@ def test_extra_pb_blocks_screen_unreachable_without_bracelet():
     screen = next(s for s in world.overworld.screens if s.screen_num == sample_screen_num)
 
     validator = GameValidator(world, avoid_required_hard_combat=False)
-    assert not validator._can_access_screen(screen), (
+    inventory = validator.new_state().inventory
+    assert not validator._can_access_screen(inventory, screen), (
         f"Screen {sample_screen_num:#04x} should be inaccessible without power bracelet"
     )
 
@@ -289,9 +292,10 @@ def test_extra_pb_blocks_screen_unreachable_with_bracelet_but_no_sword():
     screen = next(s for s in world.overworld.screens if s.screen_num == sample_screen_num)
 
     validator = GameValidator(world, avoid_required_hard_combat=False)
-    validator.inventory.add_item(Item.POWER_BRACELET)
+    inventory = validator.new_state().inventory
+    inventory.add_item(Item.POWER_BRACELET)
     # No sword — should still be blocked
-    assert not validator._can_access_screen(screen), (
+    assert not validator._can_access_screen(inventory, screen), (
         f"Screen {sample_screen_num:#04x} should require a sword in addition to power bracelet"
     )
 
@@ -306,9 +310,10 @@ def test_extra_pb_blocks_screen_reachable_with_bracelet_and_sword():
     screen = next(s for s in world.overworld.screens if s.screen_num == sample_screen_num)
 
     validator = GameValidator(world, avoid_required_hard_combat=False)
-    validator.inventory.add_item(Item.POWER_BRACELET)
-    validator.inventory.add_item(Item.WOOD_SWORD)
-    assert validator._can_access_screen(screen), (
+    inventory = validator.new_state().inventory
+    inventory.add_item(Item.POWER_BRACELET)
+    inventory.add_item(Item.WOOD_SWORD)
+    assert validator._can_access_screen(inventory, screen), (
         f"Screen {sample_screen_num:#04x} should be accessible with bracelet + sword"
     )
 
@@ -436,3 +441,27 @@ def test_extra_raft_blocks_with_dungeon_shuffle_produces_beatable_seed():
     assert GameValidator(world, config.avoid_required_hard_combat).is_seed_valid(), (
         "Seed invalid after assumed_fill with extra_raft_blocks + dungeon shuffle"
     )
+
+
+def test_inventory_requirement_mask_matches_entrance_types():
+    """Every entrance type is satisfied exactly when the old per-type rules say so."""
+    from zora.overworld_requirements import (
+        ENTRANCE_TYPE_REQUIREMENTS,
+        inventory_requirement_mask,
+        is_satisfied,
+    )
+
+    world = _fresh_world()
+    validator = GameValidator(world, avoid_required_hard_combat=False)
+    inventory = validator.new_state().inventory
+    empty = inventory_requirement_mask(inventory)
+    assert is_satisfied(ENTRANCE_TYPE_REQUIREMENTS[EntranceType.OPEN], empty)
+    assert not is_satisfied(ENTRANCE_TYPE_REQUIREMENTS[EntranceType.BOMB], empty)
+    assert not is_satisfied(ENTRANCE_TYPE_REQUIREMENTS[EntranceType.NONE], empty)
+
+    inventory.add_item(Item.LADDER)
+    inventory.add_item(Item.WAND)
+    have = inventory_requirement_mask(inventory)
+    assert is_satisfied(ENTRANCE_TYPE_REQUIREMENTS[EntranceType.LADDER_AND_BOMB], have)
+    assert not is_satisfied(ENTRANCE_TYPE_REQUIREMENTS[EntranceType.RAFT_AND_BOMB], have)
+    assert not is_satisfied(ENTRANCE_TYPE_REQUIREMENTS[EntranceType.NONE], have)
@@ -0,0 +1,62 @@
+"""
+Tests for the compiled enemy x room-type safety matrix.
+
+Run with:
+    python3 -m pytest tests/test_safety_checks.py -v
+"""
+
+import unittest
+
+from zora.data_model import Enemy, RoomType
+from zora.enemy.safety_checks import (
+    UNSAFE_ROOM_TYPES,
+    is_safe_for_room,
+    safe_enemies,
+    safe_enemy_mask,
+)
+
+_ZELDA_UNSAFE_MUST_BEAT_GANNON = {RoomType.NARROW_STAIR_ROOM, RoomType.SPIRAL_STAIR_ROOM}
+
+
+def _is_safe_by_rules(enemy, room_type, must_beat_gannon, has_push_block):
+    """The placement rules as documented, straight from the unsafe-room sets."""
+    if room_type in UNSAFE_ROOM_TYPES.get(enemy, frozenset()):
+        return False
+    if must_beat_gannon and enemy == Enemy.THE_KIDNAPPED and room_type in _ZELDA_UNSAFE_MUST_BEAT_GANNON:
+        return False
+    if has_push_block and enemy == Enemy.GLEEOK_4:
+        return False
+    return True
+
+
+class TestSafetyMatrix(unittest.TestCase):
+
+    def test_matrix_matches_rules_for_every_enemy_room_and_flag(self):
+        for must_beat_gannon in (False, True):
+            for has_push_block in (False, True):
+                for room_type in RoomType:
+                    for enemy in Enemy:
+                        self.assertEqual(
+                            is_safe_for_room(enemy, room_type, must_beat_gannon, has_push_block),
+                            _is_safe_by_rules(enemy, room_type, must_beat_gannon, has_push_block),
+                            f"{enemy.name} in {room_type.name} "
+                            f"(must_beat_gannon={must_beat_gannon}, push block={has_push_block})",
+                        )
+
+    def test_safe_enemies_keeps_order_and_duplicates(self):
+        pool = [Enemy.STALFOS, Enemy.RED_LANMOLA, Enemy.STALFOS, Enemy.GLEEOK_4, Enemy.ROPE]
+        self.assertEqual(
+            safe_enemies(pool, RoomType.MAZE_ROOM, has_push_block=True),
+            [Enemy.STALFOS, Enemy.STALFOS, Enemy.ROPE],
+        )
+        self.assertEqual(safe_enemies(pool, RoomType.PLAIN_ROOM), pool)
+
+    def test_safe_enemy_mask_bits_are_enemy_values(self):
+        mask = safe_enemy_mask(RoomType.SPIRAL_STAIR_ROOM, must_beat_gannon=True)
+        self.assertFalse(mask >> Enemy.THE_KIDNAPPED & 1)
+        self.assertFalse(mask >> Enemy.CORNER_TRAPS & 1)
+        self.assertTrue(mask >> Enemy.STALFOS & 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Tests for sprite bank decoding, layout and diffing in show_sprite_banks.
+
+Run with:
+    python3 -m pytest tests/test_show_sprite_banks.py -v
+"""
+
+import random
+import unittest
+
+from zora.enemy.show_sprite_banks import (
+    GRID_INDEX,
+    count_metasprites,
+    decode_metasprite,
+    decode_tile,
+    diff_counts,
+    sheet_pixels,
+)
+
+_RNG = random.Random(3)
+# 9 metasprites, the last one partial, like a dungeon enemy bank.
+_BANK = bytes(_RNG.randrange(256) for _ in range(544))
+
+
+def _pixel(data, tile, x, y):
+    """One pixel straight from the NES 2bpp format: bitplane 0 in bytes 0-7, plane 1 in 8-15."""
+    lo = data[tile * 16 + y] >> (7 - x) & 1
+    hi = data[tile * 16 + y + 8] >> (7 - x) & 1
+    return hi << 1 | lo
+
+
+class TestDecode(unittest.TestCase):
+
+    def test_decode_tile_matches_bitplanes(self):
+        for tile in range(len(_BANK) // 16):
+            expected = [[_pixel(_BANK, tile, x, y) for x in range(8)] for y in range(8)]
+            self.assertEqual(decode_tile(_BANK, tile * 16), expected)
+
+    def test_metasprite_quadrants_and_missing_tiles(self):
+        sprite = decode_metasprite(_BANK, 4)
+        self.assertEqual([row[:8] for row in sprite[:8]], decode_tile(_BANK, 4 * 16))
+        self.assertEqual([row[:8] for row in sprite[8:]], decode_tile(_BANK, 5 * 16))
+        self.assertEqual([row[8:] for row in sprite[:8]], decode_tile(_BANK, 6 * 16))
+        self.assertEqual([row[8:] for row in sprite[8:]], decode_tile(_BANK, 7 * 16))
+        # The bank ends after tile 33: the last metasprite's right column is blank.
+        last = decode_metasprite(_BANK, 32)
+        self.assertEqual([row[8:] for row in last], [[0] * 8] * 16)
+
+
+class TestSheetAndDiff(unittest.TestCase):
+
+    def test_sheet_pixels_places_metasprites_in_grid(self):
+        cols = 4
+        w, h, pixels = sheet_pixels(_BANK, cols)
+        self.assertEqual((w, h), (4 * 16 + 5, 3 * 16 + 4))
+        self.assertEqual(len(pixels), w * h)
+        for mi in range(count_metasprites(_BANK)):
+            mr, mc = divmod(mi, cols)
+            x0, y0 = 1 + mc * 17, 1 + mr * 17
+            cell = [list(pixels[(y0 + y) * w + x0:(y0 + y) * w + x0 + 16]) for y in range(16)]
+            self.assertEqual(cell, decode_metasprite(_BANK, mi * 4))
+        # Gaps and the empty cells after the last metasprite are grid.
+        self.assertEqual(set(pixels[:w]), {GRID_INDEX})
+        self.assertEqual(set(pixels[(h - 17) * w + 1 + 17:(h - 17) * w + w]), {GRID_INDEX})
+
+    def test_diff_counts(self):
+        after = bytearray(_BANK)
+        self.assertEqual(diff_counts(_BANK, after), (0, 9, 0))
+        for offset in (0, 1, 63, 64 * 8 + 5):
+            after[offset] ^= 0x80
+        after[200] ^= 0x01
+        self.assertEqual(diff_counts(_BANK, after), (3, 9, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,7 @@ Run with:
 """
 
 import copy
+import itertools
 import signal
 import sys
 import unittest
@@ -675,5 +676,54 @@ class TestShuffleMonsters(unittest.TestCase):
                                     )
 
 
+# Matching fixture: rooms allow everything except room 0 no Lanmola, room 1
+# only Stalfos or Rope, room 3 no Zol.
+_MATCH_ENEMIES = [Enemy.STALFOS, Enemy.RED_LANMOLA, Enemy.ROPE, Enemy.ZOL, Enemy.RED_LANMOLA]
+_MATCH_ALL = sum(1 << e for e in set(_MATCH_ENEMIES))
+_MATCH_MASKS = [
+    _MATCH_ALL & ~(1 << Enemy.RED_LANMOLA),
+    (1 << Enemy.STALFOS) | (1 << Enemy.ROPE),
+    _MATCH_ALL,
+    _MATCH_ALL & ~(1 << Enemy.ZOL),
+    _MATCH_ALL,
+]
+
+
+class TestMatchingShuffle(unittest.TestCase):
+
+    def _valid_assignments(self):
+        return {
+            p for p in itertools.permutations(range(len(_MATCH_ENEMIES)))
+            if all(m >> _MATCH_ENEMIES[spec] & 1 for m, spec in zip(_MATCH_MASKS, p, strict=True))
+        }
+
+    def test_sample_matching_draws_only_and_every_valid_assignment(self):
+        from zora.enemy.shuffle_monsters import _sample_matching
+
+        valid = self._valid_assignments()
+        rng = SeededRng(3)
+        seen = set()
+        for _ in range(2000):
+            matching = _sample_matching(_MATCH_ENEMIES, _MATCH_MASKS, rng)
+            assert matching is not None
+            seen.add(tuple(matching))
+        self.assertEqual(seen, valid)
+
+    def test_sample_matching_reports_infeasible_placement(self):
+        from zora.enemy.shuffle_monsters import _sample_matching
+
+        # Both Lanmolas and the Zol only fit rooms 2 and 4.
+        crowded = (1 << Enemy.RED_LANMOLA) | (1 << Enemy.ZOL)
+        masks = [_MATCH_ALL & ~crowded, _MATCH_MASKS[1], crowded, _MATCH_ALL & ~crowded, crowded]
+        self.assertIsNone(_sample_matching(_MATCH_ENEMIES, masks, SeededRng(1)))
+
+    def test_legacy_sampling_still_shuffles(self):
+        for seed in range(5):
+            gw = _load_game_world()
+            self.assertTrue(_shuffle_monsters_raw(
+                gw, SeededRng(seed), shuffle_gannon=True, must_beat_gannon=True, legacy_sampling=True,
+            ))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -9,9 +9,12 @@ Run with:
     python3 -m pytest tests/test_shuffle_monsters_between_levels.py -v
 """
 
+import itertools
 import signal
 import sys
 import unittest
+from collections import Counter
+from collections.abc import Sequence
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -33,6 +36,7 @@ from zora.enemy.shuffle_monsters_between_levels import (
     _BOSS_ENEMIES_IN_ENEMY_SPRITE_SETS,
     LEVEL_SPRITE_SET,
     _EXCLUDED_FROM_ENEMY_SHUFFLING,
+    _sample_balanced_level,
 )
 
 BIN_DIR = Path(__file__).resolve().parents[1] / 'rom_data'
@@ -429,6 +433,40 @@ class TestShuffleMonstersBetweenLevels(unittest.TestCase):
                          "RNG state diverged after identical shuffles")
 
 
+class TestBalancedSampling(unittest.TestCase):
+    """_sample_balanced_level draws as if rerolling the level until balanced."""
+
+    @staticmethod
+    def _balanced(picks: Sequence[Enemy | None]) -> bool:
+        return not (Enemy.RED_BUBBLE in picks and Enemy.BLUE_BUBBLE not in picks)
+
+    def test_matches_rerolling_until_balanced(self):
+        red, blue = Enemy.RED_BUBBLE, Enemy.BLUE_BUBBLE
+        candidates = [[red, Enemy.STALFOS], [red, blue, Enemy.GEL_1], [Enemy.ROPE], [red, Enemy.GEL_1]]
+        expected = [p for p in itertools.product(*candidates) if self._balanced(p)]
+
+        rng = SeededRng(7)
+        samples = 30_000
+        counts = Counter(tuple(_sample_balanced_level(candidates, rng)) for _ in range(samples))
+        self.assertLessEqual(set(counts), set(expected))
+        distance = 0.5 * sum(abs(counts[p] / samples - 1 / len(expected)) for p in expected)
+        self.assertLess(distance, 0.03)
+
+    def test_no_red_bubble_when_no_room_can_get_blue(self):
+        candidates = [[Enemy.RED_BUBBLE, Enemy.STALFOS]] * 6 + [[], [Enemy.GEL_1]]
+        rng = SeededRng(3)
+        for _ in range(200):
+            picks = _sample_balanced_level(candidates, rng)
+            self.assertNotIn(Enemy.RED_BUBBLE, picks)
+            self.assertIsNone(picks[6])
+
+    def test_legacy_sampling_reproducible(self):
+        gw1, gw2 = _load_game_world(), _load_game_world()
+        shuffle_monsters_between_levels(gw1, SeededRng(11), legacy_sampling=True)
+        shuffle_monsters_between_levels(gw2, SeededRng(11), legacy_sampling=True)
+        self.assertEqual(gw1.levels, gw2.levels)
+
+
 class TestLevelSpriteSet(unittest.TestCase):
     """Verify LEVEL_SPRITE_SET covers all 9 dungeon levels."""
 
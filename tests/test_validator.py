@@ -19,7 +19,7 @@ from zora.data_model import (
     WallSet,
     WallType,
 )
-from zora.game_validator import DungeonLocation, GameValidator, Location
+from zora.game_validator import CaveLocation, DungeonLocation, GameValidator, Location, LocationRegistry
 from zora.inventory import Inventory
 from zora.parser import load_bin_files, parse_game_world
 
@@ -92,6 +92,34 @@ def test_get_reachable_locations_with_full_assumed_inventory():
     assert level_nums == {1, 2, 3, 4, 5, 6, 7, 8, 9}
 
 
+def test_location_registry_ids_and_masks():
+    """Ids are dense and stable, instances are interned, and masks round-trip."""
+    pool: list[Location] = [DungeonLocation(3, 0x0F), CaveLocation(Destination.LETTER_CAVE, 0),
+                            DungeonLocation(1, 0x22)]
+    registry = LocationRegistry(pool)
+    assert [registry.id_of(loc) for loc in pool] == [0, 1, 2]
+    assert registry.dungeon_id(1, 0x22) == 2
+    assert registry.cave_id(Destination.LETTER_CAVE, 0) == 1
+
+    equal_copy = DungeonLocation(3, 0x0F)
+    assert registry.location(registry.id_of(equal_copy)) is pool[0]
+
+    assert registry.dungeon_id(9, 0x40) == 3  # new locations get the next id
+    assert len(registry) == 4
+    mask = registry.mask([pool[2], pool[0]])
+    assert mask == 0b101
+    assert registry.locations(mask) == [pool[0], pool[2]]
+
+
+def test_reachable_mask_matches_location_list():
+    bins = load_bin_files(TEST_DATA)
+    gw = parse_game_world(bins)
+    v = GameValidator(gw, False)
+    mask = v.get_reachable_mask()
+    assert set(v.locations.locations(mask)) == set(v.get_reachable_locations())
+    assert mask.bit_count() == len(v.get_reachable_locations())
+
+
 def _make_blue_wizzrobe_room() -> Room:
     """Build a minimal room with a blue wizzrobe enemy."""
     walls = WallSet(WallType.OPEN_DOOR, WallType.OPEN_DOOR, WallType.OPEN_DOOR, WallType.OPEN_DOOR)
@@ -119,18 +147,19 @@ def test_avoid_hard_combat_blocks_wizzrobe_without_equipment():
     gw = parse_game_world(bins)
     v = GameValidator(gw, avoid_required_hard_combat=True)
     room = _make_blue_wizzrobe_room()
+    inventory = v.new_state().inventory
 
     # With only wood sword and no ring: cannot defeat
-    v.inventory.items.add(Item.WOOD_SWORD)
-    assert not v._can_defeat_enemies(room)
+    inventory.items.add(Item.WOOD_SWORD)
+    assert not v._can_defeat_enemies(inventory, room)
 
     # With white sword but no ring: still cannot defeat
-    v.inventory.items.add(Item.WHITE_SWORD)
-    assert not v._can_defeat_enemies(room)
+    inventory.items.add(Item.WHITE_SWORD)
+    assert not v._can_defeat_enemies(inventory, room)
 
     # With white sword and blue ring: can defeat
-    v.inventory.items.add(Item.BLUE_RING)
-    assert v._can_defeat_enemies(room)
+    inventory.items.add(Item.BLUE_RING)
+    assert v._can_defeat_enemies(inventory, room)
 
 
 def test_avoid_hard_combat_off_allows_wizzrobe_with_sword():
@@ -139,10 +168,11 @@ def test_avoid_hard_combat_off_allows_wizzrobe_with_sword():
     gw = parse_game_world(bins)
     v = GameValidator(gw, avoid_required_hard_combat=False)
     room = _make_blue_wizzrobe_room()
+    inventory = v.new_state().inventory
 
     # Wood sword alone is sufficient when flag is off
-    v.inventory.items.add(Item.WOOD_SWORD)
-    assert v._can_defeat_enemies(room)
+    inventory.items.add(Item.WOOD_SWORD)
+    assert v._can_defeat_enemies(inventory, room)
 
 
 # ---------------------------------------------------------------------------
@@ -213,7 +243,7 @@ def test_non_progressive_inventory_no_upgrades():
 # ---------------------------------------------------------------------------
 
 from zora.game_config import GameConfig  # noqa: E402
-from zora.item_randomizer import _check_progressive_placement_invariants  # noqa: E402
+from zora.item_randomizer import ShuffleSurface, _check_progressive_placement_invariants  # noqa: E402
 
 _DEFAULT_CONFIG = GameConfig()
 
@@ -225,7 +255,8 @@ def test_progressive_placement_rejects_higher_tier_items():
     room = gw.levels[0].rooms[0]
     room.item = Item.WHITE_SWORD
     loc = DungeonLocation(level_num=1, room_num=room.room_num)
-    assert not _check_progressive_placement_invariants(gw, [loc], _DEFAULT_CONFIG), \
+    surface = ShuffleSurface(gw, _DEFAULT_CONFIG)
+    assert not _check_progressive_placement_invariants(surface, [loc], _DEFAULT_CONFIG), \
         "WHITE_SWORD in shuffled location should fail invariant"
 
     bins2 = load_bin_files(TEST_DATA)
@@ -233,7 +264,8 @@ def test_progressive_placement_rejects_higher_tier_items():
     room2 = gw2.levels[0].rooms[0]
     room2.item = Item.RED_RING
     loc2 = DungeonLocation(level_num=1, room_num=room2.room_num)
-    assert not _check_progressive_placement_invariants(gw2, [loc2], _DEFAULT_CONFIG), \
+    surface = ShuffleSurface(gw2, _DEFAULT_CONFIG)
+    assert not _check_progressive_placement_invariants(surface, [loc2], _DEFAULT_CONFIG), \
         "RED_RING in shuffled location should fail invariant"
 
 
@@ -247,7 +279,8 @@ def test_progressive_placement_rejects_too_many_base_items():
         room = gw.levels[0].rooms[i]
         room.item = Item.WOOD_SWORD
         locs.append(DungeonLocation(level_num=1, room_num=room.room_num))
-    assert not _check_progressive_placement_invariants(gw, cast(list[Location], locs), _DEFAULT_CONFIG), \
+    surface = ShuffleSurface(gw, _DEFAULT_CONFIG)
+    assert not _check_progressive_placement_invariants(surface, cast(list[Location], locs), _DEFAULT_CONFIG), \
         "4x WOOD_SWORD in shuffled locations should exceed max-count invariant"
 
 
@@ -262,7 +295,8 @@ def test_progressive_placement_passes_for_valid_pool():
     rooms[3].item = Item.BLUE_RING
     rooms[4].item = Item.BLUE_RING
     locs = [DungeonLocation(level_num=1, room_num=rooms[i].room_num) for i in range(5)]
-    assert _check_progressive_placement_invariants(gw, cast(list[Location], locs), _DEFAULT_CONFIG), \
+    surface = ShuffleSurface(gw, _DEFAULT_CONFIG)
+    assert _check_progressive_placement_invariants(surface, cast(list[Location], locs), _DEFAULT_CONFIG), \
         "3x WOOD_SWORD + 2x BLUE_RING should pass invariant"
 
 
@@ -276,5 +310,68 @@ def test_progressive_placement_only_checks_shuffled_locations():
     room1 = gw.levels[0].rooms[1]
     room1.item = Item.WOOD_SWORD
     loc = DungeonLocation(level_num=1, room_num=room1.room_num)
-    assert _check_progressive_placement_invariants(gw, [loc], _DEFAULT_CONFIG), \
+    surface = ShuffleSurface(gw, _DEFAULT_CONFIG)
+    assert _check_progressive_placement_invariants(surface, [loc], _DEFAULT_CONFIG), \
         "WHITE_SWORD outside the shuffled pool should not trigger the invariant"
+
+
+def test_room_tables_refresh_after_invalidate():
+    """Compiled room tables are reused until invalidate_room_tables() is called."""
+    bins = load_bin_files(TEST_DATA)
+    gw = parse_game_world(bins)
+    v = GameValidator(gw, avoid_required_hard_combat=False)
+    room = gw.levels[0].rooms[0]
+    room.room_action = RoomAction.NOTHING_OPENS_SHUTTERS
+    assert not v._get_room_table(1, room).kill_gates_item
+
+    room.room_action = RoomAction.KILLING_ENEMIES_OPENS_SHUTTERS_AND_DROPS_ITEM
+    assert not v._get_room_table(1, room).kill_gates_item
+
+    v.invalidate_room_tables()
+    assert v._get_room_table(1, room).kill_gates_item
+
+
+def test_concurrent_queries_share_one_validator():
+    """Queries from a thread pool on one validator match the same queries run serially."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    bins = load_bin_files(TEST_DATA)
+    gw = parse_game_world(bins)
+    v = GameValidator(gw, False)
+
+    assumed: list[Inventory | None] = [None]
+    for item in (Item.RAFT, Item.LADDER, Item.RECORDER, Item.BOW):
+        inv = Inventory()
+        inv.items.add(item)
+        assumed.append(inv)
+
+    serial = [sorted(map(repr, v.get_reachable_locations(a))) for a in assumed]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        threaded = list(pool.map(lambda a: sorted(map(repr, v.get_reachable_locations(a))), assumed))
+    assert threaded == serial
+    assert v.traverse().inventory is not v.traverse().inventory
+
+
+def test_reachable_without_each_matches_individual_queries():
+    """The bulk remove-one query agrees with one traversal per removed item."""
+    from zora.game_validator import build_assumed_inventory
+
+    bins = load_bin_files(TEST_DATA)
+    gw = parse_game_world(bins)
+    for level in gw.levels:
+        for room in level.rooms:
+            if room.item in (Item.RECORDER, Item.LADDER, Item.RAFT, Item.TRIFORCE):
+                room.item = Item.NOTHING
+    v = GameValidator(gw, False)
+
+    pool = [Item.RECORDER, Item.LADDER, Item.RAFT, Item.BOW, Item.HEART_CONTAINER,
+            Item.HEART_CONTAINER, Item.FIVE_RUPEES, Item.TRIFORCE, Item.TRIFORCE]
+    reachable, without = v.get_reachable_locations_without_each(pool)
+
+    assert set(reachable) == set(v.get_reachable_locations(build_assumed_inventory(pool)))
+    assert set(without) == set(pool)
+    for item in set(pool):
+        remaining = list(pool)
+        remaining.remove(item)
+        expected = v.get_reachable_locations(build_assumed_inventory(remaining))
+        assert set(without[item]) == set(expected), item
@@ -9,6 +9,7 @@ from flask import Flask
 from flask_cors import CORS
 
 from zora.api import routes
+from zora.item_randomizer import FILL_ENGINES
 
 _STATIC_DIR = str(Path(__file__).parent.parent.parent / "static")
 
@@ -19,6 +20,24 @@ def create_app(config: dict[str, Any] | None = None) -> Flask:
     origins = os.environ.get("ALLOWED_ORIGINS", "*").split(",")
     CORS(app, origins=origins)
 
+    # Item fill engine for every generated seed (see item_randomizer.FILL_ENGINES).
+    # A deployment setting, not a flag: the same flags and seed give a
+    # different game under a different engine.
+    app.config["FILL_ENGINE"] = os.environ.get("FILL_ENGINE", "assumed")
+    # Dead ends assumed fill may back out of before restarting (0 = restart
+    # on the first one). Also changes the game for a given flags and seed.
+    app.config["FILL_BACKTRACKS"] = int(os.environ.get("FILL_BACKTRACKS", "0"))
+    # Worker processes for the dungeon room shuffle (0 = the original single
+    # RNG stream; N >= 1 = per-level substreams on N processes). 0 and N >= 1
+    # give different dungeons for a given flags and seed.
+    app.config["DUNGEON_SHUFFLE_WORKERS"] = int(os.environ.get("DUNGEON_SHUFFLE_WORKERS", "0"))
+    # Set to 1 to shuffle enemies by the original pick-and-retry loops, so
+    # seeds generated before the direct samplers can be reproduced.
+    app.config["LEGACY_ENEMY_SAMPLING"] = os.environ.get("LEGACY_ENEMY_SAMPLING", "0") == "1"
+    # Set to 1 to shuffle caves by the original swap-and-retry loop, so seeds
+    # generated before the constructive cave shuffle can be reproduced.
+    app.config["LEGACY_CAVE_SHUFFLE"] = os.environ.get("LEGACY_CAVE_SHUFFLE", "0") == "1"
+
     app.register_blueprint(routes.bp)
 
     @app.get("/")
@@ -28,4 +47,17 @@ def create_app(config: dict[str, Any] | None = None) -> Flask:
     if config:
         app.config.update(config)
 
+    if app.config["FILL_ENGINE"] not in FILL_ENGINES:
+        raise ValueError(f"Unknown FILL_ENGINE {app.config['FILL_ENGINE']!r}; "
+                         f"expected one of {sorted(FILL_ENGINES)}")
+    if not isinstance(app.config["FILL_BACKTRACKS"], int) or app.config["FILL_BACKTRACKS"] < 0:
+        raise ValueError(f"FILL_BACKTRACKS must be a non-negative integer, got {app.config['FILL_BACKTRACKS']!r}")
+    if not isinstance(app.config["DUNGEON_SHUFFLE_WORKERS"], int) or app.config["DUNGEON_SHUFFLE_WORKERS"] < 0:
+        raise ValueError("DUNGEON_SHUFFLE_WORKERS must be a non-negative integer, "
+                         f"got {app.config['DUNGEON_SHUFFLE_WORKERS']!r}")
+    if not isinstance(app.config["LEGACY_ENEMY_SAMPLING"], bool):
+        raise ValueError(f"LEGACY_ENEMY_SAMPLING must be a bool, got {app.config['LEGACY_ENEMY_SAMPLING']!r}")
+    if not isinstance(app.config["LEGACY_CAVE_SHUFFLE"], bool):
+        raise ValueError(f"LEGACY_CAVE_SHUFFLE must be a bool, got {app.config['LEGACY_CAVE_SHUFFLE']!r}")
+
     return app
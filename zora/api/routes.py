@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Any
 
 import yaml
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
 
 from zora.api.validation import (
     CosmeticFlags,
@@ -188,6 +188,11 @@ def generate() -> Any:
         patch_bytes, hash_code, spoiler_log, spoiler_data = generate_game(
             resolved_flags, seed, flag_string=flag_string,
             rom_version=rom_version, cosmetic_flags=cosmetic_flags,
+            fill_engine=current_app.config["FILL_ENGINE"],
+            max_fill_backtracks=current_app.config["FILL_BACKTRACKS"],
+            dungeon_shuffle_workers=current_app.config["DUNGEON_SHUFFLE_WORKERS"],
+            legacy_enemy_sampling=current_app.config["LEGACY_ENEMY_SAMPLING"],
+            legacy_cave_shuffle=current_app.config["LEGACY_CAVE_SHUFFLE"],
         )
     except RuntimeError:
         log.exception("Randomizer failed for seed=%s flags=%s", seed, flag_string)
@@ -295,6 +300,11 @@ def generate_rerandomize() -> Any:
         patch_bytes, hash_code, spoiler_log, spoiler_data = generate_game_from_rom(
             rom_bytes, resolved_flags, seed, flag_string=flag_string,
             rom_version=rom_version, cosmetic_flags=cosmetic_flags_rr,
+            fill_engine=current_app.config["FILL_ENGINE"],
+            max_fill_backtracks=current_app.config["FILL_BACKTRACKS"],
+            dungeon_shuffle_workers=current_app.config["DUNGEON_SHUFFLE_WORKERS"],
+            legacy_enemy_sampling=current_app.config["LEGACY_ENEMY_SAMPLING"],
+            legacy_cave_shuffle=current_app.config["LEGACY_CAVE_SHUFFLE"],
         )
     except ValueError as exc:
         return _err("invalid_rom", str(exc), 400)
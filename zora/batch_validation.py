@@ -0,0 +1,211 @@
+"""
+Batch seed validation: check many generated worlds for beatability at once.
+
+Runs GameValidator.is_seed_valid() over a corpus of worlds in a process pool
+and aggregates pass/fail statistics. Worlds come either from seeds (run
+through the full randomizer pipeline for one flag string) or from already
+randomized ROM files. Intended for re-checking a corpus after a logic change.
+
+Within a worker process, compiled room tables are shared between worlds whose
+dungeon layout matches (see game_validator.room_layout_key), so a corpus that
+only differs in item placement compiles each room once per worker.
+
+Usage:
+    python3 -m zora.batch_validation --flags <flag_string> --seeds 1-1000
+    python3 -m zora.batch_validation --roms out/*.nes [--avoid-hard-combat] [--progressive-items]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TypeVar
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from flags.flags_generated import Flags, decode_flags, resolve_random_flags
+from zora.data_model import GameWorld
+from zora.game_validator import GameValidator, RoomTables, room_layout_key
+from zora.generate_game import generate_game_world
+from zora.parser import is_randomizer_rom, load_bin_files_from_rom, parse_game_world
+
+# Per-process cache of compiled room tables:
+# (room_layout_key, avoid_required_hard_combat) -> tables, least recently
+# used first. Shuffled-dungeon corpora have a new layout per seed, so the
+# cache keeps only the most recent few.
+_room_table_cache: dict[tuple[object, bool], RoomTables] = {}
+_ROOM_TABLE_CACHE_SIZE = 8
+
+_Job = TypeVar("_Job")
+
+
+@dataclass(frozen=True)
+class ValidationResult:
+    source: str           # "seed 42" or a ROM path
+    valid: bool
+    error: str | None     # set when the world could not be built or validated
+    seconds: float
+
+
+@dataclass(frozen=True)
+class BatchReport:
+    results: list[ValidationResult]
+    seconds: float        # wall-clock time for the whole batch
+
+    @property
+    def passed(self) -> list[ValidationResult]:
+        return [r for r in self.results if r.valid]
+
+    @property
+    def failed(self) -> list[ValidationResult]:
+        return [r for r in self.results if not r.valid and r.error is None]
+
+    @property
+    def errored(self) -> list[ValidationResult]:
+        return [r for r in self.results if r.error is not None]
+
+    def summary(self) -> str:
+        total = len(self.results)
+        lines = [
+            f"Validated {total} worlds in {self.seconds:.1f}s",
+            f"  passed:  {len(self.passed)}",
+            f"  failed:  {len(self.failed)}",
+            f"  errored: {len(self.errored)}",
+        ]
+        if total:
+            mean = sum(r.seconds for r in self.results) / total
+            lines.append(f"  mean time per world: {mean:.2f}s")
+        errors = Counter(r.error for r in self.errored)
+        for error, count in errors.most_common():
+            lines.append(f"  {count:>5} x {error}")
+        return "\n".join(lines)
+
+
+def is_world_valid(game_world: GameWorld, avoid_required_hard_combat: bool,
+                   progressive_items: bool = False) -> bool:
+    """Run is_seed_valid() on game_world, sharing room tables within this process."""
+    cache_key = (room_layout_key(game_world), avoid_required_hard_combat)
+    room_tables = _room_table_cache.pop(cache_key, {})
+    _room_table_cache[cache_key] = room_tables
+    if len(_room_table_cache) > _ROOM_TABLE_CACHE_SIZE:
+        del _room_table_cache[next(iter(_room_table_cache))]
+    validator = GameValidator(game_world, avoid_required_hard_combat,
+                              progressive_items=progressive_items, room_tables=room_tables)
+    return validator.is_seed_valid()
+
+
+def _validate_seed(job: tuple[Flags, int]) -> ValidationResult:
+    flags, seed = job
+    start = time.monotonic()
+    try:
+        # Resolve random flags per seed, as the API does.
+        resolved = resolve_random_flags(flags, random.Random(seed))
+        game_world, config = generate_game_world(resolved, seed)
+        valid = is_world_valid(game_world, config.avoid_required_hard_combat, config.progressive_items)
+        error = None
+    except (RuntimeError, ValueError) as e:
+        valid, error = False, f"{type(e).__name__}: {e}"
+    return ValidationResult(f"seed {seed}", valid, error, time.monotonic() - start)
+
+
+def _validate_rom(job: tuple[str, bool, bool]) -> ValidationResult:
+    path, avoid_required_hard_combat, progressive_items = job
+    start = time.monotonic()
+    try:
+        rom_bytes = Path(path).read_bytes()
+        if not is_randomizer_rom(rom_bytes):
+            raise ValueError("not a recognised ZORA-randomized Zelda 1 ROM")
+        game_world = parse_game_world(load_bin_files_from_rom(rom_bytes))
+        valid = is_world_valid(game_world, avoid_required_hard_combat, progressive_items)
+        error = None
+    except (OSError, ValueError) as e:
+        valid, error = False, f"{type(e).__name__}: {e}"
+    return ValidationResult(path, valid, error, time.monotonic() - start)
+
+
+def _run_batch(fn: Callable[[_Job], ValidationResult], jobs: Sequence[_Job],
+               max_workers: int | None) -> BatchReport:
+    start = time.monotonic()
+    if max_workers == 1:
+        results = [fn(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            # Contiguous chunks keep neighbouring worlds in one worker, where
+            # they can share compiled room tables.
+            chunksize = max(1, len(jobs) // (4 * (max_workers or 4)))
+            results = list(pool.map(fn, jobs, chunksize=chunksize))
+    return BatchReport(results, time.monotonic() - start)
+
+
+def validate_seeds(flags: Flags, seeds: Iterable[int], max_workers: int | None = None) -> BatchReport:
+    """Generate and validate one world per seed with the given (unresolved) flags.
+
+    Args:
+        flags:       Decoded flags; Tristate.RANDOM values are resolved per seed.
+        seeds:       Seeds to generate.
+        max_workers: Worker processes (None = one per CPU, 1 = run in this process).
+    """
+    return _run_batch(_validate_seed, [(flags, seed) for seed in seeds], max_workers)
+
+
+def validate_rom_files(paths: Iterable[str | Path], avoid_required_hard_combat: bool = False,
+                       progressive_items: bool = False, max_workers: int | None = None) -> BatchReport:
+    """Validate already randomized ROM files.
+
+    The logic options are not recorded in the ROM, so they must be supplied
+    to match the flags the ROMs were generated with.
+    """
+    jobs = [(str(p), avoid_required_hard_combat, progressive_items) for p in paths]
+    return _run_batch(_validate_rom, jobs, max_workers)
+
+
+def parse_seed_range(spec: str) -> list[int]:
+    """Parse "1-100,250,300-310" into a list of seeds (ranges inclusive)."""
+    seeds: list[int] = []
+    for part in spec.split(","):
+        lo, sep, hi = part.strip().partition("-")
+        if sep:
+            seeds.extend(range(int(lo), int(hi) + 1))
+        else:
+            seeds.append(int(lo))
+    return seeds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Validate many seeds or ROM files for beatability")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--seeds", type=str,
+                        help="Seeds to generate, e.g. 1-1000 or 1-10,42 (requires --flags)")
+    source.add_argument("--roms", nargs="+", help="Randomized .nes files to validate")
+    parser.add_argument("--flags", type=str, default="", help="Flag string for --seeds")
+    parser.add_argument("--avoid-hard-combat", action="store_true",
+                        help="ROM mode: validate with avoid_required_hard_combat logic")
+    parser.add_argument("--progressive-items", action="store_true",
+                        help="ROM mode: validate with progressive items logic")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: one per CPU)")
+    parser.add_argument("--show-failures", action="store_true",
+                        help="List every failing or erroring world")
+    args = parser.parse_args()
+
+    if args.seeds is not None:
+        report = validate_seeds(decode_flags(args.flags), parse_seed_range(args.seeds), args.workers)
+    else:
+        report = validate_rom_files(args.roms, args.avoid_hard_combat, args.progressive_items, args.workers)
+
+    print(report.summary())
+    if args.show_failures:
+        for r in report.failed + report.errored:
+            print(f"  {r.source}: {r.error or 'unbeatable'}")
+    sys.exit(0 if len(report.passed) == len(report.results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,8 @@ Call order:
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+
 from zora.data_model import GameWorld
 from zora.dungeon.shuffle_dungeon_rooms import shuffle_dungeon_rooms
 from zora.game_config import GameConfig
@@ -33,5 +35,13 @@ def randomize_dungeons(
         rng: Shared RNG instance (state flows between steps).
     """
     if config.shuffle_dungeon_rooms:
-        if not shuffle_dungeon_rooms(game_world, rng):
+        workers = config.dungeon_shuffle_workers
+        if workers > 1:
+            # A pool per call: worker processes never outlive the seed that
+            # started them (nothing lingers in a long-running server process).
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                ok = shuffle_dungeon_rooms(game_world, rng, parallel=True, executor=executor)
+        else:
+            ok = shuffle_dungeon_rooms(game_world, rng, parallel=workers > 0)
+        if not ok:
             raise RuntimeError("Dungeon room shuffle failed")
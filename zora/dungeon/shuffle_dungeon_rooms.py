@@ -377,6 +377,12 @@ C# source: ShuffleDungeonRooms.cs (main method) and
 # In our port, we should use max_attempts limits with clear fallback behavior.
 """
 
+import logging
+from collections import Counter, defaultdict
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+
 from zora.data_model import (
     Direction,
     Enemy,
@@ -390,15 +396,9 @@ from zora.data_model import (
     StaircaseRoom,
     WallType,
 )
-from zora.rng import Rng
-
-
-# Maximum retries for the constrained Fisher-Yates before restarting a level.
-_MAX_SHUFFLE_RETRIES = 1_000
-
-# Maximum times we'll restart a single level from scratch before giving up.
-_MAX_LEVEL_RETRIES = 50
+from zora.rng import Rng, SeededRng
 
+log = logging.getLogger(__name__)
 
 # Room types that require specific neighbors to function correctly.
 # These impose adjacency constraints during the shuffle.
@@ -514,25 +514,6 @@ def _check_adjacency_constraints(
     return True
 
 
-def _is_swap_valid(
-    room_type_i: RoomType,
-    room_type_j: RoomType,
-    pos_i: int,
-    pos_j: int,
-    level_room_nums: frozenset[int],
-) -> bool:
-    """Check if swapping room contents between positions i and j is valid.
-
-    After the swap, room_type_i would be at pos_j and room_type_j at pos_i.
-    Both placements must satisfy adjacency constraints.
-    """
-    if not _check_adjacency_constraints(room_type_i, pos_j, level_room_nums):
-        return False
-    if not _check_adjacency_constraints(room_type_j, pos_i, level_room_nums):
-        return False
-    return True
-
-
 class _RoomContents:
     """The movable parts of a room — everything except walls and grid position.
 
@@ -658,8 +639,134 @@ def _is_horiz_pair_locked(
 # Door pair value 9 = SOLID_WALL(1) on both sides = sealed wall.
 _SEALED_DOOR_PAIR = (WallType.SOLID_WALL.value << 3) | WallType.SOLID_WALL.value
 
+# Door pair value -> (first room's wall, second room's wall), for writing
+# shuffled values back without building a WallType per wall.
+_DOOR_PAIR_WALLS: list[tuple[WallType, WallType]] = [
+    (WallType((val >> 3) & 7), WallType(val & 7)) for val in range(64)
+]
+
+
+class _DoorPairTable:
+    """The door pairs of a level in one direction, with their static parts.
 
-def _fix_horizontal_door_pairs(level: Level, rng: Rng) -> None:
+    Which rooms pair up depends only on the level's room set, and a pair
+    whose rooms both stay put is locked or not regardless of the shuffle,
+    so both are worked out once per level. Pair values are read from the
+    walls when the table is built; they stay valid for as long as each use
+    starts from those walls (see _LevelSnapshot.restore).
+    """
+    __slots__ = ('firsts', 'seconds', 'values', 'static_locked', 'is_locked')
+
+    def __init__(
+        self,
+        level: Level,
+        step: int,
+        shufflable: Sequence[Room],
+        is_locked: Callable[[Room, Room], bool],
+    ) -> None:
+        """
+        Args:
+            step: 1 for horizontal pairs (room, room + 1), 16 for vertical
+                pairs (room, room + 16).
+            shufflable: The level's shufflable rooms, whose contents move.
+            is_locked: Lock rule for a (left, right) or (upper, lower) pair.
+        """
+        room_by_num = {r.room_num: r for r in level.rooms}
+        moving = {r.room_num for r in shufflable}
+        self.firsts: list[Room] = []
+        self.seconds: list[Room] = []
+        self.values: list[int] = []
+        # None where the lock depends on the shuffled contents.
+        self.static_locked: list[bool | None] = []
+        self.is_locked = is_locked
+        for room in sorted(level.rooms, key=lambda r: r.room_num):
+            # Skip rooms on the rightmost column — no right neighbor.
+            # Rooms on the last row have no room below and fail the lookup.
+            if step == 1 and room.room_num % 16 == 15:
+                continue
+            other = room_by_num.get(room.room_num + step)
+            if other is None:
+                continue
+            self.firsts.append(room)
+            self.seconds.append(other)
+            if step == 1:
+                self.values.append(_horiz_door_pair_value(room, other))
+            else:
+                self.values.append(_vert_door_pair_value(room, other))
+            if room.room_num in moving or other.room_num in moving:
+                self.static_locked.append(None)
+            else:
+                self.static_locked.append(is_locked(room, other))
+
+    def shuffled_values(self, rng: Rng) -> list[int]:
+        """Lock, seal and shuffle the pair values for the current contents.
+
+        Locked pairs are forced to the sealed value (9). The C# first tries
+        to swap with an unlocked pair that already has value 9, preserving
+        the total distribution; if none is left, it force-sets to 9.
+        Unlocked pairs are then Fisher-Yates shuffled among themselves.
+        """
+        is_locked = self.is_locked
+        pair_locked = [
+            is_locked(first, second) if locked is None else locked
+            for first, second, locked in zip(self.firsts, self.seconds, self.static_locked, strict=True)
+        ]
+        pair_values = list(self.values)
+
+        # Each lookup takes the first unlocked sealed pair left. A swap
+        # gives that pair an unsealed value and no step creates a new
+        # unlocked sealed pair, so taking them in index order from a list
+        # made up front finds the same pair as the C#'s scan from 0.
+        spare_sealed = iter([
+            j for j, (val, locked) in enumerate(zip(pair_values, pair_locked, strict=True))
+            if val == _SEALED_DOOR_PAIR and not locked
+        ])
+        for i, locked in enumerate(pair_locked):
+            if not locked or pair_values[i] == _SEALED_DOOR_PAIR:
+                continue
+            j = next(spare_sealed, None)
+            if j is None:
+                pair_values[i] = _SEALED_DOOR_PAIR
+            else:
+                pair_values[i], pair_values[j] = pair_values[j], pair_values[i]
+
+        # Fisher-Yates shuffle on unlocked pairs only.
+        # The C# retries (i--) when a locked swap target is picked.
+        count = len(pair_values)
+        i = 0
+        while i < count:
+            if pair_locked[i]:
+                i += 1
+                continue
+            remaining = count - i
+            j = i + int(rng.random() * remaining)
+            if pair_locked[j]:
+                # Retry this index with a new random target (C# does i--).
+                # No infinite loop risk: locked pairs already have value 9, so
+                # at least one unlocked pair exists in [i..count) (pair i itself).
+                continue
+            pair_values[i], pair_values[j] = pair_values[j], pair_values[i]
+            i += 1
+
+        return pair_values
+
+
+def _horizontal_door_pairs(level: Level, shufflable: Sequence[Room]) -> _DoorPairTable:
+    level_num = level.level_num
+    return _DoorPairTable(
+        level, 1, shufflable,
+        lambda left, right: _is_horiz_pair_locked(left, right, level_num),
+    )
+
+
+def _vertical_door_pairs(level: Level, shufflable: Sequence[Room], must_beat_gannon: bool) -> _DoorPairTable:
+    return _DoorPairTable(
+        level, 16, shufflable,
+        lambda upper, lower: _is_vert_pair_locked(upper, lower, must_beat_gannon),
+    )
+
+
+def _fix_horizontal_door_pairs(level: Level, rng: Rng, pairs: _DoorPairTable | None = None) -> None:
     """Shuffle horizontal door pairs within a level.
 
     For each pair of horizontally adjacent rooms (room i, room i+1) that both
@@ -671,76 +778,22 @@ def _fix_horizontal_door_pairs(level: Level, rng: Rng) -> None:
     Unlocked pairs are Fisher-Yates shuffled among themselves.
 
     Finally, write the shuffled wall types back to the room objects.
-    """
-    level_room_nums = _level_room_nums(level)
-    room_by_num: dict[int, Room] = {r.room_num: r for r in level.rooms}
 
-    # Collect horizontal pairs: adjacent rooms (i, i+1) both in this level.
-    pair_positions: list[int] = []       # room_num of the left room
-    pair_values: list[int] = []          # 6-bit door pair value
-    pair_locked: list[bool] = []
-
-    for room in sorted(level.rooms, key=lambda r: r.room_num):
-        room_num = room.room_num
-        # Skip rooms on the rightmost column — no right neighbor.
-        if room_num % 16 == 15:
-            continue
-        right_num = room_num + 1
-        if right_num not in level_room_nums:
-            continue
-
-        left_room = room
-        right_room = room_by_num[right_num]
-
-        pair_positions.append(room_num)
-        pair_values.append(_horiz_door_pair_value(left_room, right_room))
-        pair_locked.append(_is_horiz_pair_locked(left_room, right_room, level.level_num))
-
-    if not pair_positions:
+    Args:
+        pairs: The level's horizontal pair table, built before the walls
+            last changed. Built from the current walls if not given.
+    """
+    if pairs is None:
+        pairs = _horizontal_door_pairs(
+            level, [r for r in level.rooms if _is_shufflable(r, level.level_num)],
+        )
+    if not pairs.firsts:
         return
 
-    # Force locked pairs to the sealed value (9).
-    # The C# first tries to swap with an unlocked pair that already has value 9,
-    # preserving the total distribution. If none found, it force-sets to 9.
-    for i in range(len(pair_locked)):
-        if not pair_locked[i]:
-            continue
-        if pair_values[i] == _SEALED_DOOR_PAIR:
-            continue
-        # Try to find an unlocked pair with value 9 to swap with.
-        swapped = False
-        for j in range(len(pair_locked)):
-            if pair_values[j] == _SEALED_DOOR_PAIR and not pair_locked[j]:
-                pair_values[i], pair_values[j] = pair_values[j], pair_values[i]
-                swapped = True
-                break
-        if not swapped:
-            pair_values[i] = _SEALED_DOOR_PAIR
-
-    # Fisher-Yates shuffle on unlocked pairs only.
-    # The C# retries (i--) when a locked swap target is picked.
-    count = len(pair_values)
-    i = 0
-    while i < count:
-        if pair_locked[i]:
-            i += 1
-            continue
-        remaining = count - i
-        j = i + int(rng.random() * remaining)
-        if pair_locked[j]:
-            # Retry this index with a new random target (C# does i--).
-            # No infinite loop risk: locked pairs already have value 9, so
-            # at least one unlocked pair exists in [i..count) (pair i itself).
-            continue
-        pair_values[i], pair_values[j] = pair_values[j], pair_values[i]
-        i += 1
-
     # Write shuffled door pair values back to room wall fields.
-    for pos, val in zip(pair_positions, pair_values):
-        left_room = room_by_num[pos]
-        right_room = room_by_num[pos + 1]
-        left_room.walls.east = WallType((val >> 3) & 7)
-        right_room.walls.west = WallType(val & 7)
+    pair_values = pairs.shuffled_values(rng)
+    for left_room, right_room, val in zip(pairs.firsts, pairs.seconds, pair_values, strict=True):
+        left_room.walls.east, right_room.walls.west = _DOOR_PAIR_WALLS[val]
 
 
 def _vert_door_pair_value(upper: Room, lower: Room) -> int:
@@ -751,6 +804,10 @@ def _vert_door_pair_value(upper: Room, lower: Room) -> int:
     return (upper.walls.south.value << 3) | lower.walls.north.value
 
 
+# Decoded enemy quantity -> 2-bit quantity code (vanilla qty_table).
+_QTY_REVERSE = {1: 0, 4: 1, 5: 2, 6: 3}
+
+
 def _pack_table2_7bit(room: Room) -> int:
     """Reconstruct the 7-bit packed Table 2 value for a room.
 
@@ -766,7 +823,6 @@ def _pack_table2_7bit(room: Room) -> int:
     are a no-op safety net (staircase rooms aren't in Level.rooms), so
     any inaccuracy has no effect.
     """
-    _QTY_REVERSE = {1: 0, 4: 1, 5: 2, 6: 3}
     qty_code = _QTY_REVERSE.get(room.enemy_quantity, 0)
     return ((qty_code & 1) << 6) | (room.enemy_spec.enemy.value & 0x3F)
 
@@ -862,6 +918,7 @@ def _fix_vertical_door_pairs(
     level: Level,
     rng: Rng,
     must_beat_gannon: bool,
+    pairs: _DoorPairTable | None = None,
 ) -> None:
     """Shuffle vertical door pairs within a level.
 
@@ -878,171 +935,158 @@ def _fix_vertical_door_pairs(
         and uses staircase-exit-position pair checks instead of the
         BLACK_ROOM configuration check. See _is_vert_pair_locked for
         details.
-    """
-    level_room_nums = _level_room_nums(level)
-    room_by_num: dict[int, Room] = {r.room_num: r for r in level.rooms}
-
-    pair_positions: list[int] = []
-    pair_values: list[int] = []
-    pair_locked: list[bool] = []
 
-    for room in sorted(level.rooms, key=lambda r: r.room_num):
-        room_num = room.room_num
-        # Skip rooms on the last row — no room below.
-        if room_num // 16 == 7:
-            continue
-        below_num = room_num + 16
-        if below_num not in level_room_nums:
-            continue
-
-        upper_room = room
-        lower_room = room_by_num[below_num]
-
-        pair_positions.append(room_num)
-        pair_values.append(_vert_door_pair_value(upper_room, lower_room))
-        pair_locked.append(_is_vert_pair_locked(
-            upper_room, lower_room, must_beat_gannon,
-        ))
-
-    if not pair_positions:
+    Args:
+        pairs: The level's vertical pair table, built before the walls
+            last changed. Built from the current walls if not given.
+    """
+    if pairs is None:
+        pairs = _vertical_door_pairs(
+            level, [r for r in level.rooms if _is_shufflable(r, level.level_num)], must_beat_gannon,
+        )
+    if not pairs.firsts:
         return
 
-    # Force locked pairs to the sealed value (9).
-    for i in range(len(pair_locked)):
-        if not pair_locked[i]:
-            continue
-        if pair_values[i] == _SEALED_DOOR_PAIR:
-            continue
-        swapped = False
-        for j in range(len(pair_locked)):
-            if pair_values[j] == _SEALED_DOOR_PAIR and not pair_locked[j]:
-                pair_values[i], pair_values[j] = pair_values[j], pair_values[i]
-                swapped = True
-                break
-        if not swapped:
-            pair_values[i] = _SEALED_DOOR_PAIR
-
-    # Fisher-Yates shuffle on unlocked pairs only.
-    count = len(pair_values)
-    i = 0
-    while i < count:
-        if pair_locked[i]:
-            i += 1
-            continue
-        remaining = count - i
-        j = i + int(rng.random() * remaining)
-        if pair_locked[j]:
-            continue
-        pair_values[i], pair_values[j] = pair_values[j], pair_values[i]
-        i += 1
-
     # Write shuffled door pair values back to room wall fields.
-    for pos, val in zip(pair_positions, pair_values):
-        upper_room = room_by_num[pos]
-        lower_room = room_by_num[pos + 16]
-        upper_room.walls.south = WallType((val >> 3) & 7)
-        lower_room.walls.north = WallType(val & 7)
+    pair_values = pairs.shuffled_values(rng)
+    for upper_room, lower_room, val in zip(pairs.firsts, pairs.seconds, pair_values, strict=True):
+        upper_room.walls.south, lower_room.walls.north = _DOOR_PAIR_WALLS[val]
+
 
+class _FitTable:
+    """Which shufflable positions of a level each room's contents may occupy.
 
-def _shuffle_level(level: Level, rng: Rng) -> bool:
+    Adjacency constraints depend only on a room type and the level's room
+    set, so the table is built once per level from the unshuffled rooms
+    and reused by every shuffle attempt that starts from them.
+    """
+    __slots__ = ('positions', 'fit_masks', 'misfits')
+
+    def __init__(self, shufflable: list[Room], level_room_nums: frozenset[int]) -> None:
+        self.positions = [room.room_num for room in shufflable]
+        # fit_masks[k]: bitset of the position indices the contents of
+        # shufflable[k] may occupy.
+        mask_by_type: dict[RoomType, int] = {}
+        for room in shufflable:
+            if room.room_type not in mask_by_type:
+                mask_by_type[room.room_type] = sum(
+                    1 << p for p, pos in enumerate(self.positions)
+                    if _check_adjacency_constraints(room.room_type, pos, level_room_nums)
+                )
+        self.fit_masks = [mask_by_type[room.room_type] for room in shufflable]
+        # misfits[p]: contents that may not occupy position p. Most room
+        # types fit everywhere, so these lists are short or empty.
+        self.misfits: list[list[int]] = [[] for _ in shufflable]
+        for k, mask in enumerate(self.fit_masks):
+            for p in range(len(shufflable)):
+                if not mask >> p & 1:
+                    self.misfits[p].append(k)
+
+
+def _shuffle_level(level: Level, rng: Rng, start: "_LevelSnapshot | None" = None) -> bool:
     """Shuffle room contents within a single dungeon level.
 
     Performs a constrained Fisher-Yates shuffle: for each position in the
-    shufflable room list, pick a random swap target. If the swap would
-    violate adjacency constraints, retry with a new target. If retries
-    are exhausted, restart the entire level.
+    shufflable room list, swap its contents with those of a random target
+    position such that both rooms still satisfy their adjacency
+    constraints afterwards. The target is drawn directly from the valid
+    ones, so every valid target is equally likely and no draw is wasted.
+    (The C# draws from all positions and redraws on an invalid swap, which
+    gives the same distribution at the cost of retries.)
+
+    Every swap keeps all contents on positions they fit, and contents
+    start where they fit, so staying put is always valid and the shuffle
+    cannot get stuck. Returns False only if some contents start out on a
+    position that violates their constraints.
 
-    Returns True on success, False if the level couldn't be shuffled
-    within the retry budget.
+    Args:
+        start: Snapshot of the level before any shuffling. If given, the
+            contents are dealt from it instead of read from the rooms, so
+            the rooms' current contents do not matter (see
+            _LevelSnapshot.restore).
     """
-    shufflable = [
-        room for room in level.rooms
-        if _is_shufflable(room, level.level_num)
-    ]
+    if start is None:
+        start = _LevelSnapshot(level)
+    shufflable = start.shufflable
+    fit_masks, misfits = start.fit_table.fit_masks, start.fit_table.misfits
+    room_by_num: dict[int, Room] = {r.room_num: r for r in level.rooms}
 
+    contents = list(start.contents)
     if len(shufflable) < 2:
+        # Nothing to swap; put the contents back as they were.
+        for room, content in zip(shufflable, contents, strict=True):
+            content.apply_to(room)
         return True
 
-    level_room_nums = _level_room_nums(level)
-    room_by_num: dict[int, Room] = {r.room_num: r for r in level.rooms}
-
-    for _level_attempt in range(_MAX_LEVEL_RETRIES):
-        # Extract contents from rooms (fresh each attempt since we swap in-place)
-        contents = [_RoomContents(room) for room in shufflable]
-        positions = [room.room_num for room in shufflable]
-        # Track where each content originated so we can remap staircase refs.
-        orig_positions = list(positions)
-        pool_size = len(shufflable)
-
-        retry_count = 0
-        i = 0
-        success = True
-
-        while i < pool_size:
-            retry_count += 1
-            if retry_count > _MAX_SHUFFLE_RETRIES:
-                success = False
-                break
-
-            # Pick a random swap target from the remaining unprocessed positions.
-            # The C# uses `rng.Next() % remaining` where remaining = total count,
-            # not (count - i). This means the swap target can be any position,
-            # not just unprocessed ones. This is the C#'s actual behavior.
+    positions = [room.room_num for room in shufflable]
+    # Track where each content originated so we can remap staircase refs.
+    orig_positions = list(positions)
+    pool_size = len(shufflable)
+    all_positions = (1 << pool_size) - 1
+
+    # order[p]: contents now at position p; where[k]: position of contents k.
+    order = list(range(pool_size))
+    where = list(range(pool_size))
+
+    for i in range(pool_size):
+        # Valid targets: positions the contents at i fit, minus positions
+        # holding contents that would not fit at i. Like the C#, the target
+        # can be any position, not just an unprocessed one.
+        valid = fit_masks[order[i]]
+        for k in misfits[i]:
+            valid &= ~(1 << where[k])
+        if not valid:
+            return False
+        if valid == all_positions:
             j = int(rng.random() * pool_size)
+        else:
+            targets = [j for j in range(pool_size) if valid >> j & 1]
+            j = targets[int(rng.random() * len(targets))]
+
+        # Swap contents only — positions are fixed grid slots.
+        contents[i], contents[j] = contents[j], contents[i]
+        order[i], order[j] = order[j], order[i]
+        where[order[i]], where[order[j]] = i, j
+        orig_positions[i], orig_positions[j] = orig_positions[j], orig_positions[i]
+
+    # Write shuffled contents back to rooms at their new positions.
+    for pos, content in zip(positions, contents):
+        room = room_by_num[pos]
+        content.apply_to(room)
+
+    # Build remap: old_position → new_position.
+    remap = {orig: dest for orig, dest in zip(orig_positions, positions)}
+
+    # Update staircase refs to follow shuffled room contents.
+    for sr in level.staircase_rooms:
+        if sr.return_dest is not None and sr.return_dest in remap:
+            sr.return_dest = remap[sr.return_dest]
+        if sr.left_exit is not None and sr.left_exit in remap:
+            sr.left_exit = remap[sr.left_exit]
+        if sr.right_exit is not None and sr.right_exit in remap:
+            sr.right_exit = remap[sr.right_exit]
 
-            if not _is_swap_valid(
-                contents[i].room_type, contents[j].room_type,
-                positions[i], positions[j],
-                level_room_nums,
-            ):
-                continue
-
-            # Swap contents only — positions are fixed grid slots.
-            contents[i], contents[j] = contents[j], contents[i]
-            orig_positions[i], orig_positions[j] = orig_positions[j], orig_positions[i]
-            i += 1
-
-        if success:
-            # Write shuffled contents back to rooms at their new positions.
-            for pos, content in zip(positions, contents):
-                room = room_by_num[pos]
-                content.apply_to(room)
-
-            # Build remap: old_position → new_position.
-            remap = {orig: dest for orig, dest in zip(orig_positions, positions)}
-
-            # Update staircase refs to follow shuffled room contents.
-            for sr in level.staircase_rooms:
-                if sr.return_dest is not None and sr.return_dest in remap:
-                    sr.return_dest = remap[sr.return_dest]
-                if sr.left_exit is not None and sr.left_exit in remap:
-                    sr.left_exit = remap[sr.left_exit]
-                if sr.right_exit is not None and sr.right_exit in remap:
-                    sr.right_exit = remap[sr.right_exit]
-
-            return True
-
-    return False
+    return True
 
 
-def _get_level9_room_nums(world: GameWorld) -> frozenset[int]:
+def _get_level9_room_nums(levels: Sequence[Level]) -> frozenset[int]:
     """Return room_nums belonging to level 9, for cross-level neighbor checks."""
-    for level in world.levels:
+    for level in levels:
         if level.level_num == 9:
             return frozenset(r.room_num for r in level.rooms)
     return frozenset()
 
 
-def _grid_room_lookup(world: GameWorld, level: Level) -> dict[int, Room]:
+def _grid_room_lookup(levels: Sequence[Level], level: Level) -> dict[int, Room]:
     """Build a room_num → Room dict for all levels sharing a grid with *level*.
 
     Levels 1-6 share one grid; levels 7-9 share another.  The boss-cry
     neighbor fix in FixSpecialRooms needs to look up rooms across levels.
     """
     if level.level_num <= 6:
-        grid_levels = [lv for lv in world.levels if lv.level_num <= 6]
+        grid_levels = [lv for lv in levels if lv.level_num <= 6]
     else:
-        grid_levels = [lv for lv in world.levels if lv.level_num >= 7]
+        grid_levels = [lv for lv in levels if lv.level_num >= 7]
     result: dict[int, Room] = {}
     for lv in grid_levels:
         for room in lv.rooms:
@@ -1061,14 +1105,19 @@ def _has_any_shutter_door(room: Room) -> bool:
     )
 
 
-def _fix_special_rooms(level: Level, world: GameWorld) -> None:
+def _fix_special_rooms(level: Level, levels: Sequence[Level]) -> None:
     """Fix wall/door interactions after the content shuffle.
 
     Ported from ShuffleDungeonRoomsHelpers.cs FixSpecialRooms (lines 426-601).
+
+    *levels* are the levels whose rooms may be touched as neighbours. The
+    only writes outside *level* itself are boss_cry_1 bits, which
+    _clear_boss_cry_bits resets at the end of the shuffle, so passing just
+    [level] gives the same final result.
     """
     level_room_nums = _level_room_nums(level)
-    level9_room_nums = _get_level9_room_nums(world)
-    grid_rooms = _grid_room_lookup(world, level)
+    level9_room_nums = _get_level9_room_nums(levels)
+    grid_rooms = _grid_room_lookup(levels, level)
 
     for room in level.rooms:
         walls = room.walls
@@ -1209,7 +1258,7 @@ def _fix_special_rooms(level: Level, world: GameWorld) -> None:
                     grid_rooms[right_num].walls.west = WallType.SOLID_WALL
 
 
-def _fix_peninsula_and_stairs(level: Level, world: GameWorld) -> None:
+def _fix_peninsula_and_stairs(level: Level) -> None:
     """Fix stair rooms, peninsula rooms, and bomb upgrade room doors.
 
     Ported from ShuffleDungeonRoomsHelpers.cs FixPeninsulaAndStairs (lines 607-705).
@@ -1307,6 +1356,45 @@ def _clear_boss_cry_bits(world: GameWorld) -> None:
 _MAX_CONNECTIVITY_RETRIES = 200
 
 
+@dataclass
+class LevelShuffleStats:
+    """Connectivity retry counters for one dungeon level.
+
+    Every attempt ends in success or in exactly one of the three rejection
+    counters, by the first check it failed.
+    """
+
+    shuffles: int = 0      # times the level was shuffled
+    exhausted: int = 0     # shuffles that used up _MAX_CONNECTIVITY_RETRIES
+    stuck: int = 0         # attempts whose content shuffle got stuck
+    early_aborts: int = 0  # attempts disconnected even with vertical walls assumed open
+    disconnected: int = 0  # attempts disconnected after every fix-up
+    # attempts used by each successful shuffle -> number of such shuffles
+    attempts: Counter[int] = field(default_factory=Counter)
+
+    def add(self, other: "LevelShuffleStats") -> None:
+        self.shuffles += other.shuffles
+        self.exhausted += other.exhausted
+        self.stuck += other.stuck
+        self.early_aborts += other.early_aborts
+        self.disconnected += other.disconnected
+        self.attempts.update(other.attempts)
+
+
+@dataclass
+class DungeonShuffleStats:
+    """Retry counters of shuffle_dungeon_rooms, by level number."""
+
+    levels: defaultdict[int, LevelShuffleStats] = field(
+        default_factory=lambda: defaultdict(LevelShuffleStats),
+    )
+
+
+# Process-wide counters, reported by zora.dungeon_shuffle_report and logged
+# when a level runs out of attempts.
+stats = DungeonShuffleStats()
+
+
 class _RoomSnapshot:
     """Complete snapshot of a Room's mutable state for save/restore."""
     __slots__ = (
@@ -1371,122 +1459,222 @@ class _StaircaseSnapshot:
 
 
 class _LevelSnapshot:
-    """Complete snapshot of a level's mutable state for retry."""
-    __slots__ = ('room_snaps', 'staircase_snaps', 'entrance_room')
+    """Snapshot of a level's mutable state, taken once and restored per retry.
+
+    Stored by what each retry overwrites. Walls stay at their grid
+    positions, so they are kept as one flat (north, east, south, west)
+    tuple per room. The contents of shufflable rooms are kept as
+    _RoomContents; _shuffle_level deals them out again on every attempt,
+    so restore() leaves them alone. Only the few rooms that never move
+    get a full _RoomSnapshot.
+    """
+    __slots__ = (
+        'rooms', 'walls', 'shufflable', 'contents', 'fit_table',
+        'fixed_snaps', 'staircase_snaps', 'entrance_room',
+    )
 
     def __init__(self, level: Level) -> None:
-        self.room_snaps = [_RoomSnapshot(r) for r in level.rooms]
+        self.rooms = list(level.rooms)
+        self.walls = [(r.walls.north, r.walls.east, r.walls.south, r.walls.west) for r in self.rooms]
+        self.shufflable = [r for r in self.rooms if _is_shufflable(r, level.level_num)]
+        self.contents = [_RoomContents(r) for r in self.shufflable]
+        self.fit_table = _FitTable(self.shufflable, _level_room_nums(level))
+        shufflable_nums = {r.room_num for r in self.shufflable}
+        self.fixed_snaps = [_RoomSnapshot(r) for r in self.rooms if r.room_num not in shufflable_nums]
         self.staircase_snaps = [_StaircaseSnapshot(sr) for sr in level.staircase_rooms]
         self.entrance_room = level.entrance_room
 
     def restore(self, level: Level) -> None:
+        """Restore everything except the contents of shufflable rooms.
+
+        Must be followed by _shuffle_level(level, rng, self), which
+        rewrites those contents.
+        """
+        for room, (north, east, south, west) in zip(self.rooms, self.walls, strict=True):
+            walls = room.walls
+            walls.north, walls.east, walls.south, walls.west = north, east, south, west
         by_num = {r.room_num: r for r in level.rooms}
-        for snap in self.room_snaps:
+        for snap in self.fixed_snaps:
             snap.restore(by_num[snap.room_num])
         sr_by_num = {sr.room_num: sr for sr in level.staircase_rooms}
-        for snap in self.staircase_snaps:
-            snap.restore(sr_by_num[snap.room_num])
+        for sr_snap in self.staircase_snaps:
+            sr_snap.restore(sr_by_num[sr_snap.room_num])
         level.entrance_room = self.entrance_room
 
 
-def _is_level_connected(level: Level) -> bool:
+# Grid bitboards (bit n = room n) of the rooms with a neighbour slot in each
+# direction, for the connectivity fill.
+_HAS_NORTH_SLOT = ((1 << 128) - 1) & ~0xFFFF                         # all but row 0
+_HAS_SOUTH_SLOT = (1 << 112) - 1                                    # all but row 7
+_HAS_WEST_SLOT = sum(1 << rn for rn in range(128) if rn % 16 != 0)   # all but column 0
+_HAS_EAST_SLOT = sum(1 << rn for rn in range(128) if rn % 16 != 15)  # all but column 15
+
+
+def _reachable_room_mask(level: Level, assume_vertical_open: bool = False) -> int:
+    """Bitboard of the grid positions reachable from the level's entrance.
+
+    Fills over a 128-bit bitboard of the grid: each pass moves every
+    reached room through each of its non-SOLID_WALL walls into
+    neighbours that belong to the level, and through transport staircases
+    whose left or right exit has been reached. Stops when a pass adds
+    nothing.
+
+    Args:
+        assume_vertical_open: Treat every north/south wall inside the level
+            as open. The result is then an upper bound on what the level's
+            final vertical walls can connect.
+    """
+    # Rooms whose wall in each direction is not SOLID_WALL.
+    level_mask = north = south = west = east = 0
+    solid = WallType.SOLID_WALL
+    for room in level.rooms:
+        bit = 1 << room.room_num
+        walls = room.walls
+        level_mask |= bit
+        if walls.north != solid:
+            north |= bit
+        if walls.south != solid:
+            south |= bit
+        if walls.west != solid:
+            west |= bit
+        if walls.east != solid:
+            east |= bit
+    if assume_vertical_open:
+        north = south = level_mask
+    north &= _HAS_NORTH_SLOT
+    south &= _HAS_SOUTH_SLOT
+    west &= _HAS_WEST_SLOT
+    east &= _HAS_EAST_SLOT
+    transports = [
+        (1 << sr.left_exit) | (1 << sr.right_exit)
+        for sr in level.staircase_rooms
+        if sr.room_type == RoomType.TRANSPORT_STAIRCASE
+        and sr.left_exit is not None and sr.right_exit is not None
+    ]
+
+    reached = 1 << level.entrance_room
+    while True:
+        grown = reached | level_mask & (
+            (reached & north) >> 16 | (reached & south) << 16
+            | (reached & west) >> 1 | (reached & east) << 1
+        )
+        for exits in transports:
+            if grown & exits:
+                grown |= exits
+        if grown == reached:
+            return reached
+        reached = grown
+
+
+def _is_level_connected(level: Level, assume_vertical_open: bool = False) -> bool:
     """Check that every room in the level is reachable from the entrance.
 
-    Flood-fills from entrance_room following non-SOLID_WALL walls between
-    rooms that belong to the level. Also follows transport staircase
-    connections: if a staircase room is reachable (one of its exits has
-    been visited), both exits become reachable seeds.
+    Follows non-SOLID_WALL walls between rooms that belong to the level,
+    and transport staircases: if either exit of one is reachable, both
+    are.
 
-    Returns True if all rooms in level.rooms are visited.
+    Returns True if all rooms in level.rooms are reachable. With
+    assume_vertical_open, returns False only if no choice of north/south
+    walls could connect the level (see _reachable_room_mask).
     """
-    level_room_nums = frozenset(r.room_num for r in level.rooms)
-    room_by_num: dict[int, Room] = {r.room_num: r for r in level.rooms}
-    staircase_room_nums = frozenset(sr.room_num for sr in level.staircase_rooms)
+    level_mask = 0
+    for room in level.rooms:
+        level_mask |= 1 << room.room_num
+    return level_mask & ~_reachable_room_mask(level, assume_vertical_open) == 0
 
-    visited: set[int] = set()
-    queue: list[int] = [level.entrance_room]
 
-    while queue:
-        rn = queue.pop()
-        if rn in visited:
+def _shuffle_level_until_connected(
+    level: Level,
+    levels: Sequence[Level],
+    rng: Rng,
+    must_beat_gannon: bool,
+    level_stats: LevelShuffleStats | None = None,
+) -> bool:
+    """Shuffle and fix up one level, retrying until it is fully connected.
+
+    Returns False if the level is still disconnected after
+    _MAX_CONNECTIVITY_RETRIES attempts.
+
+    Args:
+        level_stats: Counters to record the attempts in. Defaults to this
+            level's entry in the process-wide stats.
+    """
+    if level_stats is None:
+        level_stats = stats.levels[level.level_num]
+    # Counted for this call alone, so the log below describes these
+    # attempts, then merged into level_stats.
+    call_stats = LevelShuffleStats(shuffles=1)
+    snapshot = _LevelSnapshot(level)
+    horizontal_pairs = _horizontal_door_pairs(level, snapshot.shufflable)
+    vertical_pairs = _vertical_door_pairs(level, snapshot.shufflable, must_beat_gannon)
+
+    for attempt in range(1, _MAX_CONNECTIVITY_RETRIES + 1):
+        snapshot.restore(level)
+
+        if not _shuffle_level(level, rng, snapshot):
+            call_stats.stuck += 1
             continue
-        visited.add(rn)
-        if rn not in room_by_num:
+
+        _fix_horizontal_door_pairs(level, rng, horizontal_pairs)
+        # Horizontal walls are final now, except that the special-room fixes
+        # may still turn some into SOLID_WALL. No later step opens one, so
+        # if the level is disconnected even with every vertical wall open,
+        # the attempt is doomed: skip the remaining fix-ups.
+        if not _is_level_connected(level, assume_vertical_open=True):
+            call_stats.early_aborts += 1
             continue
-        room = room_by_num[rn]
-        row, col = rn >> 4, rn & 0xF
-        # North
-        if row > 0 and room.walls.north != WallType.SOLID_WALL:
-            neighbor = rn - 16
-            if neighbor in level_room_nums and neighbor not in visited:
-                queue.append(neighbor)
-        # South
-        if row < 7 and room.walls.south != WallType.SOLID_WALL:
-            neighbor = rn + 16
-            if neighbor in level_room_nums and neighbor not in visited:
-                queue.append(neighbor)
-        # West
-        if col > 0 and room.walls.west != WallType.SOLID_WALL:
-            neighbor = rn - 1
-            if neighbor in level_room_nums and neighbor not in visited:
-                queue.append(neighbor)
-        # East
-        if col < 15 and room.walls.east != WallType.SOLID_WALL:
-            neighbor = rn + 1
-            if neighbor in level_room_nums and neighbor not in visited:
-                queue.append(neighbor)
-
-    # Follow transport staircases: if either exit is visited, both exits
-    # become seeds and we continue the fill.
-    changed = True
-    while changed:
-        changed = False
-        for sr in level.staircase_rooms:
-            if sr.room_num in visited:
-                continue
-            if sr.room_type != RoomType.TRANSPORT_STAIRCASE:
-                continue
-            assert sr.left_exit is not None and sr.right_exit is not None
-            if sr.left_exit in visited or sr.right_exit in visited:
-                visited.add(sr.room_num)
-                for exit_rn in (sr.left_exit, sr.right_exit):
-                    if exit_rn not in visited:
-                        queue.append(exit_rn)
-                        changed = True
-                # Re-fill from the new seeds.
-                while queue:
-                    rn = queue.pop()
-                    if rn in visited:
-                        continue
-                    visited.add(rn)
-                    if rn not in room_by_num:
-                        continue
-                    room = room_by_num[rn]
-                    row, col = rn >> 4, rn & 0xF
-                    if row > 0 and room.walls.north != WallType.SOLID_WALL:
-                        neighbor = rn - 16
-                        if neighbor in level_room_nums and neighbor not in visited:
-                            queue.append(neighbor)
-                    if row < 7 and room.walls.south != WallType.SOLID_WALL:
-                        neighbor = rn + 16
-                        if neighbor in level_room_nums and neighbor not in visited:
-                            queue.append(neighbor)
-                    if col > 0 and room.walls.west != WallType.SOLID_WALL:
-                        neighbor = rn - 1
-                        if neighbor in level_room_nums and neighbor not in visited:
-                            queue.append(neighbor)
-                    if col < 15 and room.walls.east != WallType.SOLID_WALL:
-                        neighbor = rn + 1
-                        if neighbor in level_room_nums and neighbor not in visited:
-                            queue.append(neighbor)
-
-    return level_room_nums.issubset(visited)
+        _fix_vertical_door_pairs(level, rng, must_beat_gannon, vertical_pairs)
+
+        _fix_special_rooms(level, levels)
+        _fix_peninsula_and_stairs(level)
+
+        if _is_level_connected(level):
+            call_stats.attempts[attempt] += 1
+            level_stats.add(call_stats)
+            return True
+        call_stats.disconnected += 1
+
+    call_stats.exhausted += 1
+    log.info("Level %d still disconnected after %d attempts (%d stuck, %d aborted early, %d disconnected)",
+             level.level_num, _MAX_CONNECTIVITY_RETRIES, call_stats.stuck,
+             call_stats.early_aborts, call_stats.disconnected)
+    level_stats.add(call_stats)
+    return False
+
+
+def _copy_level_state(level: Level, shuffled: Level) -> None:
+    """Copy everything a level shuffle writes from *shuffled* into *level*.
+
+    *shuffled* is a copy of *level* (e.g. returned by a worker process),
+    so their rooms and staircase rooms line up one to one.
+    """
+    for room, shuffled_room in zip(level.rooms, shuffled.rooms, strict=True):
+        _RoomSnapshot(shuffled_room).restore(room)
+    for sr, shuffled_sr in zip(level.staircase_rooms, shuffled.staircase_rooms, strict=True):
+        _StaircaseSnapshot(shuffled_sr).restore(sr)
+    level.entrance_room = shuffled.entrance_room
+
+
+def _shuffle_level_job(job: tuple[Level, int, bool]) -> tuple[Level | None, LevelShuffleStats]:
+    """Shuffle one level on its own RNG substream, for shuffle_dungeon_rooms(parallel=True).
+
+    Only touches *level*, so it can run in another thread or process.
+    Returns the shuffled level, or None if it could not be connected,
+    along with the job's retry counters for the caller to merge.
+    """
+    level, seed, must_beat_gannon = job
+    level_stats = LevelShuffleStats()
+    if not _shuffle_level_until_connected(level, [level], SeededRng(seed), must_beat_gannon, level_stats):
+        return None, level_stats
+    return level, level_stats
 
 
 def shuffle_dungeon_rooms(
     world: GameWorld,
     rng: Rng,
     must_beat_gannon: bool = True,
+    parallel: bool = False,
+    executor: Executor | None = None,
 ) -> bool:
     """Shuffle dungeon room positions within each level.
 
@@ -1499,40 +1687,45 @@ def shuffle_dungeon_rooms(
     and boss cry bits are cleared. Each level is then checked for full
     connectivity (all rooms reachable from the entrance via non-solid
     walls and transport staircases). If a level isn't connected, the
-    shuffle is retried for that level.
+    shuffle is retried for that level. Attempts are counted per level in
+    the module's process-wide stats.
 
     Args:
         world: The game world to modify.
         rng: Seeded RNG for deterministic output.
         must_beat_gannon: If True, enforce door lock constraints that ensure
             the player must fight Gannon to reach Zelda.
+        parallel: If True, draw one seed per level from *rng* up front and
+            shuffle each level on its own substream, so levels no longer
+            depend on each other's RNG use and can run concurrently. This
+            gives different results from the default sequential stream.
+        executor: With parallel=True, run the levels on this executor (a
+            process pool, or a thread pool on a free-threaded build) instead
+            of in this thread. Results are merged in level order, so the
+            output is the same with or without an executor. Results from
+            other processes are copied back into the existing Level, Room
+            and StaircaseRoom objects, so world.levels keeps its identity.
 
     Returns:
         True on success, False if any level's shuffle exhausted its retry
         budget (caller should retry the entire seed generation).
     """
-    for level in world.levels:
-        snapshot = _LevelSnapshot(level)
-        connected = False
-
-        for _attempt in range(_MAX_CONNECTIVITY_RETRIES):
-            snapshot.restore(level)
-
-            if not _shuffle_level(level, rng):
-                continue
-
-            _fix_horizontal_door_pairs(level, rng)
-            _fix_vertical_door_pairs(level, rng, must_beat_gannon)
-
-            _fix_special_rooms(level, world)
-            _fix_peninsula_and_stairs(level, world)
-
-            if _is_level_connected(level):
-                connected = True
-                break
-
-        if not connected:
+    if parallel:
+        jobs = [(level, int(rng.random() * 2**32), must_beat_gannon) for level in world.levels]
+        outcomes = list(executor.map(_shuffle_level_job, jobs) if executor else map(_shuffle_level_job, jobs))
+        for level, (_, level_stats) in zip(world.levels, outcomes, strict=True):
+            stats.levels[level.level_num].add(level_stats)
+        if any(shuffled is None for shuffled, _ in outcomes):
             return False
+        # Out-of-process workers return copies; write them back into the
+        # original objects so references held by the caller stay live.
+        for level, (shuffled, _) in zip(world.levels, outcomes, strict=True):
+            if shuffled is not level and shuffled is not None:
+                _copy_level_state(level, shuffled)
+    else:
+        for level in world.levels:
+            if not _shuffle_level_until_connected(level, world.levels, rng, must_beat_gannon):
+                return False
 
     # Phase 9 in the C#: clear boss cry bits on all rooms in the grid.
     _clear_boss_cry_bits(world)
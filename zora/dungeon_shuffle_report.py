@@ -0,0 +1,107 @@
+"""
+Sample dungeon room shuffles and report how many attempts each level needs.
+
+Each seed shuffles a freshly parsed vanilla world with shuffle_dungeon_rooms
+and reads the process-wide retry counters it keeps. Per level, every
+attempt ends in success or in the first check it failed:
+  stuck      the content shuffle found no valid target for some room
+  early      disconnected right after the horizontal door pass, even with
+             every vertical wall assumed open
+  disconn    disconnected after all fix-ups
+A level that fails _MAX_CONNECTIVITY_RETRIES attempts is "exhausted" and
+fails the whole shuffle; the pipeline then retries with a new game world.
+
+The histograms show how many attempts successful shuffles needed, to judge
+how close the retry budget is to the tail.
+
+Usage:
+    python3 -m zora.dungeon_shuffle_report [--seeds 200] [--parallel]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from zora.dungeon import shuffle_dungeon_rooms as sdr
+from zora.parser import load_bin_files, parse_game_world
+from zora.rng import SeededRng
+
+BIN_DIR = Path(__file__).resolve().parents[1] / "rom_data"
+
+_BAR_WIDTH = 40
+
+
+def _buckets(limit: int) -> list[tuple[int, int]]:
+    """Power-of-two attempt ranges (1, 2, 3-4, 5-8, ...) up to limit."""
+    buckets = []
+    low = 1
+    while low <= limit:
+        high = min(max(low, 2 * (low - 1)), limit)
+        buckets.append((low, high))
+        low = high + 1
+    return buckets
+
+
+def _percentile(attempts: Counter[int], fraction: float) -> int:
+    target = fraction * sum(attempts.values())
+    seen = 0
+    for n in sorted(attempts):
+        seen += attempts[n]
+        if seen >= target:
+            return n
+    return 0
+
+
+def _print_histogram(attempts: Counter[int], exhausted: int) -> None:
+    rows = [(f"{low}" if low == high else f"{low}-{high}",
+             sum(attempts[n] for n in range(low, high + 1)))
+            for low, high in _buckets(sdr._MAX_CONNECTIVITY_RETRIES)]
+    rows.append(("exhausted", exhausted))
+    peak = max(count for _, count in rows) or 1
+    for label, count in rows:
+        if count:
+            print(f"    {label:>9} {count:>6} {'#' * max(1, round(_BAR_WIDTH * count / peak))}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Report dungeon room shuffle retry statistics")
+    parser.add_argument("--seeds", type=int, default=200, help="Number of seeds, starting at 1 (default: 200)")
+    parser.add_argument("--parallel", action="store_true",
+                        help="Shuffle each level on its own RNG substream (dungeon_shuffle_workers >= 1)")
+    args = parser.parse_args()
+
+    bins = load_bin_files(BIN_DIR)
+    failures = 0
+    start = time.perf_counter()
+    for seed in range(1, args.seeds + 1):
+        if not sdr.shuffle_dungeon_rooms(parse_game_world(bins), SeededRng(seed), parallel=args.parallel):
+            failures += 1
+    elapsed = time.perf_counter() - start
+
+    print(f"seeds: {args.seeds} ({failures} failed), {1000 * elapsed / args.seeds:.1f} ms/seed, "
+          f"budget: {sdr._MAX_CONNECTIVITY_RETRIES} attempts per level")
+    print()
+    print(f"{'level':<6} {'shuffles':>8} {'attempts':>8} {'stuck':>6} {'early':>6} {'disconn':>7} "
+          f"{'exhausted':>9} {'p50':>4} {'p99':>4} {'max':>4}")
+    for level_num in sorted(sdr.stats.levels):
+        s = sdr.stats.levels[level_num]
+        total = sum(n * count for n, count in s.attempts.items()) + s.exhausted * sdr._MAX_CONNECTIVITY_RETRIES
+        print(f"L{level_num:<5} {s.shuffles:>8} {total:>8} {s.stuck:>6} {s.early_aborts:>6} {s.disconnected:>7} "
+              f"{s.exhausted:>9} {_percentile(s.attempts, 0.5):>4} {_percentile(s.attempts, 0.99):>4} "
+              f"{max(s.attempts, default=0):>4}")
+
+    for level_num in sorted(sdr.stats.levels):
+        s = sdr.stats.levels[level_num]
+        print()
+        print(f"L{level_num}: attempts per successful shuffle")
+        _print_histogram(s.attempts, s.exhausted)
+
+
+if __name__ == "__main__":
+    main()
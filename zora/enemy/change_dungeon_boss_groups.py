@@ -8,6 +8,8 @@ its group's new pool.
 Ported from changeDungeonBossGroups (change_dungeon_boss_groups.cs).
 """
 
+from functools import lru_cache
+
 from zora.data_model import (
     BossSpriteSet,
     Enemy,
@@ -16,13 +18,16 @@ from zora.data_model import (
     RoomType,
     SpriteData,
 )
-from zora.enemy.safety_checks import is_safe_for_room
+from zora.enemy.group_packing import PackingProblem, sample_packing
+from zora.enemy.safety_checks import is_safe_for_room, safe_enemies
 from zora.rng import Rng
 
-# Maximum retries when assigning a boss to a group with insufficient column budget.
+# Maximum retries when assigning a boss to a group with insufficient column budget
+# (legacy_sampling only).
 _MAX_ASSIGNMENT_RETRIES = 1000
 
-# Maximum retries when a safety check rejects a random boss pick for a room.
+# Maximum retries when a safety check rejects a random boss pick for a room
+# (legacy_sampling only; otherwise picks come from the safe members).
 _MAX_ROOM_RETRIES = 1000
 
 
@@ -186,13 +191,19 @@ _COL_START_EXPANSION = 48  # group 3 (boss_set_expansion)
 # Sprite packing.
 # ---------------------------------------------------------------------------
 
-def _read_boss_tiles(sprites: SpriteData, boss: Enemy) -> bytes:
-    """Extract a boss's sprite tile data from its vanilla sprite set."""
-    vanilla_set = _VANILLA_SPRITE_SET[boss]
-    source = getattr(sprites, _GROUP_SPRITE_ATTR[_GROUP_ORDER.index(vanilla_set)])
-    offset = _SPRITE_OFFSET[boss]
-    size = _SPRITE_SIZE[boss]
-    return bytes(source[offset:offset + size])
+@lru_cache(maxsize=4)
+def _vanilla_tile_blocks(set_a: bytes, set_b: bytes, set_c: bytes) -> dict[Enemy, bytes]:
+    """Every boss's tile data, sliced once per distinct set of source banks.
+
+    Keyed on the bank contents, so worlds parsed from the same ROM share one
+    entry.  The returned dict is shared between callers and must not be
+    modified.
+    """
+    banks = dict(zip(_GROUP_ORDER, (set_a, set_b, set_c), strict=True))
+    return {
+        boss: banks[vanilla_set][_SPRITE_OFFSET[boss]:_SPRITE_OFFSET[boss] + _SPRITE_SIZE[boss]]
+        for boss, vanilla_set in _VANILLA_SPRITE_SET.items()
+    }
 
 
 def _repack_boss_sprites(
@@ -214,9 +225,9 @@ def _repack_boss_sprites(
     engine column number where its tile data starts in the target set.
     """
     # Read all boss tile data from the vanilla sets before overwriting.
-    tile_cache: dict[Enemy, bytes] = {}
-    for boss in _VANILLA_SPRITE_SET:
-        tile_cache[boss] = _read_boss_tiles(sprites, boss)
+    tile_cache = _vanilla_tile_blocks(
+        bytes(sprites.boss_set_a), bytes(sprites.boss_set_b), bytes(sprites.boss_set_c),
+    )
 
     # Maps each boss to its starting engine column in the new set.
     column_assignments: dict[Enemy, int] = {}
@@ -343,18 +354,47 @@ def _update_tile_frames(
 # Main entry point.
 # ---------------------------------------------------------------------------
 
-def change_dungeon_boss_groups(world: GameWorld, rng: Rng) -> None:
+def _sample_boss_groups(
+    primary_bosses: list[Enemy],
+    special_boss: Enemy,
+    group_budget: list[int],
+    rng: Rng,
+) -> list[int]:
+    """Draw the group (0-3) of each primary boss from all assignments that fit.
+
+    The special boss goes to the shared group (3).  Every boss is placed;
+    the budgets leave room for all of them, so unlike the retry loop no boss
+    is ever dropped.
+    """
+    everywhere = (1 << len(group_budget)) - 1
+    problem = PackingProblem(
+        costs=tuple(_BOSS_TILE_COLUMNS_WITH_COMPANION.get(b, _BOSS_TILE_COLUMNS[b]) for b in primary_bosses),
+        budgets=tuple(group_budget),
+        allowed=tuple(1 << 3 if b == special_boss else everywhere for b in primary_bosses),
+    )
+    packing = sample_packing(problem, rng)
+    if packing is None:
+        raise RuntimeError("change_dungeon_boss_groups: the bosses do not fit the group budgets")
+    return packing
+
+
+def change_dungeon_boss_groups(world: GameWorld, rng: Rng, legacy_sampling: bool = False) -> None:
     """Redistribute bosses across the three boss sprite-set groups.
 
     1. Sort bosses by sprite size (descending) so largest bosses are placed first.
     2. Randomly pick a "special boss" forced into the shared pool.
     3. Assign each boss to a random group (0-2) or the shared pool (3),
-       respecting each group's sprite tile column budget.
+       respecting each group's sprite tile column budget.  The assignment
+       is drawn uniformly from the ones that fit, or with legacy_sampling
+       by random picks retried while the group is full.
     4. Expand variant bosses into each group.
     5. Merge the shared pool into all three groups.
     6. For every room whose current enemy belongs to a vanilla boss group,
        replace it with a random boss from the same group's new pool,
-       respecting room-type safety checks.
+       respecting room-type safety checks. The boss is drawn from the
+       pool members that are safe for the room, or with legacy_sampling
+       (for the same seeds as earlier versions) picked from the whole pool
+       and retried while unsafe.
 
     Only Q1 levels (1-9) are processed.
     """
@@ -371,50 +411,60 @@ def change_dungeon_boss_groups(world: GameWorld, rng: Rng) -> None:
 
     # --- Pick a special boss to force into the shared group ---
     special_boss = rng.choice(_SPECIAL_BOSSES)
-    group_budget[3] -= _SPECIAL_RESTORE[special_boss]
 
     # --- Assignment: 4 groups (0=A, 1=B, 2=C, 3=shared) ---
+    # Drawn uniformly from the assignments that fit every boss, or with
+    # legacy_sampling by random picks retried while the group is full.
     # Each group accumulates a list of primary boss enemies.
     group_bosses: list[list[Enemy]] = [[] for _ in range(4)]
 
-    retry_count = 0
+    if not legacy_sampling:
+        packing = _sample_boss_groups(primary_bosses, special_boss, group_budget, rng)
+        for boss, group in zip(primary_bosses, packing, strict=True):
+            group_bosses[group].append(boss)
+    else:
+        # The special boss's columns are held back from the shared group
+        # until it is placed there.
+        group_budget[3] -= _SPECIAL_RESTORE[special_boss]
 
-    i = 0
-    while i < len(primary_bosses):
-        boss = primary_bosses[i]
+        retry_count = 0
 
-        # Columns needed, including companion sprites where applicable.
-        columns = _BOSS_TILE_COLUMNS_WITH_COMPANION.get(
-            boss, _BOSS_TILE_COLUMNS[boss],
-        )
+        i = 0
+        while i < len(primary_bosses):
+            boss = primary_bosses[i]
 
-        # Pick a random group (0-3).
-        group = int(rng.random() * 4)
+            # Columns needed, including companion sprites where applicable.
+            columns = _BOSS_TILE_COLUMNS_WITH_COMPANION.get(
+                boss, _BOSS_TILE_COLUMNS[boss],
+            )
 
-        # Special boss is forced into group 3 (shared), with budget restored.
-        if boss == special_boss:
-            group = 3
-            group_budget[3] += _SPECIAL_RESTORE[special_boss]
+            # Pick a random group (0-3).
+            group = int(rng.random() * 4)
 
-        # Check whether the group has enough columns remaining.
-        if columns <= group_budget[group]:
-            group_budget[group] -= columns
-            group_bosses[group].append(boss)
+            # Special boss is forced into group 3 (shared), with budget restored.
+            if boss == special_boss:
+                group = 3
+                group_budget[3] += _SPECIAL_RESTORE[special_boss]
 
-            # Companion bosses (DIGDOGGER_SPAWN, FLYING_GLEEOK_HEAD,
-            # PATRA_SPAWN) share a sprite set with their primary but are NOT
-            # added to the replacement pool.  Their sprite tile data is
-            # packed alongside their primary in _repack_boss_sprites.
+            # Check whether the group has enough columns remaining.
+            if columns <= group_budget[group]:
+                group_budget[group] -= columns
+                group_bosses[group].append(boss)
+
+                # Companion bosses (DIGDOGGER_SPAWN, FLYING_GLEEOK_HEAD,
+                # PATRA_SPAWN) share a sprite set with their primary but are NOT
+                # added to the replacement pool.  Their sprite tile data is
+                # packed alongside their primary in _repack_boss_sprites.
 
-            retry_count = 0
-            i += 1
-        else:
-            # Retry same boss with a new random group.
-            retry_count += 1
-            if retry_count > _MAX_ASSIGNMENT_RETRIES:
-                # Skip this boss to prevent infinite loop.
                 retry_count = 0
                 i += 1
+            else:
+                # Retry same boss with a new random group.
+                retry_count += 1
+                if retry_count > _MAX_ASSIGNMENT_RETRIES:
+                    # Skip this boss to prevent infinite loop.
+                    retry_count = 0
+                    i += 1
 
     # --- Repack sprite tile data to match the new group assignments ---
     column_assignments = _repack_boss_sprites(world.sprites, group_bosses)
@@ -493,6 +543,12 @@ def change_dungeon_boss_groups(world: GameWorld, rng: Rng) -> None:
             if not pool:
                 continue
 
+            if not legacy_sampling:
+                candidates = safe_enemies(pool, room.room_type, has_push_block=room.movable_block)
+                if candidates:
+                    room.enemy_spec.enemy = rng.choice(candidates)
+                continue
+
             # Pick a random replacement, retrying on safety failures.
             for _attempt in range(_MAX_ROOM_RETRIES):
                 new_boss = rng.choice(pool)
@@ -10,6 +10,9 @@ Ported from changeDungeonEnemyGroups (change_dungeon_enemy_groups.cs).
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from functools import lru_cache
+
 from zora.data_model import (
     SCREEN_ENTRANCE_TYPES,
     Enemy,
@@ -20,20 +23,24 @@ from zora.data_model import (
     RoomType,
     SpriteData,
 )
-from zora.enemy.safety_checks import is_safe_for_room
+from zora.enemy.group_packing import PackingProblem, sample_packing
+from zora.enemy.safety_checks import is_safe_for_room, safe_enemies
 from zora.rng import Rng
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
-# Maximum retries for the outer assignment loop (re-rolling all group assignments).
+# Maximum retries for the outer assignment loop (re-rolling all group assignments;
+# legacy_sampling only, otherwise assignments are drawn from the feasible ones).
 _MAX_OUTER_RETRIES = 1000
 
-# Maximum retries when the inner assignment loop fails to place a single enemy.
+# Maximum retries when the inner assignment loop fails to place a single enemy
+# (legacy_sampling only).
 _MAX_ASSIGNMENT_RETRIES = 1000
 
-# Maximum retries when a safety check rejects a random enemy pick for a room.
+# Maximum retries when a safety check rejects a random enemy pick for a room
+# (legacy_sampling only; otherwise picks come from the safe members).
 _MAX_ROOM_RETRIES = 1000
 
 
@@ -327,13 +334,101 @@ def _screen_has_enemy(screen_enemy: Enemy, target: Enemy,
 # Sprite packing
 # ---------------------------------------------------------------------------
 
-def _read_enemy_tiles(sprites: SpriteData, enemy: Enemy) -> bytes:
-    """Extract an enemy's sprite tile data from its vanilla sprite set."""
-    sprite_set = _VANILLA_SPRITE_SET[enemy]
-    source = getattr(sprites, _GROUP_SPRITE_ATTR[sprite_set])
-    offset = _SPRITE_OFFSET[enemy]
-    size = _SPRITE_SIZE[enemy]
-    return bytes(source[offset:offset + size])
+def _slot_mask(slots: Iterable[int]) -> int:
+    """Bitmask with one bit set per engine column slot."""
+    mask = 0
+    for s in slots:
+        mask |= 1 << s
+    return mask
+
+
+# Columns the packer may hand out: _COL_START up to (not including) 256.
+_PACKABLE_SLOTS_MASK = _slot_mask(range(_COL_START, 256))
+
+# The C# marks all 256 slots reserved for the OW group, then opens the
+# regions where OW enemy sprites can be packed.
+_OW_RESERVED_SLOTS_MASK = _slot_mask(range(256)) & ~_slot_mask(
+    s for base, size in ((206, 16), (202, 4), (240, 16)) for s in range(base, base + size)
+)
+
+# Wallmaster's fixed bank position: its sprite data at byte offset 224, after
+# the 32-byte shared block at offset 0.
+_WALLMASTER_BANK_OFFSET = 224
+_WALLMASTER_COLUMNS: list[int] = list(range(
+    _COL_START + _WALLMASTER_BANK_OFFSET // 16,
+    _COL_START + _WALLMASTER_BANK_OFFSET // 16 + _ENEMY_TILE_COLUMNS[Enemy.WALLMASTER],
+))
+
+# Slots reserved by a group containing Wallmaster: the shared block, its own
+# columns and its extra engine slots.
+_WALLMASTER_RESERVED_SLOTS_MASK = (
+    _slot_mask(range(_COL_START, _COL_START + _WALLMASTER_SHARED_BLOCK_SIZE // 16))
+    | _slot_mask(_WALLMASTER_COLUMNS)
+    | _slot_mask(_WALLMASTER_EXTRA_SLOTS)
+)
+
+_LANMOLA_RESERVED_SLOTS_MASK = _slot_mask(_LANMOLA_RESERVED_SLOTS)
+
+
+def _start_enemy_columns(start_enemy: Enemy) -> list[int]:
+    """Engine columns of the start enemy, packed at the top of the bank."""
+    cols = _ENEMY_TILE_COLUMNS[start_enemy]
+    return list(range(192 - cols, 192))
+
+
+def _claim_slots(slot_used: int, count: int) -> tuple[list[int], int]:
+    """Claim up to ``count`` free slots, lowest first, from _COL_START up.
+
+    Returns the claimed slots and the updated reservation mask.  Fewer than
+    ``count`` slots come back if the packable range runs out.
+    """
+    free = ~slot_used & _PACKABLE_SLOTS_MASK
+    slots: list[int] = []
+    while free and len(slots) < count:
+        lowest = free & -free
+        slots.append(lowest.bit_length() - 1)
+        free ^= lowest
+        slot_used |= lowest
+    return slots, slot_used
+
+
+def _write_columns(target: bytearray, slots: list[int], data: bytes, prefix: int) -> None:
+    """Write consecutive 16-byte columns of ``data`` to the given slots.
+
+    Runs of adjacent slots are written with a single slice assignment.
+    """
+    run_start = 0
+    for i in range(1, len(slots) + 1):
+        if i < len(slots) and slots[i] == slots[i - 1] + 1:
+            continue
+        offset = (slots[run_start] - _COL_START) * 16 + prefix
+        end = offset + (i - run_start) * 16
+        if end > len(target):
+            raise IndexError(f"sprite column {slots[i - 1]} is outside the {len(target)}-byte bank")
+        target[offset:end] = data[run_start * 16:i * 16]
+        run_start = i
+
+
+@lru_cache(maxsize=4)
+def _vanilla_tile_blocks(set_a: bytes, set_b: bytes, set_c: bytes) -> dict[Enemy, bytes]:
+    """Every enemy's tile data, sliced once per distinct set of source banks.
+
+    Keyed on the bank contents, so worlds parsed from the same ROM share one
+    entry.  The returned dict is shared between callers and must not be
+    modified.
+    """
+    banks = {EnemySpriteSet.A: set_a, EnemySpriteSet.B: set_b, EnemySpriteSet.C: set_c}
+    return {
+        enemy: banks[sprite_set][_SPRITE_OFFSET[enemy]:_SPRITE_OFFSET[enemy] + _SPRITE_SIZE[enemy]]
+        for enemy, sprite_set in _VANILLA_SPRITE_SET.items()
+    }
+
+
+def _read_all_enemy_tiles(sprites: SpriteData) -> dict[Enemy, bytes]:
+    """Tile data of every enemy with its own sprites, read before repacking."""
+    return _vanilla_tile_blocks(
+        bytes(sprites.enemy_set_a), bytes(sprites.enemy_set_b), bytes(sprites.enemy_set_c),
+    )
 
 
 def _read_wallmaster_shared_block(sprites: SpriteData) -> bytes:
@@ -376,9 +471,7 @@ def _repack_enemy_sprites(
     in between were reserved by Wallmaster, Lanmola, or the start enemy.
     """
     # Read all enemy tile data from vanilla sets before overwriting.
-    tile_cache: dict[Enemy, bytes] = {}
-    for enemy in _VANILLA_SPRITE_SET:
-        tile_cache[enemy] = _read_enemy_tiles(sprites, enemy)
+    tile_cache = _read_all_enemy_tiles(sprites)
 
     # Maps each enemy to the ordered list of engine column numbers where
     # its tile columns were placed.  Used by _update_tile_frames to remap
@@ -391,74 +484,34 @@ def _repack_enemy_sprites(
 
         enemies_in_group = group_enemies[sprite_set]
         target = getattr(sprites, _GROUP_SPRITE_ATTR[sprite_set])
+        prefix = _OW_BANK_PREFIX if sprite_set == EnemySpriteSet.OW else 0
 
-        # Track which column slots are used (relative to _COL_START).
-        # The bank has 34 columns: slots _COL_START to _COL_START+33.
-        slot_used = [False] * 768  # Oversized to match C#'s obj47
-
-        # --- Overworld group slot reservation ---
-        # The C# marks ALL 256 slots as reserved for the OW group, then
-        # opens specific regions where OW enemy sprites can be packed.
-        if sprite_set == EnemySpriteSet.OW:
-            ow_region_bases = [206, 202, 240]
-            ow_region_sizes = [16, 4, 16]
-            for s in range(256):
-                slot_used[s] = True
-            for base, size in zip(ow_region_bases, ow_region_sizes):
-                for s in range(base, base + size):
-                    slot_used[s] = False
+        # Reserved engine column slots, one bit per slot (the C#'s obj47).
+        slot_used = _OW_RESERVED_SLOTS_MASK if sprite_set == EnemySpriteSet.OW else 0
 
         # --- Wallmaster special handling ---
         if Enemy.WALLMASTER in enemies_in_group:
-            # Write shared block at bank offset 0 (2 columns)
-            for k in range(len(wallmaster_shared_block)):
-                target[k] = wallmaster_shared_block[k]
-
-            # Write Wallmaster sprite data at bank offset 224 (4 columns)
+            # Shared block at bank offset 0 (2 columns), then Wallmaster's
+            # own sprite data at bank offset 224 (4 columns).
+            target[0:len(wallmaster_shared_block)] = wallmaster_shared_block
             wm_data = tile_cache[Enemy.WALLMASTER]
-            wm_offset = 224
-            for k in range(len(wm_data)):
-                target[wm_offset + k] = wm_data[k]
-
-            # Record Wallmaster's column assignment (single fixed position).
-            # Column = _COL_START + (byte_offset / 16) = 158 + 14 = 172
-            wm_start_col = _COL_START + wm_offset // 16
-            wm_cols = len(wm_data) // 16
-            column_assignments[Enemy.WALLMASTER] = list(
-                range(wm_start_col, wm_start_col + wm_cols)
-            )
-
-            # Reserve the shared block slots and Wallmaster's own slots.
-            shared_cols = len(wallmaster_shared_block) // 16
-            for s in range(shared_cols):
-                slot_used[_COL_START + s] = True
-            for s in range(wm_start_col, wm_start_col + wm_cols):
-                slot_used[s] = True
-
-            # Reserve Wallmaster's extra engine slots.
-            for s in _WALLMASTER_EXTRA_SLOTS:
-                slot_used[s] = True
+            target[_WALLMASTER_BANK_OFFSET:_WALLMASTER_BANK_OFFSET + len(wm_data)] = wm_data
+            column_assignments[Enemy.WALLMASTER] = list(_WALLMASTER_COLUMNS)
+            slot_used |= _WALLMASTER_RESERVED_SLOTS_MASK
 
         # --- Lanmola special handling ---
         if Enemy.RED_LANMOLA in enemies_in_group:
             # Lanmola sprite data at bank offset 0 (4 columns)
             lm_data = tile_cache[Enemy.RED_LANMOLA]
-            for k in range(len(lm_data)):
-                target[k] = lm_data[k]
-
-            # Reserve slots 158-161
-            for s in _LANMOLA_RESERVED_SLOTS:
-                slot_used[s] = True
+            target[0:len(lm_data)] = lm_data
+            slot_used |= _LANMOLA_RESERVED_SLOTS_MASK
 
         # --- Start enemy slot reservation ---
         # The start enemy is packed at the top of the bank by
         # _repack_start_enemy (column = 192 - cols).  Reserve those slots
         # so the main loop doesn't pack anything there.
         if start_enemy in enemies_in_group and start_enemy in tile_cache:
-            se_cols = len(tile_cache[start_enemy]) // 16
-            se_pos = 192 - se_cols
-            for s in range(se_pos, se_pos + se_cols):
-                slot_used[s] = True
+            slot_used |= _slot_mask(_start_enemy_columns(start_enemy))
 
         # --- Main packing loop for remaining enemies ---
         for enemy in enemies_in_group:
@@ -472,33 +525,9 @@ def _repack_enemy_sprites(
                 continue  # Companion variants don't have their own tiles
 
             data = tile_cache[enemy]
-            cols_needed = len(data) // 16
-            slot_base = _COL_START
-            assigned_cols: list[int] = []
-
-            for col_idx in range(cols_needed):
-                # Find next free slot
-                while slot_base < 256 and slot_used[slot_base]:
-                    slot_base += 1
-
-                if slot_base >= 256:
-                    break
-
-                slot_used[slot_base] = True
-                assigned_cols.append(slot_base)
-
-                # Write 16 bytes of sprite data
-                rom_offset = (slot_base - _COL_START) * 16
-                if sprite_set == EnemySpriteSet.OW:
-                    rom_offset += _OW_BANK_PREFIX
-                src_offset = col_idx * 16
-                for t in range(16):
-                    if src_offset + t < len(data):
-                        target[rom_offset + t] = data[src_offset + t]
-
-                slot_base += 1
-
+            assigned_cols, slot_used = _claim_slots(slot_used, len(data) // 16)
             if assigned_cols:
+                _write_columns(target, assigned_cols, data, prefix)
                 column_assignments[enemy] = assigned_cols
 
     return column_assignments
@@ -522,6 +551,7 @@ def _repack_start_enemy(
     data = tile_cache[start_enemy]
     cols = len(data) // 16
     pos_base = 192 - cols  # Place at top of bank
+    rom_offset = (pos_base - _COL_START) * 16
 
     for sprite_set, enemies in group_enemies.items():
         if start_enemy not in enemies:
@@ -530,9 +560,7 @@ def _repack_start_enemy(
             continue
 
         target = getattr(sprites, _GROUP_SPRITE_ATTR[sprite_set])
-        rom_offset = (pos_base - _COL_START) * 16
-        for k in range(len(data)):
-            target[rom_offset + k] = data[k]
+        target[rom_offset:rom_offset + len(data)] = data
 
     return list(range(pos_base, pos_base + cols))
 
@@ -766,6 +794,74 @@ def _assign_enemies_to_groups(
     return group_lists
 
 
+def _sample_enemy_groups(
+    sorted_enemies: list[Enemy],
+    start_enemy: Enemy,
+    rng: Rng,
+    overworld: bool,
+    force_wizzrobes_to_9: bool,
+    vire_is_wizzrobe_compat: bool,
+) -> dict[EnemySpriteSet, list[Enemy]] | None:
+    """Draw a group assignment uniformly from all that satisfy the constraints.
+
+    Same constraints and pre-seeding as ``_assign_enemies_to_groups``, but
+    no pick is ever rejected: see ``group_packing``.  Groups list their
+    enemies in the same order as ``_assign_enemies_to_groups`` builds them.
+
+    Returns None if no assignment satisfies the constraints.
+    """
+    num_groups = 4 if overworld else 3
+    groups = _GROUP_ORDER[:num_groups]
+    wizzrobe_compat = set(_WIZZROBE_COMPAT_BASE)
+    if vire_is_wizzrobe_compat:
+        wizzrobe_compat.add(Enemy.VIRE)
+
+    group_lists: dict[EnemySpriteSet, list[Enemy]] = {group: [] for group in groups}
+    group_lists[EnemySpriteSet.B].append(start_enemy)
+    group_lists[EnemySpriteSet.C].append(start_enemy)
+    if force_wizzrobes_to_9:
+        group_lists[EnemySpriteSet.C].append(Enemy.RED_WIZZROBE)
+
+    # Items in a fixed order, largest first to keep the search small, so each
+    # problem is solved once per start enemy and flags whatever the sort's
+    # tie-breaks were.
+    items = sorted(
+        (e for e in _ENEMY_TILE_COLUMNS
+         if e != start_enemy and not (e == Enemy.RED_WIZZROBE and force_wizzrobes_to_9)),
+        key=_effective_column_cost, reverse=True,
+    )
+    budgets = [_GROUP_CAPACITY - sum(_effective_column_cost(e) for e in group_lists[group]) for group in groups]
+    if overworld:
+        # C#: capacity[3] starts at -2, a budget of 36 columns.
+        budgets[3] += 2
+    everywhere = (1 << num_groups) - 1
+    problem = PackingProblem(
+        costs=tuple(_effective_column_cost(e) for e in items),
+        budgets=tuple(budgets),
+        allowed=tuple(everywhere & ~(1 << 3) if e in _FORBIDDEN_FROM_OVERWORLD else everywhere for e in items),
+        exclusive=tuple(
+            (items.index(a), items.index(b))
+            for a, b in _MUTUALLY_EXCLUSIVE
+            if a in items and b in items and a < b
+        ),
+        covers=sum(1 << i for i, e in enumerate(items) if e in wizzrobe_compat),
+        must_cover=everywhere,
+        covered=sum(
+            1 << g for g, group in enumerate(groups)
+            if any(e in wizzrobe_compat for e in group_lists[group])
+        ),
+    )
+    packing = sample_packing(problem, rng)
+    if packing is None:
+        return None
+
+    group_of = dict(zip(items, packing, strict=True))
+    for enemy in sorted_enemies:
+        if enemy in group_of:
+            group_lists[_GROUP_ORDER[group_of[enemy]]].append(enemy)
+    return group_lists
+
+
 # ---------------------------------------------------------------------------
 # Overworld replacement
 # ---------------------------------------------------------------------------
@@ -774,12 +870,16 @@ def _replace_overworld_enemies(
     world: GameWorld,
     rng: Rng,
     group_enemies: dict[EnemySpriteSet, list[Enemy]],
+    legacy_sampling: bool = False,
 ) -> None:
     """Replace overworld screen enemies based on the new OW sprite group.
 
     Safety constraints:
     - Blue Moblins can't go on bracelet-required screens.
     - Wizzrobes can't go on certain banned screens.
+
+    Each screen draws from the pool members that satisfy them, or with
+    legacy_sampling picks from the whole pool and retries unsafe picks.
     """
     ow_pool = group_enemies.get(EnemySpriteSet.OW, [])
     if not ow_pool:
@@ -826,19 +926,26 @@ def _replace_overworld_enemies(
         # always falls through — every unflagged screen and every
         # dangerous-flagged screen gets a replacement from the OW pool.
 
+        # Blue Moblin can't go on bracelet-required screens; wizzrobes
+        # can't go on banned screens.
+        banned: set[Enemy] = set()
+        if _needs_bracelet(screen.screen_num):
+            banned.add(Enemy.BLUE_MOBLIN)
+        if screen.screen_num in _BAD_FOR_WIZZROBE_SCREENS:
+            banned.update((Enemy.RED_WIZZROBE, Enemy.BLUE_WIZZROBE))
+
+        if not legacy_sampling:
+            candidates = [e for e in ow_pool if e not in banned]
+            if candidates:
+                screen.enemy_spec.enemy = rng.choice(candidates)
+            continue
+
         # Pick a random replacement from the overworld pool.
         for _attempt in range(_MAX_ROOM_RETRIES):
             new_enemy = rng.choice(ow_pool)
-
-            # Blue Moblin can't go on bracelet-required screens.
-            if new_enemy == Enemy.BLUE_MOBLIN and _needs_bracelet(screen.screen_num):
+            if new_enemy in banned:
                 continue
 
-            # Wizzrobes can't go on banned screens.
-            if new_enemy in (Enemy.RED_WIZZROBE, Enemy.BLUE_WIZZROBE):
-                if screen.screen_num in _BAD_FOR_WIZZROBE_SCREENS:
-                    continue
-
             screen.enemy_spec.enemy = new_enemy
             break
 
@@ -852,6 +959,7 @@ def change_dungeon_enemy_groups(
     rng: Rng,
     overworld: bool = False,
     force_wizzrobes_to_9: bool = False,
+    legacy_sampling: bool = False,
 ) -> None:
     """Redistribute enemies across the three (or four) enemy sprite-set groups.
 
@@ -859,6 +967,7 @@ def change_dungeon_enemy_groups(
     2. Pick a "start enemy" (small, not Lanmola) shared between groups B and C.
     3. Assign each enemy to a random group (A/B/C, optionally OW), respecting
        column budgets, mutual exclusion, and wizzrobe-compat constraints.
+       The assignment is drawn uniformly from the ones that satisfy them.
     4. Repack sprite tile data into the target sets.
     5. Update tile frame mappings so the engine finds sprites in the new sets.
     6. Duplicate tile frames from primaries to companion variants.
@@ -873,10 +982,14 @@ def change_dungeon_enemy_groups(
         rng: Seeded RNG for deterministic output.
         overworld: If True, also shuffle enemies in the overworld sprite group.
         force_wizzrobes_to_9: If True, force RED_WIZZROBE into group C.
+        legacy_sampling: If True, assign groups and pick room and screen
+            replacements by pick-and-retry like the original, for the same
+            seeds as earlier versions, instead of drawing from the feasible
+            assignments and the safe members of the pool.
     """
     # --- Build the sorted enemy list ---
-    safe_enemies = list(_ENEMY_TILE_COLUMNS.keys())
-    sorted_enemies = _sort_enemies_by_tile_columns(safe_enemies, rng)
+    tiled_enemies = list(_ENEMY_TILE_COLUMNS.keys())
+    sorted_enemies = _sort_enemies_by_tile_columns(tiled_enemies, rng)
 
     # --- Pick start enemy ---
     start_enemy = _pick_start_enemy(sorted_enemies, rng)
@@ -886,26 +999,36 @@ def change_dungeon_enemy_groups(
     vire_hp = world.enemies.hp.get(Enemy.VIRE, 4)
     vire_is_wizzrobe_compat = (vire_hp <= 4)
 
-    # --- Assignment loop (retries until all constraints pass) ---
+    # --- Group assignment ---
     group_enemies: dict[EnemySpriteSet, list[Enemy]] | None = None
-    for _outer in range(_MAX_OUTER_RETRIES):
-        group_enemies = _assign_enemies_to_groups(
+    if not legacy_sampling:
+        group_enemies = _sample_enemy_groups(
             sorted_enemies, start_enemy, rng,
             overworld, force_wizzrobes_to_9,
             vire_is_wizzrobe_compat,
         )
-        if group_enemies is not None:
-            break
+        if group_enemies is None:
+            raise RuntimeError(
+                "change_dungeon_enemy_groups: no group assignment satisfies the constraints"
+            )
     else:
-        raise RuntimeError(
-            "change_dungeon_enemy_groups: failed to assign enemies to groups "
-            f"after {_MAX_OUTER_RETRIES} attempts"
-        )
+        # Assignment loop (retries until all constraints pass).
+        for _outer in range(_MAX_OUTER_RETRIES):
+            group_enemies = _assign_enemies_to_groups(
+                sorted_enemies, start_enemy, rng,
+                overworld, force_wizzrobes_to_9,
+                vire_is_wizzrobe_compat,
+            )
+            if group_enemies is not None:
+                break
+        else:
+            raise RuntimeError(
+                "change_dungeon_enemy_groups: failed to assign enemies to groups "
+                f"after {_MAX_OUTER_RETRIES} attempts"
+            )
 
     # --- Read tile data before overwriting ---
-    tile_cache: dict[Enemy, bytes] = {}
-    for enemy in _VANILLA_SPRITE_SET:
-        tile_cache[enemy] = _read_enemy_tiles(world.sprites, enemy)
+    tile_cache = _read_all_enemy_tiles(world.sprites)
     wallmaster_shared_block = _read_wallmaster_shared_block(world.sprites)
 
     # --- Repack sprite tile data ---
@@ -986,6 +1109,12 @@ def change_dungeon_enemy_groups(
             if not level_pool:
                 continue
 
+            if not legacy_sampling:
+                candidates = safe_enemies(level_pool, room.room_type, has_push_block=room.movable_block)
+                if candidates:
+                    room.enemy_spec.enemy = rng.choice(candidates)
+                continue
+
             # Pick a random replacement, retrying on safety failures.
             for _attempt in range(_MAX_ROOM_RETRIES):
                 new_enemy = rng.choice(level_pool)
@@ -998,4 +1127,4 @@ def change_dungeon_enemy_groups(
 
     # --- Replace overworld enemies ---
     if overworld:
-        _replace_overworld_enemies(world, rng, group_enemies)
+        _replace_overworld_enemies(world, rng, group_enemies, legacy_sampling)
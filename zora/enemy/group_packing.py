@@ -0,0 +1,154 @@
+"""Uniform sampling of sprite-set group assignments.
+
+Both group shufflers (change_dungeon_enemy_groups and
+change_dungeon_boss_groups) assign a fixed set of sprites to sprite-set
+groups under per-group tile column budgets.  The C# they were ported from
+puts each sprite in a random group and retries when the group is full,
+restarting from scratch when the finished assignment breaks a whole-group
+rule, so its cost depends on luck and bosses can even be dropped.
+
+Here the feasible completions of every partial assignment are counted once
+per problem, and each sprite's group is drawn in proportion to the number
+of feasible packings it leads to.  Every feasible packing is equally likely,
+no draw is ever rejected, and a sample costs one ``rng.random()`` per item.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+from zora.rng import Rng
+
+
+@dataclass(frozen=True)
+class PackingProblem:
+    """Items to place into groups, one group per item.
+
+    Attributes:
+        costs: Tile columns each item needs.
+        budgets: Free tile columns in each group.
+        allowed: Per item, a bitmask of the groups it may join.
+        exclusive: Pairs of item indices that may not share a group.
+        covers: Bitmask of the items that satisfy the coverage rule.
+        must_cover: Bitmask of the groups that must end up with at least
+            one covering item.
+        covered: Bitmask of the groups already covered by sprites placed
+            before the items (pre-seeded members).
+    """
+    costs: tuple[int, ...]
+    budgets: tuple[int, ...]
+    allowed: tuple[int, ...]
+    exclusive: tuple[tuple[int, int], ...] = ()
+    covers: int = 0
+    must_cover: int = 0
+    covered: int = 0
+
+
+# Search state before placing an item: remaining budgets, covered groups and
+# the groups of the placed items that appear in an exclusive pair.
+_State = tuple[tuple[int, ...], int, tuple[int, ...]]
+
+
+class _PackingCounter:
+    """Memoized count of the feasible completions of each partial packing."""
+
+    __slots__ = ("_memo", "_options", "conflicts", "coverers", "demand", "problem", "tracked")
+
+    def __init__(self, problem: PackingProblem) -> None:
+        self.problem = problem
+        # Items whose group later items need to know, in tracked-tuple order.
+        self.tracked = sorted({i for pair in problem.exclusive for i in pair})
+        # Per item, the tracked-tuple positions of earlier items it excludes.
+        self.conflicts: list[list[int]] = [[] for _ in problem.costs]
+        for a, b in problem.exclusive:
+            first, second = min(a, b), max(a, b)
+            self.conflicts[second].append(self.tracked.index(first))
+        # Columns still needed by items i.. ; a budget above that is as good
+        # as exactly that, so budgets are capped to merge equivalent states.
+        self.demand = [sum(problem.costs[i:]) for i in range(len(problem.costs) + 1)]
+        # Covering items among items i.. ; fewer than the uncovered groups
+        # means no completion.
+        self.coverers = [(problem.covers >> i).bit_count() for i in range(len(problem.costs) + 1)]
+        self._memo: dict[tuple[int, _State], int] = {}
+        self._options: dict[tuple[int, _State], list[tuple[int, _State, int]]] = {}
+
+    def initial_state(self) -> _State:
+        budgets = tuple(min(budget, self.demand[0]) for budget in self.problem.budgets)
+        return budgets, self.problem.covered, (-1,) * len(self.tracked)
+
+    def children(self, i: int, state: _State) -> list[tuple[int, _State]]:
+        """Each group item ``i`` can join from ``state``, with the state it leads to."""
+        problem = self.problem
+        budgets, covered, groups = state
+        cost = problem.costs[i]
+        covers = problem.covers >> i & 1
+        taken = {groups[k] for k in self.conflicts[i]}
+        demand = self.demand[i + 1]
+        capped = tuple(min(budget, demand) for budget in budgets)
+        result: list[tuple[int, _State]] = []
+        for g, budget in enumerate(budgets):
+            if not problem.allowed[i] >> g & 1 or cost > budget or g in taken:
+                continue
+            new_budgets = capped[:g] + (min(budget - cost, demand),) + capped[g + 1:]
+            new_groups = groups
+            if i in self.tracked:
+                k = self.tracked.index(i)
+                new_groups = groups[:k] + (g,) + groups[k + 1:]
+            result.append((g, (new_budgets, covered | covers << g, new_groups)))
+        return result
+
+    def options(self, i: int, state: _State) -> list[tuple[int, _State, int]]:
+        """The feasible choices for item ``i``: group, next state, packings it leads to."""
+        key = (i, state)
+        options = self._options.get(key)
+        if options is None:
+            options = [(g, child, self.count(i + 1, child)) for g, child in self.children(i, state)]
+            options = [option for option in options if option[2]]
+            self._options[key] = options
+        return options
+
+    def count(self, i: int, state: _State) -> int:
+        """Number of feasible packings of items ``i..`` from ``state``."""
+        if i == len(self.problem.costs):
+            must_cover = self.problem.must_cover
+            return int(state[1] & must_cover == must_cover)
+        key = (i, state)
+        total = self._memo.get(key)
+        if total is None and (self.problem.must_cover & ~state[1]).bit_count() > self.coverers[i]:
+            total = 0
+        if total is None:
+            total = sum(self.count(i + 1, child) for _, child in self.children(i, state))
+            self._memo[key] = total
+        return total
+
+
+@lru_cache(maxsize=64)
+def _counter(problem: PackingProblem) -> _PackingCounter:
+    return _PackingCounter(problem)
+
+
+def count_packings(problem: PackingProblem) -> int:
+    """Number of feasible packings of ``problem``."""
+    counter = _counter(problem)
+    return counter.count(0, counter.initial_state())
+
+
+def sample_packing(problem: PackingProblem, rng: Rng) -> list[int] | None:
+    """Draw a feasible packing uniformly at random.
+
+    Returns the group of each item, or None if no packing is feasible.
+    """
+    counter = _counter(problem)
+    state = counter.initial_state()
+    if not counter.count(0, state):
+        return None
+    result: list[int] = []
+    for i in range(len(problem.costs)):
+        options = counter.options(i, state)
+        pick = int(rng.random() * sum(n for _, _, n in options))
+        k = 0
+        while pick >= options[k][2]:
+            pick -= options[k][2]
+            k += 1
+        group, state, _ = options[k]
+        result.append(group)
+    return result
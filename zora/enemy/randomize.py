@@ -48,7 +48,10 @@ def randomize_enemies(
     _replace_gleeok_1(game_world)
 
     if config.shuffle_monsters_between_levels:
-        shuffle_monsters_between_levels(game_world, rng, config.include_level_9)
+        shuffle_monsters_between_levels(
+            game_world, rng, config.include_level_9,
+            legacy_sampling=config.legacy_enemy_sampling,
+        )
 
     if config.shuffle_dungeon_monsters:
         shuffle_monsters(
@@ -56,6 +59,7 @@ def randomize_enemies(
             shuffle=config.shuffle_dungeon_monsters,
             shuffle_gannon=config.shuffle_ganon_zelda,
             must_beat_gannon=config.force_ganon,
+            legacy_sampling=config.legacy_enemy_sampling,
         )
 
     randomize_hp(game_world, config, rng)
@@ -65,13 +69,14 @@ def randomize_enemies(
             game_world, rng,
             overworld=config.randomize_overworld_enemies,
             force_wizzrobes_to_9=not config.include_level_9,
+            legacy_sampling=config.legacy_enemy_sampling,
         )
 
     if config.shuffle_bosses:
-        shuffle_bosses(game_world, rng)
+        shuffle_bosses(game_world, rng, legacy_sampling=config.legacy_enemy_sampling)
 
     if config.change_dungeon_boss_groups:
-        change_dungeon_boss_groups(game_world, rng)
+        change_dungeon_boss_groups(game_world, rng, legacy_sampling=config.legacy_enemy_sampling)
 
 
 def _replace_gleeok_1(game_world: GameWorld) -> None:
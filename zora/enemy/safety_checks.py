@@ -10,8 +10,13 @@ enemy (or enemy category) maps to the set of RoomType values where it
 CANNOT be placed. Consumer modules call ``is_safe_for_room`` instead of
 maintaining their own copies of the restriction sets.
 
+The rules are compiled at import into an enemy x room-type bit matrix
+(see ``_SAFE_ENEMY_MASKS``), so a check is two indexing operations, and
+``safe_enemies`` can filter a whole pool for one room at once.
 """
 
+from collections.abc import Sequence
+
 from zora.data_model import Enemy, RoomType
 
 # ---------------------------------------------------------------------------
@@ -190,10 +195,66 @@ UNSAFE_ROOM_TYPES: dict[Enemy, frozenset[RoomType]] = {
     Enemy.THE_KIDNAPPED:        _UNSAFE_ROOMS_THE_KIDNAPPED,
 }
 
+# ---------------------------------------------------------------------------
+# Compiled safety matrix.
+# ---------------------------------------------------------------------------
+
+def _compile_safe_enemy_masks(must_beat_gannon: bool, has_push_block: bool) -> list[int]:
+    """Per room type value, a bitmask of the enemy values safe in it (bit
+    e set = Enemy(e) may be placed there) under one flag combination."""
+    all_enemies = sum(1 << enemy for enemy in Enemy)
+    masks = [all_enemies] * (max(RoomType) + 1)
+    for enemy, unsafe in UNSAFE_ROOM_TYPES.items():
+        for room_type in unsafe:
+            masks[room_type] &= ~(1 << enemy)
+    if must_beat_gannon:
+        for room_type in _UNSAFE_ROOMS_THE_KIDNAPPED_MUST_BEAT_GANNON:
+            masks[room_type] &= ~(1 << Enemy.THE_KIDNAPPED)
+    if has_push_block:
+        masks = [mask & ~(1 << Enemy.GLEEOK_4) for mask in masks]
+    return masks
+
+
+# Indexed [must_beat_gannon + 2 * has_push_block][room_type]. Enemy and
+# RoomType are IntEnums, so members index and shift without conversion.
+_SAFE_ENEMY_MASKS: tuple[list[int], ...] = tuple(
+    _compile_safe_enemy_masks(must_beat_gannon, has_push_block)
+    for has_push_block in (False, True)
+    for must_beat_gannon in (False, True)
+)
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
+def safe_enemy_mask(
+    room_type: RoomType,
+    must_beat_gannon: bool = False,
+    has_push_block: bool = False,
+) -> int:
+    """Bitmask of the enemies that can be placed in the given room type.
+
+    Bit ``enemy`` (the Enemy value) is set if the placement is safe. The
+    flags mean the same as for ``is_safe_for_room``.
+    """
+    return _SAFE_ENEMY_MASKS[must_beat_gannon + 2 * has_push_block][room_type]
+
+
+def safe_enemies(
+    pool: Sequence[Enemy],
+    room_type: RoomType,
+    must_beat_gannon: bool = False,
+    has_push_block: bool = False,
+) -> list[Enemy]:
+    """Return the members of pool that can be placed in the given room type.
+
+    Keeps the pool's order and duplicates, so a uniform pick from the
+    result is a pick from the pool conditioned on being safe.
+    """
+    mask = _SAFE_ENEMY_MASKS[must_beat_gannon + 2 * has_push_block][room_type]
+    return [enemy for enemy in pool if mask >> enemy & 1]
+
+
 def is_safe_for_room(
     enemy: Enemy,
     room_type: RoomType,
@@ -214,18 +275,7 @@ def is_safe_for_room(
     Returns:
         True if the placement is safe, False if the room type is incompatible.
     """
-    unsafe = UNSAFE_ROOM_TYPES.get(enemy)
-    if unsafe is not None and room_type in unsafe:
-        return False
-
-    if must_beat_gannon and enemy == Enemy.THE_KIDNAPPED:
-        if room_type in _UNSAFE_ROOMS_THE_KIDNAPPED_MUST_BEAT_GANNON:
-            return False
-
-    if has_push_block and enemy == Enemy.GLEEOK_4:
-        return False
-
-    return True
+    return bool(_SAFE_ENEMY_MASKS[must_beat_gannon + 2 * has_push_block][room_type] >> enemy & 1)
 
 def unsafe_room_types_for(enemy: Enemy) -> frozenset[RoomType]:
     """Return the set of room types where this enemy cannot be placed.
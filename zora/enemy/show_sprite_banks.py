@@ -7,33 +7,48 @@ sprites side by side make a 16x16 metasprite, the standard enemy size.
 
 This tool renders the banks grouped as 16x16 metasprites (4 CHR tiles each).
 
-Two output modes:
+Tiles are decoded with integer bit operations: a 256-entry table spreads
+each bitplane byte into one byte per pixel, so a tile row is a single OR.
+Banks render to an indexed pixel buffer that Pillow wraps without per-pixel
+drawing.
+
+Three output modes:
   (default)  Terminal rendering with Unicode block characters
   --png      Generates a PNG image file (requires Pillow)
+  --seeds    Batch mode: one PNG contact sheet per seed plus a report.tsv
+             of per-bank diff counts, rendered in a process pool (requires
+             Pillow)
 
 Usage:
     python3 -m zora.enemy.show_sprite_banks [--seed 42] [--overworld]
     python3 -m zora.enemy.show_sprite_banks --png --seed 42
+    python3 -m zora.enemy.show_sprite_banks --seeds 1-500 --out-dir sheets [--workers 8]
 """
 
 from __future__ import annotations
 
 import argparse
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from PIL import Image as PilImage
+    from PIL import ImageFont
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
+from zora.batch_validation import parse_seed_range
 from zora.data_model import EnemySpriteSet, GameWorld
 from zora.enemy.change_dungeon_enemy_groups import change_dungeon_enemy_groups
-from zora.parser import load_bin_files, parse_game_world
+from zora.parser import RawBinFiles, load_bin_files, parse_game_world
 from zora.rng import SeededRng
 
-BIN_DIR = Path(__file__).resolve().parents[1] / "rom_data"
+BIN_DIR = Path(__file__).resolve().parents[2] / "rom_data"
 
 # Map SpriteData field names to EnemySpriteSet values for caption lookup
 _FIELD_TO_SPRITE_SET = {
@@ -62,18 +77,29 @@ def enemies_in_bank(game_world: GameWorld, field: str) -> list[str]:
     return sorted(e.name for e in enemies)
 
 
+# Bitplane byte -> int with bit k moved to bit 8k, so each pixel gets a byte.
+_SPREAD = tuple(sum((b >> k & 1) << 8 * k for k in range(8)) for b in range(256))
+
+_BLANK_TILE_ROWS = [bytes(8)] * 8
+
+
+def _tile_rows(data: bytes | bytearray, offset: int) -> list[bytes]:
+    """The 8 rows of one CHR tile, each as 8 pixel values (0-3) in a bytes object."""
+    return [(_SPREAD[data[offset + row]] | _SPREAD[data[offset + row + 8]] << 1).to_bytes(8, "big")
+            for row in range(8)]
+
+
 def decode_tile(data: bytes | bytearray, offset: int) -> list[list[int]]:
     """Decode one 16-byte NES CHR tile into 8x8 pixel values (0-3)."""
-    pixels = []
-    for row in range(8):
-        lo = data[offset + row]
-        hi = data[offset + row + 8]
-        row_pixels = []
-        for bit in range(7, -1, -1):
-            val = ((hi >> bit) & 1) << 1 | ((lo >> bit) & 1)
-            row_pixels.append(val)
-        pixels.append(row_pixels)
-    return pixels
+    return [list(row) for row in _tile_rows(data, offset)]
+
+
+def _metasprite_rows(data: bytes | bytearray, base_tile: int) -> list[bytes]:
+    """The 16 rows of a 16x16 metasprite, each as 16 pixel values (0-3)."""
+    num_tiles = len(data) // 16
+    tl, bl, tr, br = (_tile_rows(data, idx * 16) if idx < num_tiles else _BLANK_TILE_ROWS
+                      for idx in range(base_tile, base_tile + 4))
+    return [left + right for left, right in zip(tl + bl, tr + br, strict=True)]
 
 
 def decode_metasprite(data: bytes | bytearray, base_tile: int) -> list[list[int]]:
@@ -86,24 +112,7 @@ def decode_metasprite(data: bytes | bytearray, base_tile: int) -> list[list[int]
 
     Returns 16 rows of 16 pixel values.
     """
-    num_tiles = len(data) // 16
-    rows: list[list[int]] = []
-
-    def get_tile(idx: int) -> list[list[int]]:
-        if idx < num_tiles:
-            return decode_tile(data, idx * 16)
-        return [[0] * 8 for _ in range(8)]
-
-    tl = get_tile(base_tile)      # top-left
-    bl = get_tile(base_tile + 1)  # bottom-left
-    tr = get_tile(base_tile + 2)  # top-right
-    br = get_tile(base_tile + 3)  # bottom-right
-
-    for py in range(8):
-        rows.append(tl[py] + tr[py])
-    for py in range(8):
-        rows.append(bl[py] + br[py])
-    return rows
+    return [list(row) for row in _metasprite_rows(data, base_tile)]
 
 
 def metasprite_changed(before: bytes | bytearray, after: bytes | bytearray,
@@ -128,23 +137,23 @@ def count_metasprites(data: bytes | bytearray) -> int:
 # Text rendering
 # ---------------------------------------------------------------------------
 
+_SHADE_TABLE = str.maketrans(dict(enumerate(SHADE)))
+
+
 def render_bank_text(data: bytes | bytearray, cols: int = 4) -> list[str]:
     """Render a bank as a grid of 16x16 metasprites using unicode."""
     n_meta = count_metasprites(data)
     n_rows = (n_meta + cols - 1) // cols
+    blank = [" " * 16] * 16
     lines: list[str] = []
 
     for mr in range(n_rows):
-        for py in range(16):
-            parts = []
-            for mc in range(cols):
-                mi = mr * cols + mc
-                if mi < n_meta:
-                    sprite = decode_metasprite(data, mi * 4)
-                    parts.append("".join(SHADE[p] for p in sprite[py]))
-                else:
-                    parts.append(" " * 16)
-            lines.append("  ".join(parts))
+        sprites = [
+            [row.decode("latin-1").translate(_SHADE_TABLE) for row in _metasprite_rows(data, mi * 4)]
+            if mi < n_meta else blank
+            for mi in range(mr * cols, mr * cols + cols)
+        ]
+        lines.extend("  ".join(rows) for rows in zip(*sprites, strict=True))
         lines.append("")  # gap between metasprite rows
 
     return lines
@@ -165,12 +174,22 @@ def side_by_side(left_lines: list[str], right_lines: list[str],
     return output
 
 
-def diff_summary(before: bytes | bytearray, after: bytes | bytearray) -> str:
+def diff_counts(before: bytes | bytearray, after: bytes | bytearray) -> tuple[int, int, int]:
+    """Return (changed metasprites, total metasprites, changed bytes)."""
     n_meta = count_metasprites(before)
-    meta_diffs = sum(
-        1 for m in range(n_meta) if metasprite_changed(before, after, m * 4)
-    )
-    byte_diffs = sum(1 for a, b in zip(before, after) if a != b)
+    meta_diffs = sum(1 for m in range(n_meta) if metasprite_changed(before, after, m * 4))
+    n = min(len(before), len(after))
+    # Fold each byte of the XOR onto its low bit, then count the low bits.
+    x = int.from_bytes(before[:n]) ^ int.from_bytes(after[:n])
+    x |= x >> 4
+    x |= x >> 2
+    x |= x >> 1
+    byte_diffs = (x & int.from_bytes(b"\x01" * n)).bit_count()
+    return meta_diffs, n_meta, byte_diffs
+
+
+def diff_summary(before: bytes | bytearray, after: bytes | bytearray) -> str:
+    meta_diffs, n_meta, byte_diffs = diff_counts(before, after)
     return f"{meta_diffs}/{n_meta} metasprites changed ({byte_diffs} bytes)"
 
 
@@ -178,42 +197,72 @@ def diff_summary(before: bytes | bytearray, after: bytes | bytearray) -> str:
 # PNG rendering
 # ---------------------------------------------------------------------------
 
-def render_bank_image(data: bytes | bytearray, scale: int, cols: int,
-                      before: bytes | bytearray | None = None) -> PilImage.Image:
-    """Render a sprite bank to a PIL Image, grouped as 16x16 metasprites."""
-    from PIL import Image, ImageDraw
+# Palette indices in sheet_pixels buffers beyond the 4 pixel values.
+GRID_INDEX = 4
+CHANGED_BORDER_INDEX = 5
 
+_SHEET_PALETTE = [c for rgb in (*NES_PALETTE, GRID_COLOR, CHANGED_BORDER_COLOR) for c in rgb]
+
+
+def sheet_pixels(data: bytes | bytearray, cols: int, gap: int = 1) -> tuple[int, int, bytes]:
+    """Lay a bank out as a grid of 16x16 metasprites, one byte per pixel.
+
+    Pixels hold their value (0-3); the gaps between metasprites and any
+    empty grid cells hold GRID_INDEX.  Returns (width, height, pixels).
+    """
     n_meta = count_metasprites(data)
     n_rows = (n_meta + cols - 1) // cols
-    sprite_px = 16 * scale
-    gap = max(2, scale)
-    w = cols * sprite_px + (cols + 1) * gap
-    h = n_rows * sprite_px + (n_rows + 1) * gap
+    w = cols * 16 + (cols + 1) * gap
+    h = n_rows * 16 + (n_rows + 1) * gap
+    grid = bytes([GRID_INDEX])
+    spacer = grid * gap
+    blank = [grid * 16] * 16
+    out = bytearray(grid * (w * gap))
+    for mr in range(n_rows):
+        sprites = [_metasprite_rows(data, mi * 4) if mi < n_meta else blank
+                   for mi in range(mr * cols, mr * cols + cols)]
+        for rows in zip(*sprites, strict=True):
+            out += spacer + spacer.join(rows) + spacer
+        out += grid * (w * gap)
+    return w, h, bytes(out)
 
-    img = Image.new("RGB", (w, h), GRID_COLOR)
-    draw = ImageDraw.Draw(img)
 
-    for mi in range(n_meta):
-        mr, mc = divmod(mi, cols)
-        x0 = gap + mc * (sprite_px + gap)
-        y0 = gap + mr * (sprite_px + gap)
-
-        pixels = decode_metasprite(data, mi * 4)
-        for py in range(16):
-            for px in range(16):
-                color = NES_PALETTE[pixels[py][px]]
-                rx = x0 + px * scale
-                ry = y0 + py * scale
-                draw.rectangle([rx, ry, rx + scale - 1, ry + scale - 1], fill=color)
-
-        if before is not None and metasprite_changed(before, data, mi * 4):
-            bw = max(1, scale // 3)
+def render_bank_image(data: bytes | bytearray, scale: int, cols: int,
+                      before: bytes | bytearray | None = None) -> PilImage.Image:
+    """Render a sprite bank to a PIL Image, grouped as 16x16 metasprites."""
+    from PIL import Image, ImageDraw
+
+    w, h, pixels = sheet_pixels(data, cols)
+    img = Image.frombytes("P", (w, h), pixels)
+    img.putpalette(_SHEET_PALETTE)
+    img = img.resize((w * scale, h * scale), Image.Resampling.NEAREST)
+
+    if before is not None:
+        draw = ImageDraw.Draw(img)
+        sprite_px = 16 * scale
+        bw = max(1, scale // 3)
+        for mi in range(count_metasprites(data)):
+            if not metasprite_changed(before, data, mi * 4):
+                continue
+            mr, mc = divmod(mi, cols)
+            x0 = scale + mc * (sprite_px + scale)
+            y0 = scale + mr * (sprite_px + scale)
             draw.rectangle(
                 [x0 - bw, y0 - bw, x0 + sprite_px + bw - 1, y0 + sprite_px + bw - 1],
-                outline=CHANGED_BORDER_COLOR, width=bw,
+                outline=CHANGED_BORDER_INDEX, width=bw,
             )
 
-    return img
+    return img.convert("RGB")
+
+
+@lru_cache(maxsize=4)
+def _label_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    from PIL import ImageFont
+
+    try:
+        return ImageFont.truetype("/System/Library/Fonts/Menlo.ttc", size=size)
+    except (OSError, AttributeError):
+        return ImageFont.load_default()
 
 
 def make_comparison_image(
@@ -224,7 +273,7 @@ def make_comparison_image(
     cols: int,
 ) -> PilImage.Image:
     """Build a single image with BEFORE / AFTER columns for all banks."""
-    from PIL import Image, ImageDraw, ImageFont
+    from PIL import Image, ImageDraw
 
     label_h = max(24, 5 * scale)
     section_gap = max(12, 3 * scale)
@@ -246,12 +295,7 @@ def make_comparison_image(
 
     img = Image.new("RGB", (total_w, total_h), (20, 20, 30))
     draw = ImageDraw.Draw(img)
-
-    font: ImageFont.FreeTypeFont | ImageFont.ImageFont
-    try:
-        font = ImageFont.truetype("/System/Library/Fonts/Menlo.ttc", size=max(12, 3 * scale))
-    except (OSError, AttributeError):
-        font = ImageFont.load_default()
+    font = _label_font(max(12, 3 * scale))
 
     before_x = 20
     after_x = 20 + panel_w + col_gap
@@ -270,6 +314,95 @@ def make_comparison_image(
     return img
 
 
+# ---------------------------------------------------------------------------
+# Batch mode
+# ---------------------------------------------------------------------------
+
+_DUNGEON_BANKS = [
+    ("Bank A", "enemy_set_a"),
+    ("Bank B", "enemy_set_b"),
+    ("Bank C", "enemy_set_c"),
+]
+
+# Per-process cache of the vanilla bin files, loaded once per worker.
+_bin_cache: dict[Path, RawBinFiles] = {}
+
+
+@dataclass(frozen=True)
+class BankDiff:
+    label: str
+    changed: int          # metasprites that differ from vanilla
+    metasprites: int
+    bytes_changed: int
+    enemies: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class SeedSheet:
+    seed: int
+    path: str             # contact sheet PNG
+    banks: tuple[BankDiff, ...]
+    seconds: float
+
+
+def shuffle_banks(bins: RawBinFiles, seed: int, overworld: bool
+                  ) -> tuple[GameWorld, list[tuple[str, str]], dict[str, bytes]]:
+    """Parse a vanilla world and shuffle its enemy groups.
+
+    Returns the shuffled world, the (label, field) banks to show and the
+    vanilla bytes of each bank.
+    """
+    gw = parse_game_world(bins)
+    banks = _DUNGEON_BANKS + [("Bank OW", "ow_sprites")] if overworld else list(_DUNGEON_BANKS)
+    snapshots = {field: bytes(getattr(gw.sprites, field)) for _, field in banks}
+    change_dungeon_enemy_groups(gw, SeededRng(seed), overworld=overworld)
+    return gw, banks, snapshots
+
+
+def _render_seed(job: tuple[int, bool, int, int, str]) -> SeedSheet:
+    seed, overworld, scale, cols, out_dir = job
+    start = time.monotonic()
+    bins = _bin_cache.get(BIN_DIR)
+    if bins is None:
+        bins = _bin_cache[BIN_DIR] = load_bin_files(BIN_DIR)
+    gw, banks, snapshots = shuffle_banks(bins, seed, overworld)
+
+    path = Path(out_dir) / f"sprite_banks_seed_{seed}.png"
+    make_comparison_image(banks, snapshots, gw, scale, cols).save(path)
+    diffs = tuple(
+        BankDiff(label, *diff_counts(snapshots[field], bytes(getattr(gw.sprites, field))),
+                 tuple(enemies_in_bank(gw, field)))
+        for label, field in banks
+    )
+    return SeedSheet(seed, str(path), diffs, time.monotonic() - start)
+
+
+def render_seed_sheets(seeds: list[int], out_dir: str | Path, overworld: bool = False, scale: int = 4,
+                       cols: int = 4, max_workers: int | None = None) -> list[SeedSheet]:
+    """Write one before/after contact sheet per seed into out_dir.
+
+    Args:
+        max_workers: Worker processes (None = one per CPU, 1 = run in this process).
+    """
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    jobs = [(seed, overworld, scale, cols, str(out_dir)) for seed in seeds]
+    if max_workers == 1:
+        return [_render_seed(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        chunksize = max(1, len(jobs) // (4 * (max_workers or 4)))
+        return list(pool.map(_render_seed, jobs, chunksize=chunksize))
+
+
+def write_report(sheets: list[SeedSheet], path: str | Path) -> None:
+    """Write one tab-separated line per (seed, bank) with its diff counts."""
+    lines = ["seed\tbank\tchanged_metasprites\tmetasprites\tchanged_bytes\tenemies"]
+    for sheet in sheets:
+        for bank in sheet.banks:
+            lines.append(f"{sheet.seed}\t{bank.label}\t{bank.changed}\t{bank.metasprites}\t"
+                         f"{bank.bytes_changed}\t{','.join(bank.enemies)}")
+    Path(path).write_text("\n".join(lines) + "\n")
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -289,22 +422,28 @@ def main() -> None:
                         help="Pixel scale for PNG output (default: 4)")
     parser.add_argument("--out", type=str, default=None,
                         help="PNG output path (default: sprite_banks_seed_<N>.png)")
+    parser.add_argument("--seeds", type=str, default=None,
+                        help="Batch mode: seeds to render, e.g. 1-500 or 1-10,42")
+    parser.add_argument("--out-dir", type=str, default="sprite_banks",
+                        help="Batch mode output directory (default: sprite_banks)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Batch mode worker processes (default: one per CPU)")
     args = parser.parse_args()
 
-    bins = load_bin_files(BIN_DIR)
-    gw = parse_game_world(bins)
-
-    banks = [
-        ("Bank A", "enemy_set_a"),
-        ("Bank B", "enemy_set_b"),
-        ("Bank C", "enemy_set_c"),
-    ]
-    if args.overworld:
-        banks.append(("Bank OW", "ow_sprites"))
-
-    snapshots = {field: bytes(getattr(gw.sprites, field)) for _, field in banks}
-
-    change_dungeon_enemy_groups(gw, SeededRng(args.seed), overworld=args.overworld)
+    if args.seeds is not None:
+        start = time.monotonic()
+        sheets = render_seed_sheets(parse_seed_range(args.seeds), args.out_dir, args.overworld,
+                                    args.scale, args.cols, args.workers)
+        report_path = Path(args.out_dir) / "report.tsv"
+        write_report(sheets, report_path)
+        print(f"{len(sheets)} sheets in {args.out_dir} ({time.monotonic() - start:.1f}s), report: {report_path}")
+        for label in dict.fromkeys(bank.label for sheet in sheets for bank in sheet.banks):
+            diffs = [bank for sheet in sheets for bank in sheet.banks if bank.label == label]
+            print(f"  {label}: mean {sum(d.changed for d in diffs) / len(diffs):.2f}/{diffs[0].metasprites} "
+                  f"metasprites, {sum(d.bytes_changed for d in diffs) / len(diffs):.0f} bytes changed")
+        return
+
+    gw, banks, snapshots = shuffle_banks(load_bin_files(BIN_DIR), args.seed, args.overworld)
 
     # Print enemy group assignments for all banks
     print(f"Seed: {args.seed}   Overworld: {args.overworld}")
@@ -12,10 +12,11 @@ from zora.data_model import (
     Enemy,
     GameWorld,
 )
-from zora.enemy.safety_checks import is_safe_for_room
+from zora.enemy.safety_checks import is_safe_for_room, safe_enemies
 from zora.rng import Rng
 
-# Maximum retries when a safety check rejects a random boss pick for a room.
+# Maximum retries when a safety check rejects a random boss pick for a room
+# (legacy_sampling only; otherwise picks come from the safe members).
 _MAX_ROOM_RETRIES = 50
 
 
@@ -122,6 +123,7 @@ def shuffle_bosses(
     world: GameWorld,
     rng: Rng,
     add_extra_bosses: bool = False,
+    legacy_sampling: bool = False,
 ) -> None:
     """Shuffle boss assignments across dungeon levels.
 
@@ -133,8 +135,10 @@ def shuffle_bosses(
     4. If add_extra_bosses is True, non-boss rooms have a 25% chance of
        also receiving a random boss from the tier.
 
-    Safety checks prevent placing certain bosses in incompatible room types.
-    If a pick fails, the room is retried up to _MAX_ROOM_RETRIES times.
+    Safety checks prevent placing certain bosses in incompatible room types:
+    each room draws from the tier's bosses that are safe for it. With
+    legacy_sampling, it draws from the whole tier and retries an unsafe
+    pick up to _MAX_ROOM_RETRIES times, like the original.
 
     Only Q1 levels (1-9) are processed.
 
@@ -142,6 +146,8 @@ def shuffle_bosses(
         world: The game world to modify (mutated in place).
         rng: Seeded RNG for deterministic output.
         add_extra_bosses: When True, 25% of non-boss rooms also get a boss.
+        legacy_sampling: If True, pick by pick-and-retry for the same seeds
+            as earlier versions.
     """
     tier_assignments = _assign_boss_tiers(rng)
 
@@ -176,6 +182,12 @@ def shuffle_bosses(
                 if enemy in (Enemy.THE_BEAST, Enemy.THE_KIDNAPPED, Enemy.HUNGRY_GORIYA):
                     continue
 
+            if not legacy_sampling:
+                candidates = safe_enemies(boss_pool, room.room_type, has_push_block=room.movable_block)
+                if candidates:
+                    room.enemy_spec.enemy = rng.choice(candidates)
+                continue
+
             # Pick a random boss from the assigned tier, retrying on safety failures.
             for _attempt in range(_MAX_ROOM_RETRIES):
                 new_boss = rng.choice(boss_pool)
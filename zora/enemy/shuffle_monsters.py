@@ -15,6 +15,7 @@ pass from generateGame (Module.cs:124838-124959).
 from zora.data_model import (
     Direction,
     Enemy,
+    EnemySpec,
     GameWorld,
     Item,
     Level,
@@ -23,11 +24,12 @@ from zora.data_model import (
     RoomType,
     WallType,
 )
-from zora.enemy.safety_checks import is_safe_for_room
+from zora.enemy.safety_checks import is_safe_for_room, safe_enemy_mask
 from zora.rng import Rng
 
-# Maximum Fisher-Yates iterations before giving up on a level.
-# The original retries indefinitely; we cap to prevent hangs.
+# Maximum Fisher-Yates iterations before giving up on a level (legacy_sampling
+# only; the matching shuffle needs no cap).  The original retries
+# indefinitely; we cap to prevent hangs.
 _MAX_SHUFFLE_ATTEMPTS = 10_000
 
 
@@ -206,6 +208,201 @@ def _set_boss_cry_on_neighbors(
             neighbor.boss_cry_1 = True
 
 
+def _room_enemy_masks(level: Level, rooms: list[Room], must_beat_gannon: bool) -> list[int]:
+    """Per room, the bitmask of the enemies it may receive.
+
+    Bit ``enemy`` is set if the room-type safety checks allow the enemy and,
+    with must_beat_gannon, Zelda is not barred by the room_enemy_pairs table
+    (see ``_is_zelda_room_enemy_pair_conflict``).
+    """
+    pair_rooms = set(_build_room_enemy_pairs(level)) if must_beat_gannon else set()
+    masks: list[int] = []
+    for room in rooms:
+        mask = safe_enemy_mask(room.room_type, must_beat_gannon, room.movable_block)
+        if room.room_num in pair_rooms:
+            mask &= ~(1 << Enemy.THE_KIDNAPPED)
+        masks.append(mask)
+    return masks
+
+
+def _augment(
+    room: int,
+    start_mask: int,
+    kind_of: list[int],
+    free: dict[int, int],
+    masks: list[int],
+    fixed: list[bool],
+) -> bool:
+    """Give ``room`` an enemy from ``start_mask`` along an alternating path.
+
+    ``kind_of`` matches rooms to enemy values (-1 = unmatched) and ``free``
+    counts the unmatched specs of each value.  The room takes a start
+    enemy; when no spec of it is free, a room holding it switches to
+    another enemy it allows, and so on until an enemy with a free spec is
+    reached.  Fixed rooms keep their enemy.  Returns False, leaving the
+    matching as it was, if no such path exists.
+    """
+    holders: dict[int, list[int]] = {kind: [] for kind in free}
+    for holder, held in enumerate(kind_of):
+        if held >= 0 and not fixed[holder]:
+            holders[held].append(holder)
+    present = 0
+    for kind in free:
+        present |= 1 << kind
+    seen = start_mask & present
+    queue = [kind for kind in free if seen >> kind & 1]
+    parent: dict[int, tuple[int, int]] = {}
+    end = next((kind for kind in queue if free[kind]), -1)
+    i = 0
+    while end < 0 and i < len(queue):
+        kind = queue[i]
+        i += 1
+        for holder in holders[kind]:
+            reach = masks[holder] & present & ~seen
+            seen |= reach
+            while reach:
+                low = reach & -reach
+                reach ^= low
+                other = low.bit_length() - 1
+                parent[other] = (holder, kind)
+                if free[other]:
+                    end = other
+                    break
+                queue.append(other)
+            if end >= 0:
+                break
+    if end < 0:
+        return False
+
+    free[end] -= 1
+    while end in parent:
+        holder, previous = parent[end]
+        kind_of[holder] = end
+        end = previous
+    kind_of[room] = end
+    return True
+
+
+def _sample_matching(enemies: list[Enemy], masks: list[int], rng: Rng) -> list[int] | None:
+    """Draw a random assignment of specs to rooms that every room allows.
+
+    ``enemies[i]`` is the enemy of spec i, which starts in room i; ``masks``
+    are the rooms' allowed enemies.  Returns, per room, the index of the
+    spec it receives, or None if no assignment satisfies every room.
+
+    A perfect matching of rooms to enemies is kept throughout.  Each room
+    in turn draws a uniformly random spec among the remaining ones it
+    allows, and the rest of the matching is repaired by one alternating path
+    search; a spec whose enemy cannot be repaired around is ruled out for
+    the room and another one drawn.  No draw is retried more than once per
+    enemy, so the cost is bounded by the level size.
+    """
+    n = len(enemies)
+    values = [int(enemy) for enemy in enemies]
+    free = dict.fromkeys(sorted(set(values)), 0)
+    for value in values:
+        free[value] += 1
+    fixed = [False] * n
+
+    # Start from the current placement where it is allowed, then match the
+    # remaining rooms.
+    kind_of = [-1] * n
+    for room, value in enumerate(values):
+        if masks[room] >> value & 1:
+            kind_of[room] = value
+            free[value] -= 1
+    for room in range(n):
+        if kind_of[room] < 0 and not _augment(room, masks[room], kind_of, free, masks, fixed):
+            return None
+
+    remaining = list(range(n))
+    result: list[int] = []
+    for room in range(n):
+        fixed[room] = True
+        mask = masks[room]
+        candidates = [spec for spec in remaining if mask >> values[spec] & 1]
+        while True:
+            spec = candidates[int(rng.random() * len(candidates))]
+            value = values[spec]
+            held = kind_of[room]
+            if value == held:
+                break
+            # Usually another room holding the drawn enemy can simply trade.
+            trade = next(
+                (other for other in range(room + 1, n) if kind_of[other] == value and masks[other] >> held & 1),
+                -1,
+            )
+            if trade >= 0:
+                kind_of[trade] = held
+                kind_of[room] = value
+                break
+            # Hand the room's matched enemy back, then route the drawn one to it.
+            free[held] += 1
+            kind_of[room] = -1
+            if _augment(room, 1 << value, kind_of, free, masks, fixed):
+                break
+            free[held] -= 1
+            kind_of[room] = held
+            candidates = [c for c in candidates if values[c] != value]
+        remaining.remove(spec)
+        result.append(spec)
+    return result
+
+
+def _finish_level_shuffle(
+    level: Level,
+    rooms: list[Room],
+    specs: list[EnemySpec],
+    shuffle_gannon: bool,
+) -> None:
+    """Write shuffled enemy specs back to rooms and move the Gannon room."""
+    for room, spec in zip(rooms, specs, strict=True):
+        room.enemy_spec = spec
+
+    # Gannon room post-processing: if Gannon moved, configure the new room.
+    if shuffle_gannon:
+        gannon_room = _find_gannon_room(level)
+        if gannon_room is not None:
+            _configure_gannon_room(gannon_room)
+            level.boss_room = gannon_room.room_num
+            _set_boss_cry_on_neighbors(gannon_room, {r.room_num: r for r in level.rooms})
+
+
+def _match_level(
+    level: Level,
+    rng: Rng,
+    shuffle_gannon: bool,
+    must_beat_gannon: bool,
+) -> bool:
+    """Shuffle enemy assignments within a single level as a random matching.
+
+    Same constraints as ``_shuffle_level``, applied to the final placement:
+    every enemy spec lands in a room whose type is safe for it, and with
+    must_beat_gannon Zelda avoids the room_enemy_pairs rooms.  The placement
+    is drawn directly (see ``_sample_matching``) rather than by retried
+    swaps.
+
+    Returns True on success, False at once if no placement satisfies the
+    constraints.
+    """
+    eligible_rooms = [
+        room for room in level.rooms
+        if _is_eligible(room.enemy_spec.enemy, shuffle_gannon)
+    ]
+
+    if len(eligible_rooms) < 2:
+        return True
+
+    specs = [room.enemy_spec for room in eligible_rooms]
+    masks = _room_enemy_masks(level, eligible_rooms, must_beat_gannon)
+    assignment = _sample_matching([spec.enemy for spec in specs], masks, rng)
+    if assignment is None:
+        return False
+
+    _finish_level_shuffle(level, eligible_rooms, [specs[i] for i in assignment], shuffle_gannon)
+    return True
+
+
 def _shuffle_level(
     level: Level,
     rng: Rng,
@@ -229,8 +426,6 @@ def _shuffle_level(
     if len(eligible_rooms) < 2:
         return True
 
-    room_by_num: dict[int, Room] = {r.room_num: r for r in level.rooms}
-
     # Build room_enemy_pairs for the Zelda mustBeatGannon conflict check.
     room_enemy_pairs = _build_room_enemy_pairs(level)
 
@@ -276,18 +471,7 @@ def _shuffle_level(
         enemy_ids[i], enemy_ids[j] = enemy_ids[j], enemy_ids[i]
         i += 1
 
-    # Write shuffled enemy specs back to rooms.
-    for room, spec in zip(eligible_rooms, specs):
-        room.enemy_spec = spec
-
-    # Gannon room post-processing: if Gannon moved, configure the new room.
-    if shuffle_gannon:
-        gannon_room = _find_gannon_room(level)
-        if gannon_room is not None:
-            _configure_gannon_room(gannon_room)
-            level.boss_room = gannon_room.room_num
-            _set_boss_cry_on_neighbors(gannon_room, room_by_num)
-
+    _finish_level_shuffle(level, eligible_rooms, specs, shuffle_gannon)
     return True
 
 
@@ -343,11 +527,12 @@ def shuffle_monsters(
     shuffle: bool = True,
     shuffle_gannon: bool = False,
     must_beat_gannon: bool = True,
+    legacy_sampling: bool = False,
 ) -> bool:
     """Shuffle dungeon enemy assignments within each level.
 
     For each dungeon level (1-9), collects rooms with eligible enemies and
-    randomly swaps enemy assignments between rooms, subject to room-type
+    randomly reassigns their enemies between rooms, subject to room-type
     safety constraints that prevent softlocks and visual glitches.
 
     Args:
@@ -358,10 +543,14 @@ def shuffle_monsters(
             and MIXED_FLAME participate in the shuffle pool.
         must_beat_gannon: If True, enforce placement constraints that ensure
             the player must fight Gannon to reach Zelda.
+        legacy_sampling: If True, use the original constrained Fisher-Yates
+            swaps, for the same seeds as earlier versions, instead of
+            drawing each level's placement as a random matching.
 
     Returns:
-        True on success, False if any level's shuffle exhausted its retry
-        budget (caller should retry the entire seed generation).
+        True on success, False if some level has no valid placement, or with
+        legacy_sampling if a level's shuffle exhausted its retry budget
+        (caller should retry the entire seed generation).
     """
     # If !mustBeatGannon and level 9 exists, patch Gannon room action.
     # The C# does (rom[addr] & 0xF8) | 0x01 = clear low 3 bits, set to 1.
@@ -374,9 +563,10 @@ def shuffle_monsters(
                         (gannon_room.room_action.value & 0xF8) | 0x01
                     )
 
+    shuffle_level = _shuffle_level if legacy_sampling else _match_level
     for level in world.levels:
         if shuffle:
-            if not _shuffle_level(level, rng, shuffle_gannon, must_beat_gannon):
+            if not shuffle_level(level, rng, shuffle_gannon, must_beat_gannon):
                 return False
 
     # Post-processing: clear all boss_cry bits, then re-tag Gannon adjacents
@@ -9,8 +9,9 @@ from zora.data_model import (
     Enemy,
     EnemySpriteSet,
     GameWorld,
+    Level,
 )
-from zora.enemy.safety_checks import is_safe_for_room
+from zora.enemy.safety_checks import is_safe_for_room, safe_enemies
 from zora.rng import Rng
 
 # Maximum retries when a safety check rejects a random enemy pick for a room.
@@ -161,12 +162,120 @@ def _shuffle_sprite_set_assignments(
     return {level_num: assignments[level_num] for level_num in range(1, 10)}
 
 
+def _sample_balanced_level(candidates: list[list[Enemy]], rng: Rng) -> list[Enemy | None]:
+    """Pick one enemy per room, uniformly from each room's candidates,
+    conditioned on the level not ending up with red bubbles but no blue.
+
+    The condition is tracked over the rooms as a three-state chain: no
+    bubble yet, red without blue, blue placed (balanced for good). A
+    backward pass gives, per room, the chance that the remaining rooms can
+    still end balanced from each state; each pick is weighted by that
+    chance for the state it leads to. This is exactly the distribution of
+    rerolling the whole level until it is balanced, without the rerolls.
+    If no outcome is balanced, picks are unconditioned. Rooms without
+    candidates get None.
+    """
+    red_counts = [room.count(Enemy.RED_BUBBLE) for room in candidates]
+    if not any(red_counts):
+        return [rng.choice(room) if room else None for room in candidates]
+
+    # ends_balanced[i] = (from no bubble yet, from red without blue): the
+    # chance rooms i.. end balanced. From blue placed it is always 1.
+    ends_balanced = [(1.0, 0.0)]
+    for room, reds in zip(reversed(candidates), reversed(red_counts), strict=True):
+        clean, red_only = ends_balanced[-1]
+        if room:
+            blues = room.count(Enemy.BLUE_BUBBLE)
+            others = len(room) - reds - blues
+            clean, red_only = (
+                (others * clean + reds * red_only + blues) / len(room),
+                ((others + reds) * red_only + blues) / len(room),
+            )
+        ends_balanced.append((clean, red_only))
+    ends_balanced.reverse()
+    conditioned = ends_balanced[0][0] > 0
+
+    picks: list[Enemy | None] = []
+    blue_placed = red_placed = False
+    for room, (clean, red_only) in zip(candidates, ends_balanced[1:], strict=True):
+        if not room:
+            picks.append(None)
+            continue
+        if blue_placed or not conditioned:
+            pick = rng.choice(room)
+        else:
+            other_weight = red_only if red_placed else clean
+            weights = [
+                1.0 if enemy == Enemy.BLUE_BUBBLE else red_only if enemy == Enemy.RED_BUBBLE else other_weight
+                for enemy in room
+            ]
+            target = rng.random() * sum(weights)
+            pick = room[-1]
+            for enemy, weight in zip(room, weights, strict=True):
+                if target < weight:
+                    pick = enemy
+                    break
+                target -= weight
+        picks.append(pick)
+        blue_placed = blue_placed or pick == Enemy.BLUE_BUBBLE
+        red_placed = red_placed or pick == Enemy.RED_BUBBLE
+    return picks
+
+
+def _redistribute_level(level: Level, rng: Rng, pool: list[Enemy]) -> None:
+    """Replace a level's eligible enemies with picks from each room's safe
+    subset of pool, balancing bubbles by construction."""
+    rooms = [room for room in level.rooms if not _is_excluded_from_enemy_shuffling(room.enemy_spec.enemy)]
+    candidates = [safe_enemies(pool, room.room_type, has_push_block=room.movable_block) for room in rooms]
+    for room, pick in zip(rooms, _sample_balanced_level(candidates, rng), strict=True):
+        if pick is not None:
+            room.enemy_spec.enemy = pick
+
+
+def _redistribute_level_legacy(level: Level, rng: Rng, pool: list[Enemy]) -> None:
+    """Replace a level's eligible enemies by pick-and-retry, like the original.
+
+    If a pick fails a safety check, the room is retried with a new pick
+    (up to _MAX_ROOM_RETRIES times). After processing all rooms, checks
+    bubble balance: if red bubbles are present but no blue bubbles, the
+    entire level is retried (up to _MAX_LEVEL_RETRIES times).
+    """
+    for level_attempt in range(_MAX_LEVEL_RETRIES):
+        has_red_bubble = False
+        has_blue_bubble = False
+
+        for room in level.rooms:
+            enemy = room.enemy_spec.enemy
+            if _is_excluded_from_enemy_shuffling(enemy):
+                continue
+
+            for room_attempt in range(_MAX_ROOM_RETRIES):
+                replacement = rng.choice(pool)
+
+                if not is_safe_for_room(replacement, room.room_type, has_push_block=room.movable_block):
+                    continue
+
+                # Track bubble types for level-wide balance check
+                if replacement == Enemy.RED_BUBBLE:
+                    has_red_bubble = True
+                if replacement == Enemy.BLUE_BUBBLE:
+                    has_blue_bubble = True
+
+                room.enemy_spec.enemy = replacement
+                break  # room successfully assigned
+
+        # Bubble balance: red bubbles without blue bubbles can softlock
+        if not (has_red_bubble and not has_blue_bubble):
+            break  # level is fine, move on
+
+
 def _redistribute_enemies(
     world: GameWorld,
     rng: Rng,
     pools: dict[EnemySpriteSet, list[Enemy]],
     sprite_set_assignments: dict[int, EnemySpriteSet],
     include_level_9: bool,
+    legacy_sampling: bool = False,
 ) -> None:
     """Replace non-excluded enemies in each dungeon level with random picks from pools.
 
@@ -174,15 +283,17 @@ def _redistribute_enemies(
     level's (shuffled) sprite set assignment, then iterates rooms and replaces
     eligible enemies with random selections from that pool.
 
-    Safety checks ensure certain enemies only appear in compatible room types.
-    If a pick fails a safety check, the room is retried with a new pick
-    (up to _MAX_ROOM_RETRIES times).
+    Safety checks ensure certain enemies only appear in compatible room types:
+    each room draws from the members of the pool that are safe for it.
+
+    A level must not end up with red bubbles but no blue bubbles. Red
+    bubbles disable sword use, and blue bubbles restore it — a level with
+    only red bubbles could softlock the player. The picks are drawn so this
+    holds by construction (see _sample_balanced_level).
 
-    After processing all rooms in a level, checks bubble balance: if red
-    bubbles are present but no blue bubbles, the entire level is retried
-    (up to _MAX_LEVEL_RETRIES times). Red bubbles disable sword use, and
-    blue bubbles restore it — a level with only red bubbles could softlock
-    the player.
+    With legacy_sampling, uses the original pick-and-retry loops instead
+    (_redistribute_level_legacy), which consume the RNG like earlier
+    versions.
     """
     for level in world.levels:
         if not include_level_9 and level.level_num == 9:
@@ -193,33 +304,10 @@ def _redistribute_enemies(
         if not pool:
             continue
 
-        for level_attempt in range(_MAX_LEVEL_RETRIES):
-            has_red_bubble = False
-            has_blue_bubble = False
-
-            for room in level.rooms:
-                enemy = room.enemy_spec.enemy
-                if _is_excluded_from_enemy_shuffling(enemy):
-                    continue
-
-                for room_attempt in range(_MAX_ROOM_RETRIES):
-                    replacement = rng.choice(pool)
-
-                    if not is_safe_for_room(replacement, room.room_type, has_push_block=room.movable_block):
-                        continue
-
-                    # Track bubble types for level-wide balance check
-                    if replacement == Enemy.RED_BUBBLE:
-                        has_red_bubble = True
-                    if replacement == Enemy.BLUE_BUBBLE:
-                        has_blue_bubble = True
-
-                    room.enemy_spec.enemy = replacement
-                    break  # room successfully assigned
-
-            # Bubble balance: red bubbles without blue bubbles can softlock
-            if not (has_red_bubble and not has_blue_bubble):
-                break  # level is fine, move on
+        if legacy_sampling:
+            _redistribute_level_legacy(level, rng, pool)
+        else:
+            _redistribute_level(level, rng, pool)
 
     # TODO: When allow_q2_monsters is enabled, the original patches three
     # 6502 branch instructions (BNE = 0xD0) at ROM addresses 0x1135D,
@@ -231,6 +319,7 @@ def shuffle_monsters_between_levels(
     world: GameWorld,
     rng: Rng,
     include_level_9: bool = False,
+    legacy_sampling: bool = False,
 ) -> None:
     """Shuffle enemies between dungeon levels.
 
@@ -245,6 +334,8 @@ def shuffle_monsters_between_levels(
         include_level_9: If True, level 9 participates in the sprite set
             shuffle. If False, level 9 keeps sprite set C and its enemies
             are not replaced.
+        legacy_sampling: If True, pick replacements by pick-and-retry like
+            the original, for the same seeds as earlier versions.
     """
     pools = _build_enemy_pools(world)
     sprite_set_assignments = _shuffle_sprite_set_assignments(rng, include_level_9)
@@ -253,4 +344,4 @@ def shuffle_monsters_between_levels(
     for level in world.levels:
         level.enemy_sprite_set = sprite_set_assignments[level.level_num]
 
-    _redistribute_enemies(world, rng, pools, sprite_set_assignments, include_level_9)
+    _redistribute_enemies(world, rng, pools, sprite_set_assignments, include_level_9, legacy_sampling)
@@ -2,6 +2,14 @@ from dataclasses import dataclass, field
 
 from zora.data_model import Destination, EntranceType, GameWorld, QuestVisibility
 from zora.game_config import GameConfig
+from zora.overworld_requirements import (
+    REQ_DEAD_WOODS_HINT,
+    REQ_LADDER,
+    REQ_LOST_HILLS_HINT,
+    REQ_POWER_BRACELET,
+    REQ_RAFT,
+    REQ_RECORDER,
+)
 from zora.rng import Rng
 
 # ---------------------------------------------------------------------------
@@ -25,28 +33,36 @@ _ANY_ROAD_STAIRS_CODE = 5
 # Location requirement helpers
 # ---------------------------------------------------------------------------
 
-def _need_raft(loc: int, raft_locations: list[int]) -> bool:
-    return loc in raft_locations
+# Requirements that make a screen a candidate for the overworld block.
+_BLOCK_REQUIREMENTS = REQ_RECORDER | REQ_RAFT | REQ_LADDER
 
+# Screens exempt from counting as a bracelet block.
+_BRACELET_BLOCK_EXEMPT_SCREENS = frozenset([0x20, 0x21])
 
-def _need_recorder(loc: int, recorder_locations: list[int]) -> bool:
-    return loc in recorder_locations
-
-
-def _need_ladder(loc: int) -> bool:
-    return loc in _LADDER_LOCATIONS
-
-
-def _need_bracelet(loc: int, bracelet_locations: list[int]) -> bool:
-    return loc in bracelet_locations
-
-
-def _need_lost_hills_hint(loc: int, lost_hills_screens: frozenset[int]) -> bool:
-    return loc in lost_hills_screens
 
+def _build_location_requirement_masks(
+    raft_locations: list[int],
+    recorder_locations: list[int],
+    bracelet_locations: list[int],
+    lost_hills_screens: frozenset[int] = frozenset(),
+    dead_woods_screens: frozenset[int] = frozenset(),
+) -> dict[int, int]:
+    """Compile the shuffler's location lists into screen_num → REQ_* mask.
 
-def _need_dead_woods_hint(loc: int, dead_woods_screens: frozenset[int]) -> bool:
-    return loc in dead_woods_screens
+    Screens absent from the result need no item to enter.
+    """
+    masks: dict[int, int] = {}
+    for locations, bit in (
+        (raft_locations,     REQ_RAFT),
+        (recorder_locations, REQ_RECORDER),
+        (_LADDER_LOCATIONS,  REQ_LADDER),
+        (bracelet_locations, REQ_POWER_BRACELET),
+        (lost_hills_screens, REQ_LOST_HILLS_HINT),
+        (dead_woods_screens, REQ_DEAD_WOODS_HINT),
+    ):
+        for loc in locations:
+            masks[loc] = masks.get(loc, 0) | bit
+    return masks
 
 
 def _screens_with_destination(game_world: GameWorld, dest: Destination) -> frozenset[int]:
@@ -56,23 +72,9 @@ def _screens_with_destination(game_world: GameWorld, dest: Destination) -> froze
     )
 
 
-def _need_no_item_to_enter(
-    loc: int,
-    raft_locations: list[int],
-    recorder_locations: list[int],
-    bracelet_locations: list[int],
-    lost_hills_screens: frozenset[int] = frozenset(),
-    dead_woods_screens: frozenset[int] = frozenset(),
-) -> bool:
+def _need_no_item_to_enter(loc: int, requirement_masks: dict[int, int]) -> bool:
     """Returns True if the screen can be reached without any special item or virtual item."""
-    return not (
-        _need_raft(loc, raft_locations)
-        or _need_recorder(loc, recorder_locations)
-        or _need_ladder(loc)
-        or _need_bracelet(loc, bracelet_locations)
-        or _need_lost_hills_hint(loc, lost_hills_screens)
-        or _need_dead_woods_hint(loc, dead_woods_screens)
-    )
+    return loc not in requirement_masks
 
 
 # ---------------------------------------------------------------------------
@@ -82,9 +84,7 @@ def _need_no_item_to_enter(
 def _overworld_block_exists(
     cave_types: list[int],
     screen_locations: list[int],
-    raft_locations: list[int],
-    recorder_locations: list[int],
-    bracelet_locations: list[int],
+    requirement_masks: dict[int, int],
 ) -> bool:
     """
     Returns True if the shuffled cave assignment contains at least one
@@ -92,21 +92,111 @@ def _overworld_block_exists(
     or == LETTER_CAVE (0x18). This is the "overworld block" check that
     gates certain game-completion paths.
     """
-    for i, cave_type in enumerate(cave_types):
-        if cave_type >= 10 and cave_type != Destination.LETTER_CAVE.value:
+    return any(
+        _is_block_cave_type(cave_type) and _is_block_location(screen_locations[i], requirement_masks)
+        for i, cave_type in enumerate(cave_types)
+    )
+
+
+def _is_block_cave_type(cave_type: int) -> bool:
+    """Dungeons and the letter cave are the caves that can form a block."""
+    return cave_type < 10 or cave_type == Destination.LETTER_CAVE.value
+
+
+def _is_block_location(loc: int, requirement_masks: dict[int, int]) -> bool:
+    mask = requirement_masks.get(loc, 0)
+    if mask & _BLOCK_REQUIREMENTS:
+        # Requires recorder, raft, or ladder — counts as a block.
+        return True
+    # Freely accessible without recorder/raft/ladder — check bracelet.
+    # Screens 0x20 and 0x21 are exempt from the bracelet check.
+    return bool(mask & REQ_POWER_BRACELET) and loc not in _BRACELET_BLOCK_EXEMPT_SCREENS
+
+
+# ---------------------------------------------------------------------------
+# Constructive shuffle
+# ---------------------------------------------------------------------------
+
+def _place_cave_types(
+    cave_types: list[int],
+    cave_screens: list[int],
+    slots: list[int],
+    requirement_masks: dict[int, int],
+    dungeon_original_screens: list[int],
+    overworld_block_needed: bool,
+    rng: Rng,
+) -> list[int]:
+    """
+    Shuffles the cave types in the given slots so that every placement rule
+    holds by construction, instead of swapping at random and checking after.
+
+    The constrained caves are placed first, each on a screen drawn from the
+    ones its rule allows: a block cave on a block screen (when the overworld
+    block is needed and the fixed slots don't already form one), then the
+    wood sword cave on a screen that needs no item. The remaining types are
+    shuffled into the remaining slots, and any dungeon that lands on the
+    screen matching its own entrance_room is swapped with a random slot
+    where both sides are legal. The swap is drawn only from the slots
+    shuffled in that last step, not from the block or wood sword slots, so
+    it can fail on layouts where a wider swap would have worked.
+
+    Returns the new cave_types list.
+
+    Raises:
+        RuntimeError: if no block cave fits a free block screen, no free
+            screen needs no item for the wood sword cave, or a dungeon on
+            its own entrance screen has no legal swap partner.
+    """
+    def glitches(cave_type: int, loc: int) -> bool:
+        return (cave_type < 10 and 0 <= cave_type < len(dungeon_original_screens)
+                and loc == dungeon_original_screens[cave_type])
+
+    placed = list(cave_types)
+    free = list(slots)
+    types = [cave_types[k] for k in slots]
+
+    def place(type_idx: int, slot: int) -> None:
+        placed[slot] = types.pop(type_idx)
+        free.remove(slot)
+
+    if overworld_block_needed:
+        slot_set = set(slots)
+        fixed = [k for k in range(len(cave_types)) if k not in slot_set]
+        if not _overworld_block_exists([cave_types[k] for k in fixed], [cave_screens[k] for k in fixed],
+                                       requirement_masks):
+            block_slots = [k for k in free if _is_block_location(cave_screens[k], requirement_masks)]
+            candidates = [
+                (t, k) for t, cave_type in enumerate(types) if _is_block_cave_type(cave_type)
+                for k in block_slots if not glitches(cave_type, cave_screens[k])
+            ]
+            if not candidates:
+                raise RuntimeError("Cave shuffle failed — no block cave can go on a free block screen")
+            place(*rng.choice(candidates))
+
+    if _CAVE_TYPE_WOOD_SWORD in types:
+        # Wood sword: must land on a screen reachable without any item or virtual item.
+        no_item_slots = [k for k in free if _need_no_item_to_enter(cave_screens[k], requirement_masks)]
+        if not no_item_slots:
+            raise RuntimeError("Cave shuffle failed — no free screen without item requirements for the wood sword cave")
+        place(types.index(_CAVE_TYPE_WOOD_SWORD), rng.choice(no_item_slots))
+
+    rng.shuffle(types)
+    for k, cave_type in zip(free, types, strict=True):
+        placed[k] = cave_type
+    for k in free:
+        cave_type = placed[k]
+        if not glitches(cave_type, cave_screens[k]):
             continue
-        loc = screen_locations[i]
-        if (not _need_recorder(loc, recorder_locations)
-                and not _need_raft(loc, raft_locations)
-                and not _need_ladder(loc)):
-            # Freely accessible without recorder/raft/ladder — check bracelet.
-            # Screens 0x20 and 0x21 are exempt from the bracelet check.
-            if _need_bracelet(loc, bracelet_locations) and loc not in (0x20, 0x21):
-                return True
-        else:
-            # Requires recorder, raft, or ladder — counts as a block.
-            return True
-    return False
+        partners = [
+            m for m in free
+            if not glitches(placed[m], cave_screens[k]) and not glitches(cave_type, cave_screens[m])
+        ]
+        if not partners:
+            raise RuntimeError(f"Cave shuffle failed — dungeon {cave_type} is on its own entrance screen "
+                               "and no shuffled slot can swap with it")
+        m = rng.choice(partners)
+        placed[k], placed[m] = placed[m], cave_type
+    return placed
 
 
 # ---------------------------------------------------------------------------
@@ -192,6 +282,7 @@ def shuffle_caves(
     bracelet_locations: list[int] | None = None,
     lost_hills_screens: frozenset[int] = frozenset(),
     dead_woods_screens: frozenset[int] = frozenset(),
+    legacy_sampling: bool = False,
 ) -> CaveShuffleResult | None:
     """
     Shuffles cave entrance assignments on the overworld, mutating world in place.
@@ -212,6 +303,11 @@ def shuffle_caves(
     bracelet_locations    : screens requiring the power bracelet (default: [])
     lost_hills_screens    : screens in the lost hills maze area (excluded from wood sword placement)
     dead_woods_screens    : screens in the dead woods maze area (excluded from wood sword placement)
+    legacy_sampling       : shuffle with the original swap loop, which can fail the overworld
+                            block check, instead of placing the constrained caves first
+
+    Raises RuntimeError, with the reason, if the constructive shuffle finds no
+    arrangement (see _place_cave_types).
     """
     if raft_locations is None:
         raft_locations = [0x2F, 0x45]
@@ -220,6 +316,11 @@ def shuffle_caves(
     if bracelet_locations is None:
         bracelet_locations = []
 
+    requirement_masks = _build_location_requirement_masks(
+        raft_locations, recorder_locations, bracelet_locations,
+        lost_hills_screens, dead_woods_screens,
+    )
+
     overworld = world.overworld
     screens_by_num = {s.screen_num: s for s in overworld.screens}
 
@@ -303,12 +404,28 @@ def shuffle_caves(
         cave_types[wood_sword_idx],     cave_types[last]     = cave_types[last],     cave_types[wood_sword_idx]
 
     # ------------------------------------------------------------------
-    # Step 5: Main shuffle loop
+    # Step 5: Shuffle cave_types
     #
-    # Only cave_types is swapped; cave_screens and cave_tile_data stay
+    # Only cave_types is permuted; cave_screens and cave_tile_data stay
     # in their original positions throughout.
     # ------------------------------------------------------------------
-    if shuffle or just_dungeons or shuffle_dungeons:
+    if (shuffle or just_dungeons or shuffle_dungeons) and not legacy_sampling:
+        slots = [
+            k for k, cave_type in enumerate(cave_types)
+            if (shuffle if cave_type > 9 else just_dungeons or shuffle_dungeons)
+        ]
+        cave_types = _place_cave_types(
+            cave_types, cave_screens, slots, requirement_masks,
+            dungeon_original_screens, overworld_block_needed, rng,
+        )
+
+    elif shuffle or just_dungeons or shuffle_dungeons:
+        # Slots whose screen needs no item to enter. cave_screens never changes
+        # during the loop, so this is computed once up front.
+        no_item_slots = [
+            k for k in range(len(cave_screens))
+            if _need_no_item_to_enter(cave_screens[k], requirement_masks)
+        ]
         i = 0
         while i < len(cave_types):
             advance = True
@@ -341,15 +458,7 @@ def shuffle_caves(
 
             if cave_types[i] == _CAVE_TYPE_WOOD_SWORD:
                 # Wood sword: must land on a screen reachable without any item or virtual item.
-                accessible = [
-                    k for k in range(len(cave_screens))
-                    if _need_no_item_to_enter(
-                        cave_screens[k],
-                        raft_locations, recorder_locations, bracelet_locations,
-                        lost_hills_screens, dead_woods_screens,
-                    )
-                ]
-                k = rng.choice(accessible)
+                k = rng.choice(no_item_slots)
                 offset = k - i
                 do_swap = True
             else:
@@ -430,10 +539,7 @@ def shuffle_caves(
     # Step 7: Final validation
     # ------------------------------------------------------------------
     if overworld_block_needed:
-        if not _overworld_block_exists(
-            cave_types, cave_screens,
-            raft_locations, recorder_locations, bracelet_locations,
-        ):
+        if not _overworld_block_exists(cave_types, cave_screens, requirement_masks):
             return None
 
     return result
@@ -527,19 +633,19 @@ def randomize_entrances(game_world: GameWorld, config: GameConfig, rng: Rng) ->
         bracelet_locations=bracelet_locations,
         lost_hills_screens=lost_hills_screens,
         dead_woods_screens=dead_woods_screens,
+        legacy_sampling=config.legacy_cave_shuffle,
     )
 
-    # The shuffle is randomized and may produce an arrangement that fails the
-    # overworld block check. Retry up to 50 times with fresh RNG draws before
-    # giving up. Each failed attempt already wrote back to game_world, but the
-    # next attempt rebuilds working lists from the (now-shuffled) state and
-    # re-shuffles, so stale state doesn't accumulate.
-    max_attempts = 50
-    result = None
+    # The constructive shuffle places a block cave itself and raises with the
+    # reason if it finds no arrangement, so it never returns None and one
+    # call is final. The legacy swap loop may produce an arrangement that
+    # fails the overworld block check: retry it up to 50 times with fresh RNG
+    # draws before giving up. Each failed attempt already wrote back to
+    # game_world, but the next attempt rebuilds working lists from the
+    # (now-shuffled) state and re-shuffles, so stale state doesn't accumulate.
+    max_attempts = 50 if config.legacy_cave_shuffle else 1
     for _ in range(max_attempts):
-        result = shuffle_caves(game_world, rng, **shuffle_kwargs)
-        if result is not None:
-            break
-    if result is None:
-        raise RuntimeError("Cave shuffle failed — overworld block check not satisfied after "
-                           f"{max_attempts} attempts")
+        if shuffle_caves(game_world, rng, **shuffle_kwargs) is not None:
+            return
+    raise RuntimeError("Cave shuffle failed — overworld block check not satisfied after "
+                       f"{max_attempts} attempts")
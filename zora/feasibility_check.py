@@ -0,0 +1,80 @@
+"""
+Cheap feasibility gate that runs right after entrance shuffling.
+
+Some entrance layouts can never produce a valid seed. Without this gate that
+is only discovered once assumed fill gives up, after dungeons, enemies, shops
+and caves have been randomized and three fill attempts have run. This step
+rejects such layouts up front by raising RuntimeError, which _run_pipeline
+already treats as "retry with a fresh game world".
+
+The check is a necessary condition of GameValidator.is_seed_valid() that no
+later pipeline step can change, so a layout is only rejected if it is doomed:
+the validator requires the wood sword cave or the letter cave to sit on an
+OPEN screen and hold a sword or wand, and entrance shuffle can put both caves
+behind bombs, candles, etc.
+
+Only conditions that depend on the entrance layout belong here. A failure
+that every layout shares would make each _run_pipeline retry fail the same
+way.
+"""
+
+import logging
+from dataclasses import dataclass
+
+from zora.data_model import Destination, EntranceType, GameWorld, Item, ItemCave
+from zora.game_config import GameConfig
+from zora.rng import Rng
+
+log = logging.getLogger(__name__)
+
+_SWORD_OR_WAND_ITEMS = (Item.WOOD_SWORD, Item.WHITE_SWORD, Item.MAGICAL_SWORD, Item.WAND)
+
+
+@dataclass
+class FeasibilityStats:
+    """How often the gate ran and how many pipeline attempts it cut short."""
+
+    checked: int = 0
+    rejected: int = 0
+
+
+# Process-wide counters, reported by batch tools and logged on each rejection.
+stats = FeasibilityStats()
+
+
+def _can_start_with_sword_or_wand(game_world: GameWorld, config: GameConfig) -> bool:
+    """True if the wood sword cave or letter cave is on an OPEN screen and can
+    end up holding a sword or wand (it holds one now, or its item is shuffled)."""
+    shuffled = {
+        Destination.WOOD_SWORD_CAVE: config.shuffle_wood_sword,
+        Destination.LETTER_CAVE: config.shuffle_letter,
+    }
+    ow = game_world.overworld
+    for screen in ow.screens:
+        if screen.entrance_type != EntranceType.OPEN or screen.destination not in shuffled:
+            continue
+        if shuffled[screen.destination]:
+            return True
+        cave = ow.get_cave(screen.destination, ItemCave)
+        if cave is not None and cave.item in _SWORD_OR_WAND_ITEMS:
+            return True
+    return False
+
+
+def check_entrance_feasibility(game_world: GameWorld, config: GameConfig, rng: Rng) -> None:
+    """Reject entrance layouts that cannot lead to a valid seed.
+
+    Pipeline step; must run after randomize_entrances. Consumes no RNG, so
+    accepted layouts randomize exactly as they would without the gate.
+
+    Raises:
+        RuntimeError: if the layout is doomed.
+    """
+    stats.checked += 1
+    if _can_start_with_sword_or_wand(game_world, config):
+        return
+    reason = "no sword or wand cave on an open screen"
+    stats.rejected += 1
+    log.info("Entrance layout rejected before the full pipeline (%s); %d of %d layouts rejected",
+             reason, stats.rejected, stats.checked)
+    raise RuntimeError(f"Infeasible entrance layout: {reason}")
@@ -0,0 +1,88 @@
+"""
+Time assumed fill on fresh worlds, split into reachability and scoring time.
+
+Each seed runs assumed_fill on a freshly parsed vanilla world. Each fill
+iteration places one item and makes one reachability query, so times are
+reported per iteration:
+  reach   time spent in the validator (reachability queries, final check)
+  score   everything else: MRV scoring, placement, setup
+
+Usage:
+    python3 -m zora.fill_benchmark [--flags <flag_string>] [--seeds 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from flags.flags_generated import decode_flags
+from zora.data_model import Item
+from zora.game_config import resolve_game_config
+from zora.game_validator import GameValidator
+from zora.item_randomizer import assumed_fill
+from zora.parser import load_bin_files, parse_game_world
+from zora.rng import SeededRng
+
+BIN_DIR = Path(__file__).resolve().parents[1] / "rom_data"
+
+
+class _TimedValidator(GameValidator):
+    """GameValidator that accumulates time spent in fill reachability queries
+    and the final validity check."""
+
+    reach_seconds = 0.0
+    queries = 0
+
+    def get_reachable_masks_without_each(
+        self, assumed_pool: Sequence[Item],
+    ) -> tuple[int, dict[Item, int]]:
+        start = time.perf_counter()
+        try:
+            return super().get_reachable_masks_without_each(assumed_pool)
+        finally:
+            _TimedValidator.reach_seconds += time.perf_counter() - start
+            _TimedValidator.queries += 1
+
+    def is_seed_valid(self) -> bool:
+        start = time.perf_counter()
+        try:
+            return super().is_seed_valid()
+        finally:
+            _TimedValidator.reach_seconds += time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark assumed fill")
+    parser.add_argument("--flags", type=str, default="", help="Flag string (default: all off)")
+    parser.add_argument("--seeds", type=int, default=20, help="Number of seeds, starting at 1 (default: 20)")
+    args = parser.parse_args()
+
+    flags = decode_flags(args.flags)
+    bins = load_bin_files(BIN_DIR)
+
+    total = 0.0
+    failures = 0
+    for seed in range(1, args.seeds + 1):
+        game_world = parse_game_world(bins)
+        config = resolve_game_config(flags, SeededRng(seed))
+        start = time.perf_counter()
+        if not assumed_fill(game_world, config, SeededRng(seed), validator_type=_TimedValidator):
+            failures += 1
+        total += time.perf_counter() - start
+
+    iterations = max(_TimedValidator.queries, 1)
+    reach = _TimedValidator.reach_seconds
+    print(f"fills: {args.seeds} ({failures} failed), iterations: {_TimedValidator.queries}")
+    print(f"total: {total:.2f}s   reach: {reach:.2f}s   score: {total - reach:.2f}s")
+    print(f"per iteration: reach {1000 * reach / iterations:.2f}ms   "
+          f"score {1000 * (total - reach) / iterations:.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Compare the item fill engines on speed, success rate and item placement.
+
+Each seed runs every engine in item_randomizer.FILL_ENGINES once, on its own
+freshly parsed vanilla world with the same seed. Reported per engine:
+  ms/seed   mean time of one fill attempt
+  success   attempts that produced a valid seed (randomize_items retries the
+            rest, so this is a per-attempt rate)
+  dungeon   share of placed major items that landed in a dungeon
+
+Placement is compared per item as the total variation distance between each
+engine's item -> area distribution and assumed fill's (0 = same, 1 =
+disjoint), where an area is a dungeon level or the overworld. The "noise"
+line is the same distance between two halves of the assumed fill seeds:
+differences at that level are sampling noise.
+
+Usage:
+    python3 -m zora.fill_engine_benchmark [--flags <flag_string>] [--seeds 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from flags.flags_generated import decode_flags
+from zora.data_model import Item
+from zora.game_config import resolve_game_config
+from zora.game_validator import DungeonLocation, Location
+from zora.item_randomizer import FILL_ENGINES, FillStats, ShuffleSurface
+from zora.parser import load_bin_files, parse_game_world
+from zora.rng import SeededRng
+
+BIN_DIR = Path(__file__).resolve().parents[1] / "rom_data"
+
+# item -> how often it was placed in each area (dungeon level, 0 = overworld)
+_Placements = dict[Item, Counter[int]]
+
+
+def _area(loc: Location) -> int:
+    return loc.level_num if isinstance(loc, DungeonLocation) else 0
+
+
+def _total_variation(a: _Placements, b: _Placements) -> dict[Item, float]:
+    """Per item, the total variation distance between two placement distributions."""
+    distances: dict[Item, float] = {}
+    for item in a.keys() & b.keys():
+        a_total, b_total = sum(a[item].values()), sum(b[item].values())
+        areas = a[item].keys() | b[item].keys()
+        distances[item] = 0.5 * sum(abs(a[item][area] / a_total - b[item][area] / b_total) for area in areas)
+    return distances
+
+
+def _dungeon_share(placements: _Placements) -> float:
+    total = sum(sum(c.values()) for c in placements.values())
+    in_dungeons = sum(n for c in placements.values() for area, n in c.items() if area)
+    return in_dungeons / max(total, 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare item fill engines")
+    parser.add_argument("--flags", type=str, default="", help="Flag string (default: all off)")
+    parser.add_argument("--seeds", type=int, default=50, help="Number of seeds, starting at 1 (default: 50)")
+    args = parser.parse_args()
+
+    flags = decode_flags(args.flags)
+    bins = load_bin_files(BIN_DIR)
+
+    seconds: dict[str, float] = defaultdict(float)
+    successes: Counter[str] = Counter()
+    placements: dict[str, _Placements] = {name: defaultdict(Counter) for name in FILL_ENGINES}
+    # Assumed fill placements split by seed parity, for the noise floor.
+    halves: list[_Placements] = [defaultdict(Counter), defaultdict(Counter)]
+
+    for seed in range(1, args.seeds + 1):
+        for name, fill in FILL_ENGINES.items():
+            game_world = parse_game_world(bins)
+            config = resolve_game_config(flags, SeededRng(seed))
+            surface = ShuffleSurface(game_world, config)
+            start = time.perf_counter()
+            ok = fill(game_world, config, SeededRng(seed), FillStats(), surface)
+            seconds[name] += time.perf_counter() - start
+            if not ok:
+                continue
+            successes[name] += 1
+            for loc in surface.locations:
+                item = surface.get(loc)
+                placements[name][item][_area(loc)] += 1
+                if name == "assumed":
+                    halves[seed % 2][item][_area(loc)] += 1
+
+    print(f"{'engine':<10} {'ms/seed':>8} {'success':>9} {'dungeon':>8} {'TV vs assumed':>14}")
+    for name in FILL_ENGINES:
+        tv = _total_variation(placements[name], placements["assumed"])
+        mean_tv = sum(tv.values()) / max(len(tv), 1)
+        print(f"{name:<10} {1000 * seconds[name] / args.seeds:>8.1f} "
+              f"{successes[name]:>4}/{args.seeds:<4} {_dungeon_share(placements[name]):>8.2f} {mean_tv:>14.3f}")
+    noise = _total_variation(halves[0], halves[1])
+    print(f"{'noise':<10} {'':>8} {'':>9} {'':>8} {sum(noise.values()) / max(len(noise), 1):>14.3f}")
+
+    others = [name for name in FILL_ENGINES if name != "assumed"]
+    if not others:
+        return
+    print()
+    print(f"{'item':<18} {'noise':>6} " + " ".join(f"{name:>8}" for name in others))
+    distances = {name: _total_variation(placements[name], placements["assumed"]) for name in others}
+    for item in sorted(placements["assumed"], key=lambda i: i.name):
+        row = " ".join(f"{distances[name].get(item, float('nan')):>8.3f}" for name in others)
+        print(f"{item.name:<18} {noise.get(item, float('nan')):>6.3f} {row}")
+
+
+if __name__ == "__main__":
+    main()
@@ -74,6 +74,10 @@ class GameConfig:
     # Validator behaviour
     avoid_required_hard_combat: bool = False
 
+    # Item fill tuning (server-side; not part of the flag string)
+    fill_engine: str = "assumed"  # key into item_randomizer.FILL_ENGINES
+    max_fill_backtracks: int = 0
+
     # Item behaviour
     progressive_items: bool = False
     add_extra_candles: bool = False
@@ -98,6 +102,10 @@ class GameConfig:
     shuffle_armos_location: bool = False
     include_wood_sword_cave: bool = False
     include_any_road_caves: bool = False
+    # Server-side; not part of the flag string. True = shuffle caves by the
+    # original swap loop, retried until the overworld block check passes,
+    # reproducing seeds from before the constructive shuffle.
+    legacy_cave_shuffle: bool = False
 
     # Speed patches
     speed_up_dungeon_transitions: bool = False
@@ -158,6 +166,11 @@ class GameConfig:
 
     # Dungeon room randomization
     shuffle_dungeon_rooms: bool = False
+    # Server-side; not part of the flag string. 0 = shuffle levels in order
+    # on the shared RNG stream. N >= 1 = one RNG substream per level, levels
+    # shuffled by N worker processes (1 = in this process). Any N >= 1 gives
+    # the same dungeons; they differ from the N = 0 dungeons.
+    dungeon_shuffle_workers: int = 0
 
     # Enemy randomization
     shuffle_dungeon_monsters: bool = False
@@ -178,6 +191,10 @@ class GameConfig:
     max_enemy_health: bool = False
     max_boss_health: bool = False
     swordless: bool = False
+    # Server-side; not part of the flag string. True = shuffle, group and
+    # replace enemies and bosses by pick-and-retry like the original,
+    # reproducing seeds from before the direct samplers.
+    legacy_enemy_sampling: bool = False
 
 def _resolve_hint_mode(flag_hint_mode: FlagHintMode, rng: Rng) -> HintMode:
     """Resolve the hint_mode enum flag to a concrete HintMode.
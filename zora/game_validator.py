@@ -4,9 +4,13 @@ GameValidator: reachability engine for Zelda 1 randomizer seeds.
 Simulates what a player can collect given the current GameWorld state and
 determines whether a seed is beatable (all itemdicts obtainable, kidnapped rescued).
 
-Does NOT mutate GameWorld. All mutable state lives on this object.
+Does NOT mutate GameWorld. The validator holds only the compiled world model;
+all mutable traversal state lives in a TraversalState created per query, so one
+validator can answer nested or concurrent queries.
 """
-from dataclasses import dataclass
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
 
 from zora.data_model import (
     Destination,
@@ -29,6 +33,14 @@ from zora.data_model import (
     WallType,
 )
 from zora.inventory import Inventory
+from zora.overworld_requirements import (
+    ENTRANCE_TYPE_REQUIREMENTS,
+    REQ_DEAD_WOODS_HINT,
+    REQ_LOST_HILLS_HINT,
+    inventory_requirement_mask,
+    is_satisfied,
+    screen_requirement_masks,
+)
 
 # Room types where mobility may be restricted without a ladder.
 # Maps room type → valid travel directions when player has no ladder.
@@ -55,6 +67,193 @@ _DIRECTION_SENSITIVE_ROOM_TYPES: frozenset[RoomType] = frozenset(
     _LADDER_BLOCK_VALID_DIRS.keys() | _CONSTRAINED_VALID_DIRS.keys()
 )
 
+_EXIT_DIRECTIONS = (Direction.WEST, Direction.NORTH, Direction.EAST, Direction.SOUTH)
+
+_ZERO_HP_ENEMIES = frozenset({Enemy.GEL_1, Enemy.GEL_2, Enemy.BLUE_KEESE, Enemy.RED_KEESE, Enemy.DARK_KEESE})
+_HARD_COMBAT_ENEMIES = frozenset({
+    Enemy.GLEEOK_1, Enemy.GLEEOK_2, Enemy.GLEEOK_3, Enemy.GLEEOK_4,
+    Enemy.PATRA_1, Enemy.PATRA_2, Enemy.BLUE_DARKNUT, Enemy.BLUE_WIZZROBE,
+})
+
+# An inventory predicate that must hold to defeat a room's enemies.
+_DefeatCheck = Callable[[Inventory], bool]
+
+# One passable exit: (exit direction, wall on that side, next room, entry direction there).
+_Exit = tuple[Direction, WallType, int, Direction]
+
+
+def _is_path_unconditionally_obstructed(room_type: RoomType,
+                                        from_dir: Direction, to_dir: Direction) -> bool:
+    # STAIRCASE entry means the player arrived via staircase — never obstructed
+    if from_dir == Direction.STAIRCASE:
+        return False
+    if room_type in _CONSTRAINED_VALID_DIRS:
+        valid = _CONSTRAINED_VALID_DIRS[room_type]
+        if from_dir not in valid or to_dir not in valid:
+            return True
+    return False
+
+
+def _is_path_obstructed_by_water(room_type: RoomType,
+                                 from_dir: Direction, to_dir: Direction,
+                                 has_ladder: bool) -> bool:
+    # STAIRCASE entry means the player arrived via staircase — never obstructed
+    if from_dir == Direction.STAIRCASE:
+        return False
+    if not has_ladder and room_type in _LADDER_BLOCK_VALID_DIRS:
+        valid = _LADDER_BLOCK_VALID_DIRS[room_type]
+        if from_dir not in valid or to_dir not in valid:
+            return True
+    return False
+
+
+def _is_item_position_accessible(entry_direction: Direction, room: Room, item_x: int, item_y: int,
+                                 has_ladder: bool, level_num: int) -> bool:
+    """Room-geometry part of item pickup: can the item tile be reached from this door?
+
+    Raises ValueError if the item sits on a wall or obstacle of a zoned room.
+    """
+    rt = room.room_type
+    if rt == RoomType.HORIZONTAL_CHUTE_ROOM:
+        # Walls span rows 8 and a, dividing the room into three zones:
+        #   top zone    (Y in {6, 7}): accessible only from NORTH door
+        #   middle zone (Y == 9):      accessible only from EAST or WEST door
+        #   bottom zone (Y in {b, c}): accessible only from SOUTH door
+        if item_y in (0x6, 0x7):
+            return entry_direction == Direction.NORTH
+        if item_y == 0x9:
+            return entry_direction in (Direction.EAST, Direction.WEST)
+        if item_y in (0xB, 0xC):
+            return entry_direction == Direction.SOUTH
+        raise ValueError(
+            f"Level {level_num} room {room.room_num:#04x}: "
+            f"HORIZONTAL_CHUTE_ROOM item Y={item_y:#x} is not in a valid zone "
+            f"(expected 6-7, 9, or b-c) — item is on a wall or obstacle"
+        )
+    if rt == RoomType.VERTICAL_CHUTE_ROOM:
+        # Walls span columns 6 and 9, dividing the room into three zones:
+        #   left zone   (X in {2..5}): accessible only from WEST door
+        #   middle zone (X in {7, 8}): accessible only from NORTH or SOUTH door
+        #   right zone  (X in {a..d}): accessible only from EAST door
+        if 0x2 <= item_x <= 0x5:
+            return entry_direction == Direction.WEST
+        if item_x in (0x7, 0x8):
+            return entry_direction in (Direction.NORTH, Direction.SOUTH)
+        if 0xA <= item_x <= 0xD:
+            return entry_direction == Direction.EAST
+        raise ValueError(
+            f"Level {level_num} room {room.room_num:#04x}: "
+            f"VERTICAL_CHUTE_ROOM item X={item_x:#x} is not in a valid zone "
+            f"(expected 2-5, 7-8, or a-d) — item is on a wall or obstacle"
+        )
+    if rt == RoomType.T_ROOM:
+        # The T-room has a stem extending south from the horizontal bar.
+        # Two zones based on item position:
+        #   bar zone  (X==2, X==d, or Y==6):        accessible from WEST, NORTH, or EAST
+        #   stem zone (X in {5..a} AND Y in {8..c}): accessible only from SOUTH
+        if item_x == 0x2 or item_x == 0xD or item_y == 0x6:
+            return entry_direction in (Direction.WEST, Direction.NORTH, Direction.EAST)
+        if 0x5 <= item_x <= 0xA and 0x8 <= item_y <= 0xC:
+            return entry_direction == Direction.SOUTH
+        raise ValueError(
+            f"Level {level_num} room {room.room_num:#04x}: "
+            f"T_ROOM item X={item_x:#x} Y={item_y:#x} is not in a valid zone "
+            f"(expected X==2, X==d, Y==6, or X in 5-a with Y in 8-c) — item is on a wall or obstacle"
+        )
+    if rt == RoomType.DOUBLE_MOAT_ROOM and not has_ladder:
+        # Walls span columns 6 and 9, dividing the room into three zones:
+        #   left zone   (X in {2..5}): accessible only from WEST door
+        #   middle zone (X in {7, 8}): accessible only from NORTH or SOUTH door
+        #   right zone  (X in {a..d}): accessible only from EAST door
+        if item_y == 0x06 and entry_direction == Direction.NORTH:
+                return True
+        if item_y in (0x08, 0x09, 0x0A) and entry_direction in (Direction.EAST, Direction.WEST):
+                return True
+        if item_y == 0x0C and entry_direction == Direction.SOUTH:
+                return True
+        return False
+    if rt == RoomType.HORIZONTAL_MOAT_ROOM and not has_ladder:
+        # Water spans row 8; two zones:
+        #   top zone    (Y in {6, 7}): accessible only from NORTH door
+        #   bottom zone (Y in {9..c}): accessible from WEST, SOUTH, or EAST door
+        if item_y in (0x6, 0x7) and entry_direction == Direction.NORTH:
+                return True
+        if 0x9 <= item_y <= 0xC and entry_direction in (Direction.WEST, Direction.SOUTH, Direction.EAST):
+                return True
+        return False
+    if rt == RoomType.VERTICAL_MOAT_ROOM and not has_ladder:
+        # Water spans column A; two zones:
+        #   left zone  (X in {2..9}): accessible from WEST, NORTH, or SOUTH door
+        #   right zone (X in {b..d}): accessible only from EAST door
+        if 0x2 <= item_x <= 0x9:
+            if entry_direction in (Direction.WEST, Direction.NORTH, Direction.SOUTH):
+                return True
+        elif 0xB <= item_x <= 0xD and entry_direction == Direction.EAST:
+                return True
+        else:
+            return False
+    if rt == RoomType.CHEVY_ROOM:
+        # Only the east alcove (X==c, Y==9) is reachable without a ladder via the EAST door.
+        # All other positions require the ladder.
+        if item_x == 0xC and item_y == 0x9:
+            return entry_direction == Direction.EAST
+        if not has_ladder:
+            return False
+    if rt == RoomType.CIRCLE_MOAT_ROOM and not has_ladder:
+        # Item inside the moat ring (X in {4..b}, Y in {8..a}) requires ladder.
+        # Item outside the ring is reachable without ladder regardless of entry door.
+        if 0x4 <= item_x <= 0xB and 0x8 <= item_y <= 0xA:
+            return False
+    if rt in _LADDER_BLOCK_VALID_DIRS and not has_ladder:
+        return False
+    return True
+
+
+@dataclass(frozen=True)
+class _RoomTable:
+    """Facts about one room that depend only on its layout and enemies.
+
+    Compiled on first visit and reused by every traversal. Tables are indexed
+    by entry direction, then by has_ladder (False/True). They hold no
+    references into the GameWorld, so worlds with the same room_layout_key()
+    can share them.
+    """
+    exits: dict[Direction, tuple[tuple[_Exit, ...], tuple[_Exit, ...]]]
+    item_access: dict[Direction, tuple[bool, bool]]
+    item_error: str | None           # set when the item tile lies on a wall of a zoned room
+    direction_sensitive: bool
+    kill_gates_item: bool            # KILLING_ENEMIES_OPENS_SHUTTERS_AND_DROPS_ITEM
+    defeat_checks: tuple[_DefeatCheck, ...] | None  # None = unkillable, always defeated
+    goriya_blocks_north: bool
+    # Staircase visits in pool order, ending at the first matching transport:
+    # (item staircase room_num, False) or (transport destination room, True).
+    staircases: tuple[tuple[int, bool], ...]
+
+
+# Compiled tables keyed by (level_num, room_num).
+RoomTables = dict[tuple[int, int], _RoomTable]
+
+
+def room_layout_key(game_world: GameWorld) -> tuple[object, ...]:
+    """Return a hashable key of everything compiled room tables depend on.
+
+    Two worlds with equal keys (and validators with equal options) compile
+    identical room tables; items and overworld entrances are not included.
+    """
+    key: list[object] = []
+    for level in game_world.levels:
+        key.append((level.level_num, tuple(level.item_position_table), tuple(level.staircase_room_pool)))
+        for sr in level.staircase_rooms:
+            key.append((sr.room_num, sr.room_type, sr.return_dest, sr.left_exit, sr.right_exit))
+        for room in level.rooms:
+            walls = room.walls
+            key.append((
+                room.room_num, room.room_type, walls.north, walls.east, walls.south, walls.west,
+                room.movable_block, room.item_position, room.room_action,
+                room.enemy_spec.enemy, tuple(room.enemy_spec.actual_enemies),
+            ))
+    return tuple(key)
+
 
 # ---------------------------------------------------------------------------
 # Location types
@@ -75,35 +274,188 @@ class CaveLocation:
 Location = DungeonLocation | CaveLocation
 
 
+class LocationRegistry:
+    """Dense integer ids for the item locations of one world.
+
+    A location gets the next free id the first time it is seen, and the
+    instance registered then is handed back for that id from then on. Sets
+    of locations can therefore be kept as int bitsets (bit i = id i) and
+    converted back without building new Location objects.
+
+    Ids are never reused or reordered, so registering a list of locations
+    on a fresh registry gives them ascending ids in list order. Lookups are
+    lock-free; registration takes a lock so concurrent queries on one
+    validator agree on ids.
+    """
+
+    def __init__(self, locations: Iterable[Location] = ()) -> None:
+        self._locations: list[Location] = []
+        self._ids: dict[Location, int] = {}
+        # Field-tuple lookups, so callers holding (level_num, room_num) or
+        # (destination, position) need not build a Location to find its id.
+        self._dungeon_ids: dict[tuple[int, int], int] = {}
+        self._cave_ids: dict[tuple[Destination, int], int] = {}
+        self._lock = threading.Lock()
+        for loc in locations:
+            self.id_of(loc)
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def id_of(self, loc: Location) -> int:
+        """Return loc's id, registering it if it is new."""
+        loc_id = self._ids.get(loc)
+        if loc_id is not None:
+            return loc_id
+        with self._lock:
+            loc_id = self._ids.get(loc)
+            if loc_id is None:
+                loc_id = len(self._locations)
+                self._locations.append(loc)
+                self._ids[loc] = loc_id
+                if isinstance(loc, DungeonLocation):
+                    self._dungeon_ids[(loc.level_num, loc.room_num)] = loc_id
+                else:
+                    self._cave_ids[(loc.destination, loc.position)] = loc_id
+        return loc_id
+
+    def dungeon_id(self, level_num: int, room_num: int) -> int:
+        loc_id = self._dungeon_ids.get((level_num, room_num))
+        return loc_id if loc_id is not None else self.id_of(DungeonLocation(level_num, room_num))
+
+    def cave_id(self, destination: Destination, position: int) -> int:
+        loc_id = self._cave_ids.get((destination, position))
+        return loc_id if loc_id is not None else self.id_of(CaveLocation(destination, position))
+
+    def location(self, loc_id: int) -> Location:
+        return self._locations[loc_id]
+
+    def bit(self, loc: Location) -> int:
+        return 1 << self.id_of(loc)
+
+    def mask(self, locations: Iterable[Location]) -> int:
+        """Bitset of the given locations' ids."""
+        mask = 0
+        for loc in locations:
+            mask |= 1 << self.id_of(loc)
+        return mask
+
+    def locations(self, mask: int) -> list[Location]:
+        """The registered locations in mask, in ascending id order."""
+        result: list[Location] = []
+        while mask:
+            low = mask & -mask
+            result.append(self._locations[low.bit_length() - 1])
+            mask ^= low
+        return result
+
+
+def build_assumed_inventory(assumed_pool: Sequence[Item]) -> Inventory:
+    """Return the assumed inventory for a pool of not-yet-placed items.
+
+    Triforces are tracked by level, not as generic items: one assumed level is
+    credited per unplaced triforce so the validator can open L9.
+    """
+    assumed = Inventory()
+    for item in assumed_pool:
+        assumed.items.add(item)
+    for lvl in range(1, assumed_pool.count(Item.TRIFORCE) + 1):
+        assumed.levels_with_triforce_obtained.append(lvl)
+    return assumed
+
+
+class _ProbedItemSet(set[Item]):
+    """Inventory item set that records every item whose membership is tested.
+
+    Inventory answers every item question with `item in self.items`, so the
+    probed set is exactly the set of items a traversal's outcome depends on.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.probed: set[object] = set()
+
+    def __contains__(self, item: object) -> bool:
+        self.probed.add(item)
+        return super().__contains__(item)
+
+
+@dataclass
+class TraversalState:
+    """Mutable state of one reachability query.
+
+    Owned by a single call into GameValidator and never stored on it.
+    """
+    inventory: Inventory
+    visited_rooms: set[tuple[int, int]] = field(default_factory=set)  # (level_num, room_num)
+    items_collected_rooms: set[tuple[int, int]] = field(default_factory=set)  # rooms whose item has been collected
+
+
 class GameValidator:
     def __init__(self, game_world: GameWorld, avoid_required_hard_combat: bool,
-                 progressive_items: bool = False) -> None:
+                 progressive_items: bool = False, room_tables: RoomTables | None = None) -> None:
+        """Build a validator over game_world; world state is read live at query time.
+
+        Args:
+            room_tables: Compiled room tables to share with other validators,
+                filled lazily. Only pass a dict used by validators whose worlds
+                have the same room_layout_key() and the same
+                avoid_required_hard_combat.
+        """
         self.game_world = game_world
         self.avoid_required_hard_combat = avoid_required_hard_combat
         self.progressive_items = progressive_items
-        self.inventory = Inventory(progressive_items=progressive_items)
-        self.visited_rooms: set[tuple[int, int]] = set()  # (level_num, room_num)
-        self.items_collected_rooms: set[tuple[int, int]] = set()  # rooms whose item has been collected
-        # Room lookup caches: built once, keyed by (level_num, room_num)
-        self._room_cache: dict[tuple[int, int], Room | None ] = {
+        self._room_cache: dict[tuple[int, int], Room | None] = {}
+        self._staircase_cache: dict[tuple[int, int], StaircaseRoom | None] = {}
+        self._room_tables: RoomTables = {}
+        self.invalidate_room_tables()
+        if room_tables is not None:
+            self._room_tables = room_tables
+        # Overworld requirement table: (requirement mask, destination) for every
+        # screen with a destination, in screen order. Entrance types are fixed
+        # for the lifetime of a validator, so this is compiled once.
+        self._screen_table: list[tuple[int, Destination]] = [
+            (mask, screen.destination)
+            for mask, screen in zip(screen_requirement_masks(game_world), game_world.overworld.screens,
+                                    strict=True)
+            if screen.destination != Destination.NONE
+        ]
+        # Ids for every location a query can report; see LocationRegistry.
+        self.locations = LocationRegistry()
+
+    def invalidate_room_tables(self) -> None:
+        """Rebuild room lookups and drop compiled per-room tables.
+
+        Room tables capture room type, walls, push blocks, item position and
+        enemies. They are compiled once per validator, which is safe in the
+        pipeline because the dungeon and enemy shufflers run before any
+        validator is built. Call this after mutating any of those on a world
+        this validator has already traversed. Items may change freely.
+
+        Not safe to call while another thread is traversing.
+        """
+        # Room lookup caches: keyed by (level_num, room_num)
+        self._room_cache = {
             (level.level_num, room.room_num): room
-            for level in game_world.levels
+            for level in self.game_world.levels
             for room in level.rooms
         }
-        self._staircase_cache: dict[tuple[int, int], StaircaseRoom | None] = {
+        self._staircase_cache = {
             (level.level_num, sr.room_num): sr
-            for level in game_world.levels
+            for level in self.game_world.levels
             for sr in level.staircase_rooms
         }
+        # Replaced rather than cleared: a table compiled concurrently by another
+        # traversal is identical, so racing lazy fills are harmless.
+        self._room_tables = {}
 
     # -------------------------------------------------------------------------
     # State management
     # -------------------------------------------------------------------------
 
-    def _reset(self) -> None:
-        self.inventory.reset()
-        self.visited_rooms.clear()
-        self.items_collected_rooms.clear()
+    def new_state(self) -> TraversalState:
+        """Return an empty traversal state for one query against this validator."""
+        return TraversalState(Inventory(progressive_items=self.progressive_items))
 
     # -------------------------------------------------------------------------
     # GameWorld accessors
@@ -125,53 +477,27 @@ class GameValidator:
     # Overworld traversal
     # -------------------------------------------------------------------------
 
-    def _can_access_screen(self, screen: Screen) -> bool:
-        match screen.entrance_type:
-            case EntranceType.NONE:
-                return False
-            case EntranceType.OPEN:
-                return True
-            case EntranceType.BOMB:
-                return self.inventory.has_sword_or_wand()
-            case EntranceType.CANDLE:
-                return self.inventory.has_candle()
-            case EntranceType.RECORDER:
-                return self.inventory.has(Item.RECORDER)
-            case EntranceType.RAFT:
-                return self.inventory.has(Item.RAFT)
-            case EntranceType.RAFT_AND_BOMB:
-                return self.inventory.has(Item.RAFT) and self.inventory.has_sword_or_wand()
-            case EntranceType.LADDER:
-                return self.inventory.has(Item.LADDER)
-            case EntranceType.LADDER_AND_BOMB:
-                return self.inventory.has(Item.LADDER) and self.inventory.has_sword_or_wand()
-            case EntranceType.POWER_BRACELET:
-                return self.inventory.has(Item.POWER_BRACELET)
-            case EntranceType.POWER_BRACELET_AND_BOMB:
-                return self.inventory.has(Item.POWER_BRACELET) and self.inventory.has_sword_or_wand()
-            case EntranceType.LOST_HILLS_HINT:
-                return self.inventory.has(Item.LOST_HILLS_HINT_VIRTUAL_ITEM)
-            case EntranceType.DEAD_WOODS_HINT:
-                return self.inventory.has(Item.DEAD_WOODS_HINT_VIRTUAL_ITEM)
-            case _:
-                return False
+    def _can_access_screen(self, inventory: Inventory, screen: Screen) -> bool:
+        return is_satisfied(ENTRANCE_TYPE_REQUIREMENTS[screen.entrance_type],
+                            inventory_requirement_mask(inventory))
 
-    def _get_accessible_destinations(self) -> list[Destination]:
+    def _get_accessible_destinations(self, inventory: Inventory) -> list[Destination]:
         seen: set[Destination] = set()
         destinations: list[Destination] = []
+        have = inventory_requirement_mask(inventory)
 
-        for screen in self.game_world.overworld.screens:
-            if not self._can_access_screen(screen):
-                continue
-            dest = screen.destination
-            if dest == Destination.NONE:
+        for mask, dest in self._screen_table:
+            if not is_satisfied(mask, have):
                 continue
 
-            # Side effects: hint screens grant virtual items regardless of dedup
+            # Side effects: hint screens grant virtual items regardless of dedup.
+            # Later screens in this same pass may be gated on the hint.
             if dest == Destination.LOST_HILLS_HINT:
-                self.inventory.add_item(Item.LOST_HILLS_HINT_VIRTUAL_ITEM)
+                inventory.add_item(Item.LOST_HILLS_HINT_VIRTUAL_ITEM)
+                have |= REQ_LOST_HILLS_HINT
             if dest == Destination.DEAD_WOODS_HINT:
-                self.inventory.add_item(Item.DEAD_WOODS_HINT_VIRTUAL_ITEM)
+                inventory.add_item(Item.DEAD_WOODS_HINT_VIRTUAL_ITEM)
+                have |= REQ_DEAD_WOODS_HINT
 
             if dest not in seen:
                 seen.add(dest)
@@ -186,7 +512,7 @@ class GameValidator:
         # Coast item: screen 0x5F has Destination.NONE in the data model
         # (it's a special-cased location requiring Ladder). Add it explicitly
         # when Ladder is available.
-        if Destination.COAST_ITEM not in seen and self.inventory.has(Item.LADDER):
+        if Destination.COAST_ITEM not in seen and inventory.has(Item.LADDER):
             seen.add(Destination.COAST_ITEM)
             destinations.append(Destination.COAST_ITEM)
 
@@ -196,19 +522,19 @@ class GameValidator:
     # Cave processing
     # -------------------------------------------------------------------------
 
-    def _can_get_items_from_cave(self, destination: Destination) -> bool:
+    def _can_get_items_from_cave(self, inventory: Inventory, destination: Destination) -> bool:
         ow = self.game_world.overworld
         if destination == Destination.WHITE_SWORD_CAVE:
             cave = ow.get_cave(Destination.WHITE_SWORD_CAVE, ItemCave)
-            if cave is not None and self.inventory.get_heart_count() < cave.heart_requirement:
+            if cave is not None and inventory.get_heart_count() < cave.heart_requirement:
                 return False
         if destination == Destination.MAGICAL_SWORD_CAVE:
             cave = ow.get_cave(Destination.MAGICAL_SWORD_CAVE, ItemCave)
-            if cave is not None and self.inventory.get_heart_count() < cave.heart_requirement:
+            if cave is not None and inventory.get_heart_count() < cave.heart_requirement:
                 return False
-        if destination == Destination.POTION_SHOP and not self.inventory.has(Item.LETTER):
+        if destination == Destination.POTION_SHOP and not inventory.has(Item.LETTER):
             return False
-        if destination == Destination.COAST_ITEM and not self.inventory.has(Item.LADDER):
+        if destination == Destination.COAST_ITEM and not inventory.has(Item.LADDER):
             return False
         return True
 
@@ -247,49 +573,46 @@ class GameValidator:
     # Dungeon traversal
     # -------------------------------------------------------------------------
 
-    def _contains_enemy_type(self, enemy_spec: EnemySpec, enemy_list: list[Enemy]) -> bool:
-        return any(e in enemy_list for e in enemy_spec.actual_enemies)
-
-    def _room_has_only_zero_hp_enemies(self, actual_enemies: list[Enemy]) -> bool:
-        zero_hp = {Enemy.GEL_1, Enemy.GEL_2, Enemy.BLUE_KEESE, Enemy.RED_KEESE, Enemy.DARK_KEESE}
-        return len(actual_enemies) > 0 and all(e in zero_hp for e in actual_enemies)
-
-    def _can_defeat_enemies(self, room: Room) -> bool:
-        spec = room.enemy_spec
-        enemy = spec.enemy
+    def _compile_defeat_checks(self, enemy_spec: EnemySpec) -> tuple[_DefeatCheck, ...] | None:
+        """Return the inventory predicates that must all hold to defeat enemy_spec.
 
+        Returns None for unkillable enemies (always treated as defeated).
+        """
+        enemy = enemy_spec.enemy
         if enemy.is_unkillable():
+            return None
+
+        actual = enemy_spec.actual_enemies
+        checks: list[_DefeatCheck] = []
+        if enemy == Enemy.THE_BEAST:
+            checks.append(Inventory.has_bow_silver_arrows_and_sword)
+        if enemy.is_digdogger():
+            checks.append(Inventory.has_recorder_and_reusable_weapon)
+        if enemy.is_gohma():
+            checks.append(Inventory.has_bow_and_arrows)
+        if any(e in actual for e in (Enemy.RED_WIZZROBE, Enemy.BLUE_WIZZROBE)):
+            checks.append(Inventory.has_sword)
+        if enemy.is_gleeok_or_patra():
+            checks.append(Inventory.has_sword_or_wand)
+        if actual and all(e in _ZERO_HP_ENEMIES for e in actual):
+            checks.append(Inventory.has_reusable_weapon_or_boomerang)
+        if enemy == Enemy.HUNGRY_GORIYA:
+            checks.append(lambda inv: inv.has(Item.BAIT))
+        if Enemy.POLS_VOICE in actual:
+            checks.append(lambda inv: inv.has_sword_or_wand() or inv.has_bow_and_arrows())
+        if self.avoid_required_hard_combat and any(e in _HARD_COMBAT_ENEMIES for e in actual):
+            checks.append(lambda inv: inv.has_ring() and inv.has(Item.WHITE_SWORD))
+        checks.append(Inventory.has_reusable_weapon)
+        return tuple(checks)
+
+    @staticmethod
+    def _passes_defeat_checks(inventory: Inventory, checks: tuple[_DefeatCheck, ...] | None) -> bool:
+        if checks is None:
             return True
+        return all(check(inventory) for check in checks)
 
-        actual = spec.actual_enemies
-
-        if enemy == Enemy.THE_BEAST and not self.inventory.has_bow_silver_arrows_and_sword():
-            return False
-        if enemy.is_digdogger() and not self.inventory.has_recorder_and_reusable_weapon():
-            return False
-        if enemy.is_gohma() and not self.inventory.has_bow_and_arrows():
-            return False
-        if (self._contains_enemy_type(spec, [Enemy.RED_WIZZROBE, Enemy.BLUE_WIZZROBE])
-                and not self.inventory.has_sword()):
-            return False
-        if enemy.is_gleeok_or_patra() and not self.inventory.has_sword_or_wand():
-            return False
-        if self._room_has_only_zero_hp_enemies(actual) and not self.inventory.has_reusable_weapon_or_boomerang():
-            return False
-        if enemy == Enemy.HUNGRY_GORIYA and not self.inventory.has(Item.BAIT):
-            return False
-        if (self._contains_enemy_type(spec, [Enemy.POLS_VOICE])
-                and not (self.inventory.has_sword_or_wand() or self.inventory.has_bow_and_arrows())):
-            return False
-        if (self.avoid_required_hard_combat
-                and self._contains_enemy_type(spec, [
-                    Enemy.GLEEOK_1, Enemy.GLEEOK_2, Enemy.GLEEOK_3, Enemy.GLEEOK_4,
-                    Enemy.PATRA_1, Enemy.PATRA_2, Enemy.BLUE_DARKNUT, Enemy.BLUE_WIZZROBE,
-                ])
-                and not (self.inventory.has_ring() and self.inventory.has(Item.WHITE_SWORD))):
-            return False
-
-        return self.inventory.has_reusable_weapon()
+    def _can_defeat_enemies(self, inventory: Inventory, room: Room) -> bool:
+        return self._passes_defeat_checks(inventory, self._compile_defeat_checks(room.enemy_spec))
 
     def _get_item_xy(self, level_num: int, room: Room) -> tuple[int, int]:
         """Return (X, Y) tile coordinates of the room's item position.
@@ -302,107 +625,6 @@ class GameValidator:
         packed = level.item_position_table[room.item_position]
         return (packed >> 4) & 0x0F, packed & 0x0F
 
-    def _can_get_room_item(self, entry_direction: Direction, room: Room,
-                           level_num: int) -> bool:
-        rt = room.room_type
-        if (room.room_action == RoomAction.KILLING_ENEMIES_OPENS_SHUTTERS_AND_DROPS_ITEM
-                and not self._can_defeat_enemies(room)):
-            return False
-        item_x, item_y = self._get_item_xy(level_num, room)
-        if rt == RoomType.HORIZONTAL_CHUTE_ROOM:
-            # Walls span rows 8 and a, dividing the room into three zones:
-            #   top zone    (Y in {6, 7}): accessible only from NORTH door
-            #   middle zone (Y == 9):      accessible only from EAST or WEST door
-            #   bottom zone (Y in {b, c}): accessible only from SOUTH door
-            if item_y in (0x6, 0x7):
-                return entry_direction == Direction.NORTH
-            if item_y == 0x9:
-                return entry_direction in (Direction.EAST, Direction.WEST)
-            if item_y in (0xB, 0xC):
-                return entry_direction == Direction.SOUTH
-            raise ValueError(
-                f"Level {level_num} room {room.room_num:#04x}: "
-                f"HORIZONTAL_CHUTE_ROOM item Y={item_y:#x} is not in a valid zone "
-                f"(expected 6-7, 9, or b-c) — item is on a wall or obstacle"
-            )
-        if rt == RoomType.VERTICAL_CHUTE_ROOM:
-            # Walls span columns 6 and 9, dividing the room into three zones:
-            #   left zone   (X in {2..5}): accessible only from WEST door
-            #   middle zone (X in {7, 8}): accessible only from NORTH or SOUTH door
-            #   right zone  (X in {a..d}): accessible only from EAST door
-            if 0x2 <= item_x <= 0x5:
-                return entry_direction == Direction.WEST
-            if item_x in (0x7, 0x8):
-                return entry_direction in (Direction.NORTH, Direction.SOUTH)
-            if 0xA <= item_x <= 0xD:
-                return entry_direction == Direction.EAST
-            raise ValueError(
-                f"Level {level_num} room {room.room_num:#04x}: "
-                f"VERTICAL_CHUTE_ROOM item X={item_x:#x} is not in a valid zone "
-                f"(expected 2-5, 7-8, or a-d) — item is on a wall or obstacle"
-            )
-        if rt == RoomType.T_ROOM:
-            # The T-room has a stem extending south from the horizontal bar.
-            # Two zones based on item position:
-            #   bar zone  (X==2, X==d, or Y==6):        accessible from WEST, NORTH, or EAST
-            #   stem zone (X in {5..a} AND Y in {8..c}): accessible only from SOUTH
-            if item_x == 0x2 or item_x == 0xD or item_y == 0x6:
-                return entry_direction in (Direction.WEST, Direction.NORTH, Direction.EAST)
-            if 0x5 <= item_x <= 0xA and 0x8 <= item_y <= 0xC:
-                return entry_direction == Direction.SOUTH
-            raise ValueError(
-                f"Level {level_num} room {room.room_num:#04x}: "
-                f"T_ROOM item X={item_x:#x} Y={item_y:#x} is not in a valid zone "
-                f"(expected X==2, X==d, Y==6, or X in 5-a with Y in 8-c) — item is on a wall or obstacle"
-            )
-        if rt == RoomType.DOUBLE_MOAT_ROOM and not self.inventory.has(Item.LADDER):
-            # Walls span columns 6 and 9, dividing the room into three zones:
-            #   left zone   (X in {2..5}): accessible only from WEST door
-            #   middle zone (X in {7, 8}): accessible only from NORTH or SOUTH door
-            #   right zone  (X in {a..d}): accessible only from EAST door
-            if item_y == 0x06 and entry_direction == Direction.NORTH:
-                    return True
-            if item_y in (0x08, 0x09, 0x0A) and entry_direction in (Direction.EAST, Direction.WEST):
-                    return True
-            if item_y == 0x0C and entry_direction == Direction.SOUTH:
-                    return True
-            return False
-        if rt == RoomType.HORIZONTAL_MOAT_ROOM and not self.inventory.has(Item.LADDER):
-            # Water spans row 8; two zones:
-            #   top zone    (Y in {6, 7}): accessible only from NORTH door
-            #   bottom zone (Y in {9..c}): accessible from WEST, SOUTH, or EAST door
-            if item_y in (0x6, 0x7) and entry_direction == Direction.NORTH:
-                    return True
-            if 0x9 <= item_y <= 0xC and entry_direction in (Direction.WEST, Direction.SOUTH, Direction.EAST):
-                    return True
-            return False
-        if rt == RoomType.VERTICAL_MOAT_ROOM and not self.inventory.has(Item.LADDER):
-            # Water spans column A; two zones:
-            #   left zone  (X in {2..9}): accessible from WEST, NORTH, or SOUTH door
-            #   right zone (X in {b..d}): accessible only from EAST door
-            if 0x2 <= item_x <= 0x9:
-                if entry_direction in (Direction.WEST, Direction.NORTH, Direction.SOUTH):
-                    return True
-            elif 0xB <= item_x <= 0xD and entry_direction == Direction.EAST:
-                    return True
-            else:
-                return False
-        if rt == RoomType.CHEVY_ROOM:
-            # Only the east alcove (X==c, Y==9) is reachable without a ladder via the EAST door.
-            # All other positions require the ladder.
-            if item_x == 0xC and item_y == 0x9:
-                return entry_direction == Direction.EAST
-            if not self.inventory.has(Item.LADDER):
-                return False
-        if rt == RoomType.CIRCLE_MOAT_ROOM and not self.inventory.has(Item.LADDER):
-            # Item inside the moat ring (X in {4..b}, Y in {8..a}) requires ladder.
-            # Item outside the ring is reachable without ladder regardless of entry door.
-            if 0x4 <= item_x <= 0xB and 0x8 <= item_y <= 0xA:
-                return False
-        if rt in _LADDER_BLOCK_VALID_DIRS and not self.inventory.has(Item.LADDER):
-            return False
-        return True
-
     def _has_stairway(self, room: Room) -> bool:
         if room.room_type.has_open_staircase():
             return True
@@ -412,68 +634,121 @@ class GameValidator:
                 return False
         return room.room_type.can_have_push_block() and room.movable_block
 
-    def _is_path_unconditionally_obstructed(self, room_type: RoomType,
-                                             from_dir: Direction, to_dir: Direction) -> bool:
-        # STAIRCASE entry means the player arrived via staircase — never obstructed
-        if from_dir == Direction.STAIRCASE:
-            return False
-        if room_type in _CONSTRAINED_VALID_DIRS:
-            valid = _CONSTRAINED_VALID_DIRS[room_type]
-            if from_dir not in valid or to_dir not in valid:
-                return True
-        return False
+    def _compile_staircases(self, level_num: int, room_num: int) -> tuple[tuple[int, bool], ...]:
+        """Return the staircase visits made from room_num, in staircase pool order.
 
-    def _is_path_obstructed_by_water(self, room_type: RoomType,
-                                      from_dir: Direction, to_dir: Direction,
-                                      has_ladder: bool) -> bool:
-        # STAIRCASE entry means the player arrived via staircase — never obstructed
-        if from_dir == Direction.STAIRCASE:
-            return False
-        if not has_ladder and room_type in _LADDER_BLOCK_VALID_DIRS:
-            valid = _LADDER_BLOCK_VALID_DIRS[room_type]
-            if from_dir not in valid or to_dir not in valid:
-                return True
-        return False
+        Item staircases returning to this room are listed as (room_num, False);
+        the first transport staircase with an exit here ends the list as
+        (destination, True).
+        """
+        visits: list[tuple[int, bool]] = []
+        for staircase_room_num in self._get_level(level_num).staircase_room_pool:
+            sr = self._get_staircase_room(level_num, staircase_room_num)
+            if sr is None:
+                continue
 
-    def _can_move(self, entry_direction: Direction, exit_direction: Direction,
-                  level_num: int, room_num: int, room: Room) -> bool:
-        has_ladder = self.inventory.has(Item.LADDER)
+            if sr.room_type == RoomType.ITEM_STAIRCASE:
+                if sr.return_dest == room_num:
+                    visits.append((staircase_room_num, False))
+            else:  # TRANSPORT_STAIRCASE
+                left_exit = sr.left_exit
+                right_exit = sr.right_exit
+                if left_exit is not None and right_exit is not None:
+                    if left_exit == room_num and right_exit != room_num:
+                        visits.append((right_exit, True))
+                        break
+                    if right_exit == room_num and left_exit != room_num:
+                        visits.append((left_exit, True))
+                        break
+        return tuple(visits)
 
-        if (self._is_path_unconditionally_obstructed(room.room_type, entry_direction, exit_direction)
-                or self._is_path_obstructed_by_water(room.room_type, entry_direction, exit_direction, has_ladder)):
+    def _compile_room_table(self, level_num: int, room: Room) -> _RoomTable:
+        room_type = room.room_type
+        item_x, item_y = self._get_item_xy(level_num, room)
+
+        exits: dict[Direction, tuple[tuple[_Exit, ...], tuple[_Exit, ...]]] = {}
+        item_access: dict[Direction, tuple[bool, bool]] = {}
+        item_error: str | None = None
+        for entry in Direction:
+            by_ladder: list[tuple[_Exit, ...]] = []
+            for has_ladder in (False, True):
+                passable: list[_Exit] = []
+                for exit_dir in _EXIT_DIRECTIONS:
+                    if (_is_path_unconditionally_obstructed(room_type, entry, exit_dir)
+                            or _is_path_obstructed_by_water(room_type, entry, exit_dir, has_ladder)):
+                        continue
+                    wall = room.walls[exit_dir]
+                    if wall == WallType.SOLID_WALL:
+                        continue
+                    passable.append((exit_dir, wall, room.room_num + exit_dir.value, Direction(-exit_dir.value)))
+                by_ladder.append(tuple(passable))
+            exits[entry] = (by_ladder[0], by_ladder[1])
+
+            try:
+                item_access[entry] = (
+                    _is_item_position_accessible(entry, room, item_x, item_y, False, level_num),
+                    _is_item_position_accessible(entry, room, item_x, item_y, True, level_num),
+                )
+            except ValueError as e:
+                item_error = str(e)
+                item_access[entry] = (False, False)
+
+        return _RoomTable(
+            exits=exits,
+            item_access=item_access,
+            item_error=item_error,
+            direction_sensitive=room_type in _DIRECTION_SENSITIVE_ROOM_TYPES,
+            kill_gates_item=room.room_action == RoomAction.KILLING_ENEMIES_OPENS_SHUTTERS_AND_DROPS_ITEM,
+            defeat_checks=self._compile_defeat_checks(room.enemy_spec),
+            goriya_blocks_north=room.enemy_spec.enemy == Enemy.HUNGRY_GORIYA,
+            staircases=self._compile_staircases(level_num, room.room_num) if self._has_stairway(room) else (),
+        )
+
+    def _get_room_table(self, level_num: int, room: Room) -> _RoomTable:
+        key = (level_num, room.room_num)
+        table = self._room_tables.get(key)
+        if table is None:
+            table = self._compile_room_table(level_num, room)
+            self._room_tables[key] = table
+        return table
+
+    def _can_get_room_item(self, inventory: Inventory, entry_direction: Direction, room: Room,
+                           level_num: int) -> bool:
+        table = self._get_room_table(level_num, room)
+        if table.kill_gates_item and not self._passes_defeat_checks(inventory, table.defeat_checks):
             return False
+        if table.item_error is not None:
+            raise ValueError(table.item_error)
+        return table.item_access[entry_direction][inventory.has(Item.LADDER)]
 
+    def _can_exit(self, inventory: Inventory, table: _RoomTable, room: Room, level_num: int, room_num: int,
+                  exit_direction: Direction, wall: WallType) -> bool:
+        """Dynamic (inventory-dependent) part of leaving a room through a passable side."""
         if (exit_direction == Direction.NORTH
-                and room.enemy_spec.enemy == Enemy.HUNGRY_GORIYA
-                and not self.inventory.has(Item.BAIT)):
+                and table.goriya_blocks_north
+                and not inventory.has(Item.BAIT)):
             return False
 
-        wall = room.walls[exit_direction]
-
         if wall == WallType.SHUTTER_DOOR:
             if room.room_action == RoomAction.TRIFORCE_OF_POWER_OPENS_SHUTTERS:
-                return self.inventory.has(Item.BEAST_DEFEATED_VIRTUAL_ITEM)
-            if not self._can_defeat_enemies(room):
-                return False
-
-        if wall == WallType.SOLID_WALL:
-            return False
+                return inventory.has(Item.BEAST_DEFEATED_VIRTUAL_ITEM)
+            return self._passes_defeat_checks(inventory, table.defeat_checks)
 
         if wall in (WallType.LOCKED_DOOR_1, WallType.LOCKED_DOOR_2):
             door_key = (level_num, room_num, exit_direction)
-            already_unlocked = door_key in self.inventory.locations_where_keys_were_used
-            if not already_unlocked and not self.inventory.has_key():
+            already_unlocked = door_key in inventory.locations_where_keys_were_used
+            if not already_unlocked and not inventory.has_key():
                 return False
             if not already_unlocked:
-                self.inventory.use_key(level_num, room_num, exit_direction)
+                inventory.use_key(level_num, room_num, exit_direction)
 
         if wall == WallType.BOMB_HOLE:
-            if not self.inventory.has_sword_or_wand():
+            if not inventory.has_sword_or_wand():
                 return False
 
         return True
 
-    def _visit_room(self, level_num: int, room_num: int,
+    def _visit_room(self, state: TraversalState, level_num: int, room_num: int,
                     entry_direction: Direction) -> list[tuple[int, Direction]]:
         if not (0 <= room_num < 0x80):
             return []
@@ -481,59 +756,46 @@ class GameValidator:
         room = self._get_room(level_num, room_num)
         if room is None:
             return []
+        table = self._get_room_table(level_num, room)
 
         tbr: list[tuple[int, Direction]] = []
         loc_key = (level_num, room_num)
+        inventory = state.inventory
 
-        first_visit = loc_key not in self.visited_rooms
-        direction_sensitive = room.room_type in _DIRECTION_SENSITIVE_ROOM_TYPES
+        first_visit = loc_key not in state.visited_rooms
 
         if first_visit:
-            self.visited_rooms.add(loc_key)
+            state.visited_rooms.add(loc_key)
 
-        if first_visit or (direction_sensitive and loc_key not in self.items_collected_rooms):
-            if self._can_get_room_item(entry_direction, room, level_num) and room.item != Item.NOTHING:
-                self.inventory.add_item(room.item, loc_key)
-                self.items_collected_rooms.add(loc_key)
+        if first_visit or (table.direction_sensitive and loc_key not in state.items_collected_rooms):
+            can_get_item = self._can_get_room_item(inventory, entry_direction, room, level_num)
+            if can_get_item and room.item != Item.NOTHING:
+                inventory.add_item(room.item, loc_key)
+                state.items_collected_rooms.add(loc_key)
 
             enemy = room.enemy_spec.enemy
-            if enemy == Enemy.THE_BEAST and self._can_get_room_item(entry_direction, room, level_num):
-                self.inventory.add_item(Item.BEAST_DEFEATED_VIRTUAL_ITEM)
+            if enemy == Enemy.THE_BEAST and can_get_item:
+                inventory.add_item(Item.BEAST_DEFEATED_VIRTUAL_ITEM)
             if enemy == Enemy.THE_KIDNAPPED:
-                self.inventory.add_item(Item.KIDNAPPED_RESCUED_VIRTUAL_ITEM)
-
-        for exit_dir in (Direction.WEST, Direction.NORTH, Direction.EAST, Direction.SOUTH):
-            if self._can_move(entry_direction, exit_dir, level_num, room_num, room):
-                tbr.append((room_num + exit_dir.value, Direction(-exit_dir.value)))
-
-        if not self._has_stairway(room):
-            return tbr
+                inventory.add_item(Item.KIDNAPPED_RESCUED_VIRTUAL_ITEM)
 
-        level = self._get_level(level_num)
-        for staircase_room_num in level.staircase_room_pool:
-            sr = self._get_staircase_room(level_num, staircase_room_num)
-            if sr is None:
-                continue
+        has_ladder = inventory.has(Item.LADDER)
+        for exit_dir, wall, next_room_num, next_entry in table.exits[entry_direction][has_ladder]:
+            if self._can_exit(inventory, table, room, level_num, room_num, exit_dir, wall):
+                tbr.append((next_room_num, next_entry))
 
-            if sr.room_type == RoomType.ITEM_STAIRCASE:
-                if sr.return_dest == room_num:
-                    self.visited_rooms.add((level_num, staircase_room_num))
-                    if sr.item is not None and sr.item != Item.NOTHING:
-                        self.inventory.add_item(sr.item, (level_num, staircase_room_num))
-            else:  # TRANSPORT_STAIRCASE
-                left_exit = sr.left_exit
-                right_exit = sr.right_exit
-                if left_exit is not None and right_exit is not None:
-                    if left_exit == room_num and right_exit != room_num:
-                        tbr.append((right_exit, Direction.STAIRCASE))
-                        break
-                    if right_exit == room_num and left_exit != room_num:
-                        tbr.append((left_exit, Direction.STAIRCASE))
-                        break
+        for dest, is_transport in table.staircases:
+            if is_transport:
+                tbr.append((dest, Direction.STAIRCASE))
+                break
+            state.visited_rooms.add((level_num, dest))
+            sr = self._get_staircase_room(level_num, dest)
+            if sr is not None and sr.item is not None and sr.item != Item.NOTHING:
+                inventory.add_item(sr.item, (level_num, dest))
 
         return tbr
 
-    def _process_level(self, level_num: int) -> None:
+    def _process_level(self, state: TraversalState, level_num: int) -> None:
         level = self._get_level(level_num)
         visited_room_direction_pairs: set[tuple[int, Direction]] = set()
         rooms_to_visit = [(level.entrance_room, level.entrance_direction)]
@@ -543,7 +805,7 @@ class GameValidator:
             if (room_num, direction) in visited_room_direction_pairs:
                 continue
             visited_room_direction_pairs.add((room_num, direction))
-            new_rooms = self._visit_room(level_num, room_num, direction)
+            new_rooms = self._visit_room(state, level_num, room_num, direction)
             rooms_to_visit.extend(new_rooms)
 
     # -------------------------------------------------------------------------
@@ -577,34 +839,31 @@ class GameValidator:
         Item.LOST_HILLS_HINT_VIRTUAL_ITEM, Item.DEAD_WOODS_HINT_VIRTUAL_ITEM,
     )
 
-    def _has_all_important_items(self) -> bool:
-        return all(self.inventory.has(item) for item in self._IMPORTANT_ITEMS)
+    def _has_all_important_items(self, inventory: Inventory) -> bool:
+        return all(inventory.has(item) for item in self._IMPORTANT_ITEMS)
 
     # -------------------------------------------------------------------------
     # Core traversal: get_reachable_locations
     # -------------------------------------------------------------------------
 
-    def get_reachable_locations(
-        self,
-        assumed_inventory: Inventory | None = None,
-    ) -> list[Location]:
-        """Run full fixed-point world traversal and return all reachable locations.
+    def traverse(self, assumed_inventory: Inventory | None = None,
+                 state: TraversalState | None = None) -> TraversalState:
+        """Run full fixed-point world traversal and return the final state.
 
-        Seeds the inventory with assumed_inventory items before traversal if provided.
-        Leaves self.inventory populated with all collected (and assumed) items after
-        running — callers may inspect it directly.
+        The returned state holds everything collected (and assumed) and the
+        rooms visited in the last pass. It belongs to the caller; the
+        validator keeps no reference to it.
 
         Args:
             assumed_inventory: Items to assume the player already has. If provided,
-                these are merged into self.inventory before traversal begins and
+                these are merged into the inventory before traversal begins and
                 re-applied at the start of each iteration (since assumed items
                 represent future finds, not collected ones).
-
-        Returns:
-            list of all Location objects (DungeonLocation and CaveLocation) that
-            were reachable.
+            state: Empty state to traverse with; a new one is created if omitted.
         """
-        self._reset()
+        if state is None:
+            state = self.new_state()
+        inventory = state.inventory
 
         # Collect assumed item values so we can re-seed each iteration.
         assumed_items: list[Item] = []
@@ -616,73 +875,159 @@ class GameValidator:
             assumed_key_count = 0
 
         # Seed initial progress so the loop runs at least once.
-        self.inventory.set_still_making_progress_bit()
+        inventory.set_still_making_progress_bit()
         num_iterations = 0
-        reachable: list[Location] = []
 
-        while self.inventory.still_making_progress():
+        while inventory.still_making_progress():
             num_iterations += 1
-            self.inventory.clear_making_progress_bit()
-            self.visited_rooms.clear()
-            self.items_collected_rooms.clear()
+            inventory.clear_making_progress_bit()
+            state.visited_rooms.clear()
+            state.items_collected_rooms.clear()
             # Reset collected keys each iteration; previously-unlocked doors
             # remain in locations_where_keys_were_used (treated as permanently open).
-            self.inventory.num_keys = assumed_key_count
+            inventory.num_keys = assumed_key_count
 
             # Re-apply assumed items each iteration (they represent unplaced items
             # the player will eventually have — not yet "collected" from a location).
             for item in assumed_items:
-                self.inventory.items.add(item)
+                inventory.items.add(item)
             # Assumed triforces are tracked via levels_with_triforce_obtained on the
             # assumed inventory (pre-populated by the caller).  Re-apply them here
             # so L9 remains accessible across iterations.
             if assumed_inventory is not None:
                 for lvl in assumed_inventory.levels_with_triforce_obtained:
-                    if lvl not in self.inventory.levels_with_triforce_obtained:
-                        self.inventory.levels_with_triforce_obtained.append(lvl)
+                    if lvl not in inventory.levels_with_triforce_obtained:
+                        inventory.levels_with_triforce_obtained.append(lvl)
 
-            accessible_destinations = self._get_accessible_destinations()
+            accessible_destinations = self._get_accessible_destinations(inventory)
 
             for destination in accessible_destinations:
                 if destination.is_level:
                     level_num = destination.level_num
-                    if level_num == 9 and self.inventory.get_triforce_count() < 8:
+                    if level_num == 9 and inventory.get_triforce_count() < 8:
                         continue
-                    self._process_level(level_num)
+                    self._process_level(state, level_num)
                 else:
-                    if self._can_get_items_from_cave(destination):
+                    if self._can_get_items_from_cave(inventory, destination):
                         cave_key_base = destination.value
                         for i, item in enumerate(self._get_cave_items(destination)):
-                            self.inventory.add_item(item, (cave_key_base, i))
+                            inventory.add_item(item, (cave_key_base, i))
 
             if num_iterations > 100:
                 break
 
-        # Build location list from visited rooms + reachable caves
-        reachable = []
-        for (level_num, room_num) in self.visited_rooms:
-            reachable.append(DungeonLocation(level_num, room_num))
+        return state
+
+    def get_reachable_locations(
+        self,
+        assumed_inventory: Inventory | None = None,
+    ) -> list[Location]:
+        """Run full fixed-point world traversal and return all reachable locations.
+
+        Safe to call concurrently from several threads on one validator: each
+        call traverses with its own TraversalState (see traverse()).
+
+        Args:
+            assumed_inventory: Items to assume the player already has; see traverse().
+
+        Returns:
+            list of all Location objects (DungeonLocation and CaveLocation) that
+            were reachable, in self.locations id order.
+        """
+        return self.locations.locations(self.get_reachable_mask(assumed_inventory))
+
+    def get_reachable_mask(self, assumed_inventory: Inventory | None = None) -> int:
+        """Like get_reachable_locations(), as a bitset of self.locations ids."""
+        return self._collect_location_mask(self.traverse(assumed_inventory))
+
+    def get_reachable_mask_and_probes(
+        self, assumed_inventory: Inventory | None = None,
+    ) -> tuple[int, set[object]]:
+        """get_reachable_mask(), plus every item the traversal tested for.
+
+        Adding an item outside the returned set cannot change the result.
+        Heart containers are counted rather than tested for, so they never
+        appear in it.
+        """
+        state = self.new_state()
+        probe = _ProbedItemSet()
+        state.inventory.items = probe
+        return self._collect_location_mask(self.traverse(assumed_inventory, state)), probe.probed
+
+    def _collect_location_mask(self, state: TraversalState) -> int:
+        inventory = state.inventory
+        registry = self.locations
+
+        # Location ids from visited rooms + reachable caves
+        mask = 0
+        for (level_num, room_num) in state.visited_rooms:
+            mask |= 1 << registry.dungeon_id(level_num, room_num)
         # Cave locations: any destination that was processed
         # Re-run accessible destinations to enumerate cave locations reached
-        for screen in self.game_world.overworld.screens:
-            if not self._can_access_screen(screen):
+        have = inventory_requirement_mask(inventory)
+        for req, dest in self._screen_table:
+            if dest.is_level or not is_satisfied(req, have):
                 continue
-            dest = screen.destination
-            if dest == Destination.NONE or dest.is_level:
-                continue
-            if self._can_get_items_from_cave(dest):
+            if self._can_get_items_from_cave(inventory, dest):
                 items = self._get_cave_items(dest)
                 for i in range(len(items)):
-                    reachable.append(CaveLocation(dest, i))
+                    mask |= 1 << registry.cave_id(dest, i)
         # Armos item is always accessible (no overworld screen required)
-        if self._can_get_items_from_cave(Destination.ARMOS_ITEM):
-            reachable.append(CaveLocation(Destination.ARMOS_ITEM, 0))
+        if self._can_get_items_from_cave(inventory, Destination.ARMOS_ITEM):
+            mask |= 1 << registry.cave_id(Destination.ARMOS_ITEM, 0)
         # Coast item: screen 0x5F has Destination.NONE in the data model;
         # accessible when Ladder is in inventory (collected or assumed).
-        if self._can_get_items_from_cave(Destination.COAST_ITEM):
-            reachable.append(CaveLocation(Destination.COAST_ITEM, 0))
+        if self._can_get_items_from_cave(inventory, Destination.COAST_ITEM):
+            mask |= 1 << registry.cave_id(Destination.COAST_ITEM, 0)
+
+        return mask
 
-        return reachable
+    def get_reachable_masks_without_each(
+        self,
+        assumed_pool: Sequence[Item],
+    ) -> tuple[int, dict[Item, int]]:
+        """Reachability under assumed_pool, and under assumed_pool minus each item.
+
+        Answers the "remove one" queries of assumed fill in one call. The
+        whole-pool traversal records which items it ever tested for. Removing
+        an item the traversal never tested, or one that stays in the assumed
+        set because the pool holds another copy, cannot change any decision,
+        so that item shares the whole-pool result. Only the remaining items
+        (and TRIFORCE, which is counted by level) get their own traversal.
+
+        Args:
+            assumed_pool: Unplaced items, with duplicates.
+
+        Returns:
+            (bitset of locations reachable with the whole pool,
+             {distinct item: bitset reachable with one copy of it removed}),
+            over self.locations ids.
+        """
+        state = self.new_state()
+        probe = _ProbedItemSet()
+        state.inventory.items = probe
+        reachable = self._collect_location_mask(self.traverse(build_assumed_inventory(assumed_pool), state))
+
+        without: dict[Item, int] = {}
+        for item in assumed_pool:
+            if item in without:
+                continue
+            if item != Item.TRIFORCE and (item not in probe.probed or assumed_pool.count(item) > 1):
+                without[item] = reachable
+                continue
+            remaining = list(assumed_pool)
+            remaining.remove(item)
+            without[item] = self.get_reachable_mask(build_assumed_inventory(remaining))
+        return reachable, without
+
+    def get_reachable_locations_without_each(
+        self,
+        assumed_pool: Sequence[Item],
+    ) -> tuple[list[Location], dict[Item, list[Location]]]:
+        """Like get_reachable_masks_without_each(), as lists of locations."""
+        reachable, without = self.get_reachable_masks_without_each(assumed_pool)
+        to_list = self.locations.locations
+        return to_list(reachable), {item: to_list(mask) for item, mask in without.items()}
 
     # -------------------------------------------------------------------------
     # Main entry point
@@ -695,9 +1040,9 @@ class GameValidator:
         if not self._has_accessible_sword_or_wand():
             return False
 
-        self.get_reachable_locations(assumed_inventory=None)
+        inventory = self.traverse(assumed_inventory=None).inventory
 
-        return (self.inventory.has(Item.KIDNAPPED_RESCUED_VIRTUAL_ITEM)
-                and self._has_all_important_items())
+        return (inventory.has(Item.KIDNAPPED_RESCUED_VIRTUAL_ITEM)
+                and self._has_all_important_items(inventory))
 
 
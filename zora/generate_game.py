@@ -5,27 +5,30 @@ Called by both the API route and the CLI. Accepts resolved flags and a seed,
 runs assumed fill, serializes to a Patch, and returns IPS patch bytes.
 """
 
+from dataclasses import replace
 from pathlib import Path
 from typing import Any
 
 from flags.flags_generated import CosmeticFlags, Flags
 from zora.cave_randomizer import randomize_caves
+from zora.data_model import GameWorld
 from zora.dungeon_item_shuffler import shuffle_dungeon_items
 from zora.dungeon_randomizer import randomize_dungeon_palettes
 from zora.dungeon.dungeon import randomize_dungeons
 from zora.enemy.randomize import randomize_enemies
 from zora.entrance_randomizer import randomize_entrances
-from zora.game_config import resolve_game_config
+from zora.feasibility_check import check_entrance_feasibility
+from zora.game_config import GameConfig, resolve_game_config
 from zora.hash_code import apply_hash_code, hash_code_display_names
 from zora.hint_randomizer import expand_quote_slots, randomize_hints
 from zora.item_randomizer import randomize_items
 from zora.l4_sword_randomizer import place_l4_sword
 from zora.normalizer import normalize_data
 from zora.overworld_randomizer import randomize_maze_directions, recalculate_recorder_warp_screens, remap_game_start
-from zora.parser import is_randomizer_rom, load_bin_files, load_bin_files_from_rom, parse_game_world
+from zora.parser import RawBinFiles, is_randomizer_rom, load_bin_files, load_bin_files_from_rom, parse_game_world
 from zora.patch import build_ips_patch
 from zora.patches import build_behavior_patch
-from zora.rng import SeededRng
+from zora.rng import Rng, SeededRng
 from zora.rom_layout import (
     ARMOS_ITEM_ADDRESS,
     COAST_ITEM_ADDRESS,
@@ -48,6 +51,7 @@ ROM_DATA = Path(__file__).parent.parent / "rom_data"
 _RANDOMIZERS = [
     normalize_data,
     randomize_entrances,
+    check_entrance_feasibility,  # rejects doomed entrance layouts before the expensive steps
     recalculate_recorder_warp_screens,
     place_l4_sword,
     randomize_dungeons,  # before randomize_enemies: room positions must be settled first
@@ -64,9 +68,62 @@ _RANDOMIZERS = [
 ]
 
 
+def _run_pipeline(bins: RawBinFiles, config: GameConfig, rng: Rng) -> GameWorld:
+    """Parse a fresh game world from bins and run every randomizer step on it.
+
+    Raises:
+        RuntimeError: if the pipeline fails on every attempt.
+    """
+    # Some cave shuffle arrangements make item placement impossible.
+    # Retry with a fresh game world (the RNG has advanced, producing a
+    # different cave layout) when the pipeline fails. The ones known to be
+    # doomed are rejected by check_entrance_feasibility right after the
+    # shuffle, before the expensive steps run.
+    max_pipeline_attempts = 10
+    for attempt in range(max_pipeline_attempts):
+        game_world = parse_game_world(bins)
+        try:
+            for step in _RANDOMIZERS:
+                step(game_world, config, rng)
+            return game_world
+        except RuntimeError:
+            if attempt == max_pipeline_attempts - 1:
+                raise
+    raise AssertionError("unreachable")
+
+
+def generate_game_world(
+    flags: Flags, seed: int, cosmetic_flags: CosmeticFlags | None = None,
+    fill_engine: str = "assumed", max_fill_backtracks: int = 0,
+    dungeon_shuffle_workers: int = 0,
+    legacy_enemy_sampling: bool = False,
+    legacy_cave_shuffle: bool = False,
+) -> tuple[GameWorld, GameConfig]:
+    """Run the randomizer pipeline for a seed without serializing it.
+
+    Produces the same GameWorld that generate_game() would serialize for the
+    same arguments. Used by batch validation and the fill engine benchmark.
+
+    Raises:
+        RuntimeError: if assumed fill cannot place all items.
+    """
+    bins = load_bin_files(ROM_DATA)
+    rng = SeededRng(seed)
+    config = replace(resolve_game_config(flags, rng, cosmetic_flags), fill_engine=fill_engine,
+                     max_fill_backtracks=max_fill_backtracks,
+                     dungeon_shuffle_workers=dungeon_shuffle_workers,
+                     legacy_enemy_sampling=legacy_enemy_sampling,
+                     legacy_cave_shuffle=legacy_cave_shuffle)
+    return _run_pipeline(bins, config, rng), config
+
+
 def generate_game(
     flags: Flags, seed: int, flag_string: str = "",
     rom_version: int | None = None, cosmetic_flags: CosmeticFlags | None = None,
+    fill_engine: str = "assumed", max_fill_backtracks: int = 0,
+    dungeon_shuffle_workers: int = 0,
+    legacy_enemy_sampling: bool = False,
+    legacy_cave_shuffle: bool = False,
 ) -> tuple[bytes, list[str], str, dict[str, Any]]:
     """Run assumed fill and serialize to IPS patch bytes.
 
@@ -76,6 +133,20 @@ def generate_game(
         rom_version: ROM revision detected by the client (0 = PRG0, 1 = PRG1, etc.).
                      None if the client did not supply a version. Reserved for
                      future PRG-version-specific patch logic.
+        fill_engine: Name of the item fill engine (see item_randomizer.FILL_ENGINES).
+                     A server-side setting; not encoded in the flag string.
+        max_fill_backtracks: Dead ends assumed fill may back out of before
+                     restarting (see assumed_fill). Server-side, like fill_engine.
+        dungeon_shuffle_workers: Worker processes for the dungeon room shuffle
+                     (see GameConfig.dungeon_shuffle_workers). Server-side, like
+                     fill_engine.
+        legacy_enemy_sampling: Shuffle and replace enemies by the original
+                     pick-and-retry loops, reproducing seeds from before the
+                     direct samplers. Server-side, like fill_engine.
+        legacy_cave_shuffle: Shuffle caves by the original swap loop, retried
+                     until the overworld block check passes, reproducing seeds
+                     from before the constructive shuffle. Server-side, like
+                     fill_engine.
 
     Returns:
         Tuple of (ips_patch_bytes, hash_code_names, spoiler_log, spoiler_data)
@@ -89,7 +160,11 @@ def generate_game(
     bins = load_bin_files(ROM_DATA)
 
     rng = SeededRng(seed)
-    config = resolve_game_config(flags, rng, cosmetic_flags)
+    config = replace(resolve_game_config(flags, rng, cosmetic_flags), fill_engine=fill_engine,
+                     max_fill_backtracks=max_fill_backtracks,
+                     dungeon_shuffle_workers=dungeon_shuffle_workers,
+                     legacy_enemy_sampling=legacy_enemy_sampling,
+                     legacy_cave_shuffle=legacy_cave_shuffle)
 
     original_bins_bytes = {
         "level_1_6_data.bin": bins.level_1_6_data,
@@ -102,19 +177,7 @@ def generate_game(
         "magical_sword_requirement.bin": bins.magical_sword_requirement,
     }
 
-    # Some cave shuffle arrangements make item placement impossible.
-    # Retry with a fresh game world (the RNG has advanced, producing a
-    # different cave layout) when the pipeline fails.
-    max_pipeline_attempts = 10
-    for attempt in range(max_pipeline_attempts):
-        game_world = parse_game_world(bins)
-        try:
-            for step in _RANDOMIZERS:
-                step(game_world, config, rng)
-            break
-        except RuntimeError:
-            if attempt == max_pipeline_attempts - 1:
-                raise
+    game_world = _run_pipeline(bins, config, rng)
 
     data_patch = serialize_game_world(
         game_world,
@@ -144,6 +207,11 @@ def generate_game_from_rom(
     flag_string: str = "",
     rom_version: int | None = None,
     cosmetic_flags: CosmeticFlags | None = None,
+    fill_engine: str = "assumed",
+    max_fill_backtracks: int = 0,
+    dungeon_shuffle_workers: int = 0,
+    legacy_enemy_sampling: bool = False,
+    legacy_cave_shuffle: bool = False,
 ) -> tuple[bytes, list[str], str, dict[str, Any]]:
     """Run assumed fill against an uploaded ROM and return an IPS patch for it.
 
@@ -157,6 +225,11 @@ def generate_game_from_rom(
         seed:        Integer seed for deterministic generation.
         rom_version: Optional ROM revision hint (unused currently, forwarded to
                      build_behavior_patch for future PRG-specific logic).
+        fill_engine: As for generate_game().
+        max_fill_backtracks: As for generate_game().
+        dungeon_shuffle_workers: As for generate_game().
+        legacy_enemy_sampling: As for generate_game().
+        legacy_cave_shuffle: As for generate_game().
 
     Returns:
         Tuple of (ips_patch_bytes, hash_code_names, spoiler_log, spoiler_data).
@@ -171,7 +244,11 @@ def generate_game_from_rom(
     bins = load_bin_files_from_rom(rom_bytes)
 
     rng = SeededRng(seed)
-    config = resolve_game_config(flags, rng, cosmetic_flags)
+    config = replace(resolve_game_config(flags, rng, cosmetic_flags), fill_engine=fill_engine,
+                     max_fill_backtracks=max_fill_backtracks,
+                     dungeon_shuffle_workers=dungeon_shuffle_workers,
+                     legacy_enemy_sampling=legacy_enemy_sampling,
+                     legacy_cave_shuffle=legacy_cave_shuffle)
 
     original_bins_bytes = {
         "level_1_6_data.bin": rom_bytes[LEVEL_1_6_DATA_ADDRESS: LEVEL_1_6_DATA_ADDRESS + 0x300],
@@ -188,16 +265,7 @@ def generate_game_from_rom(
         ],
     }
 
-    max_pipeline_attempts = 10
-    for attempt in range(max_pipeline_attempts):
-        game_world = parse_game_world(bins)
-        try:
-            for step in _RANDOMIZERS:
-                step(game_world, config, rng)
-            break
-        except RuntimeError:
-            if attempt == max_pipeline_attempts - 1:
-                raise
+    game_world = _run_pipeline(bins, config, rng)
 
     data_patch = serialize_game_world(
         game_world,
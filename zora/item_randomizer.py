@@ -15,8 +15,11 @@ The algorithm:
   4. Run is_seed_valid() as a final sanity check.
 """
 
+import logging
 from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass
+from typing import Protocol
 
 from zora.data_model import (
     Destination,
@@ -24,10 +27,12 @@ from zora.data_model import (
     Item,
     ItemCave,
     OverworldItem,
+    Room,
     RoomAction,
     Shop,
+    ShopItem,
     ShopType,
-    TakeAnyCave,
+    StaircaseRoom,
 )
 from zora.game_config import GameConfig
 from zora.game_validator import (
@@ -35,10 +40,13 @@ from zora.game_validator import (
     DungeonLocation,
     GameValidator,
     Location,
+    LocationRegistry,
+    build_assumed_inventory,
 )
-from zora.inventory import Inventory
 from zora.rng import Rng
 
+log = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # Major item pool
 # ---------------------------------------------------------------------------
@@ -140,6 +148,14 @@ class Constraints:
         )
 
 
+@dataclass
+class FillStats:
+    """Backtracking counters from one assumed_fill call."""
+
+    backtracks: int = 0           # dead ends recovered from
+    max_backtrack_depth: int = 0  # most placements undone by one back-jump
+
+
 def is_item_valid_for_location(
     item: Item,
     location: Location,
@@ -241,143 +257,129 @@ def _is_major_item(item: Item) -> bool:
     return item in MAJOR_ITEMS
 
 
-def collect_item_locations(game_world: GameWorld, config: GameConfig) -> list[Location]:
-    """Collect all locations eligible for item placement based on flags."""
-    locations: list[Location] = []
+# Objects whose .item field is the item at a location.
+_ItemHolder = Room | StaircaseRoom | ItemCave | OverworldItem | ShopItem
 
-    # Dungeon locations: rooms and staircase rooms that hold a major item
-    # (or heart container if shuffled). Triforces and compasses/maps are
-    # handled by dungeon_item_shuffler.py — not included here.
-    for level in game_world.levels:
-        for room in level.rooms:
-            if _is_major_item(room.item):
-                locations.append(DungeonLocation(level.level_num, room.room_num))
-            elif config.shuffle_dungeon_hearts and room.item == Item.HEART_CONTAINER:
-                locations.append(DungeonLocation(level.level_num, room.room_num))
-        for sr in level.staircase_rooms:
-            if sr.item is not None and _is_major_item(sr.item):
-                locations.append(DungeonLocation(level.level_num, sr.room_num))
-            elif sr.item is not None and config.shuffle_dungeon_hearts and sr.item == Item.HEART_CONTAINER:
-                locations.append(DungeonLocation(level.level_num, sr.room_num))
-
-    # Cave locations
-    ow = game_world.overworld
-    cave_by_dest = {c.destination: c for c in ow.caves}
-    if config.shuffle_wood_sword:
-        locations.append(CaveLocation(Destination.WOOD_SWORD_CAVE, 0))
-    if config.shuffle_white_sword:
-        locations.append(CaveLocation(Destination.WHITE_SWORD_CAVE, 0))
-    if config.shuffle_magical_sword:
-        locations.append(CaveLocation(Destination.MAGICAL_SWORD_CAVE, 0))
-    if config.shuffle_letter:
-        locations.append(CaveLocation(Destination.LETTER_CAVE, 0))
-    if config.shuffle_armos_item:
-        locations.append(CaveLocation(Destination.ARMOS_ITEM, 0))
-    if config.shuffle_coast_item:
-        locations.append(CaveLocation(Destination.COAST_ITEM, 0))
-
-    # shuffle_take_any_items hardcoded False for MVP
-    # TODO: wire to flags_generated.py in future phase
-
-    major_shops = [
-        (ShopType.SHOP_A, Destination.SHOP_1),
-        (ShopType.SHOP_B, Destination.SHOP_2),
-        (ShopType.SHOP_C, Destination.SHOP_3),
-        (ShopType.SHOP_D, Destination.SHOP_4),
-    ]
-    if config.shuffle_major_shop_items:
-        for shop_type, dest in major_shops:
+# Caves whose single item is shuffled when the matching config flag is on.
+_ITEM_CAVE_FLAGS = (
+    (Destination.WOOD_SWORD_CAVE, "shuffle_wood_sword"),
+    (Destination.WHITE_SWORD_CAVE, "shuffle_white_sword"),
+    (Destination.MAGICAL_SWORD_CAVE, "shuffle_magical_sword"),
+    (Destination.LETTER_CAVE, "shuffle_letter"),
+)
+_MAJOR_SHOP_DESTINATIONS = (Destination.SHOP_1, Destination.SHOP_2, Destination.SHOP_3, Destination.SHOP_4)
+
+
+class ShuffleSurface:
+    """The locations and items a fill shuffles, indexed in one pass over the world.
+
+    Every dungeon room, staircase room and single-item cave or shop slot is
+    mapped to the object holding its item, so reading or writing the item at
+    a location is a dict lookup instead of a scan. The same pass collects
+    the locations eligible for shuffling under config and the item pool.
+
+    The index holds references to the world's rooms and caves; it stays valid
+    as long as those objects are only mutated, never replaced, which holds
+    from randomize_items onward.
+
+    Attributes:
+        locations: Locations eligible for item placement, in collection order.
+        pool: Major items at the eligible locations, progressive-downgraded
+            if config.progressive_items.
+    """
+
+    def __init__(self, game_world: GameWorld, config: GameConfig) -> None:
+        self._holders: dict[Location, _ItemHolder] = {}
+        self.locations: list[Location] = []
+        self.pool: list[Item] = []
+
+        # Dungeon locations: rooms and staircase rooms that hold a major item
+        # (or heart container if shuffled). Triforces and compasses/maps are
+        # handled by dungeon_item_shuffler.py — not included here.
+        def _is_shuffled_dungeon_item(item: Item | None) -> bool:
+            return item is not None and (
+                _is_major_item(item) or (config.shuffle_dungeon_hearts and item == Item.HEART_CONTAINER))
+
+        for level in game_world.levels:
+            rooms: list[Room | StaircaseRoom] = [*level.rooms, *level.staircase_rooms]
+            for room in rooms:
+                loc = DungeonLocation(level.level_num, room.room_num)
+                self._holders.setdefault(loc, room)
+                if _is_shuffled_dungeon_item(room.item):
+                    self._add(loc, room.item)
+
+        # Cave locations
+        cave_by_dest = {c.destination: c for c in game_world.overworld.caves}
+        for cave in cave_by_dest.values():
+            if isinstance(cave, (ItemCave, OverworldItem)):
+                self._holders[CaveLocation(cave.destination, 0)] = cave
+            elif isinstance(cave, Shop):
+                for i, shop_item in enumerate(cave.items):
+                    self._holders[CaveLocation(cave.destination, i)] = shop_item
+
+        for dest, flag in _ITEM_CAVE_FLAGS:
+            if getattr(config, flag):
+                c = cave_by_dest.get(dest)
+                item = c.item if isinstance(c, ItemCave) else None
+                self._add(CaveLocation(dest, 0), item if item is not None and _is_major_item(item) else None)
+        for dest, enabled in ((Destination.ARMOS_ITEM, config.shuffle_armos_item),
+                              (Destination.COAST_ITEM, config.shuffle_coast_item)):
+            if enabled:
+                c = cave_by_dest.get(dest)
+                item = c.item if isinstance(c, OverworldItem) else None
+                if item is not None and not (_is_major_item(item) or item == Item.HEART_CONTAINER):
+                    item = None
+                self._add(CaveLocation(dest, 0), item)
+
+        # shuffle_take_any_items hardcoded False for MVP
+        # TODO: wire to flags_generated.py in future phase
+
+        shop_dests: list[Destination] = []
+        if config.shuffle_major_shop_items:
+            shop_dests.extend(_MAJOR_SHOP_DESTINATIONS)
+        if config.shuffle_blue_potion:
+            shop_dests.append(Destination.POTION_SHOP)
+        for dest in shop_dests:
             c = cave_by_dest.get(dest)
             if c is not None:
                 assert isinstance(c, Shop)
                 for i, shop_item in enumerate(c.items):
                     if _is_major_item(shop_item.item):
-                        locations.append(CaveLocation(dest, i))
-    if config.shuffle_blue_potion:
-        c = cave_by_dest.get(Destination.POTION_SHOP)
-        if c is not None:
-            assert isinstance(c, Shop)
-            for i, shop_item in enumerate(c.items):
-                if _is_major_item(shop_item.item):
-                    locations.append(CaveLocation(Destination.POTION_SHOP, i))
+                        self._add(CaveLocation(dest, i), shop_item.item)
 
-    return locations
+        if config.progressive_items:
+            self.pool = [_progressive_downgrade(item) for item in self.pool]
 
+    def _add(self, loc: Location, pool_item: Item | None) -> None:
+        self.locations.append(loc)
+        if pool_item is not None:
+            self.pool.append(pool_item)
 
-def _collect_item_pool(game_world: GameWorld, config: GameConfig) -> list[Item]:
-    """Collect all major items currently placed in the eligible locations."""
-    pool: list[Item] = []
+    def get(self, loc: Location) -> Item:
+        """The item at loc; an empty staircase reads as Item.NOTHING."""
+        item = self._holders[loc].item
+        return item if item is not None else Item.NOTHING
 
-    for level in game_world.levels:
-        for room in level.rooms:
-            if _is_major_item(room.item):
-                pool.append(room.item)
-            elif config.shuffle_dungeon_hearts and room.item == Item.HEART_CONTAINER:
-                pool.append(room.item)
-        for sr in level.staircase_rooms:
-            if sr.item is not None and _is_major_item(sr.item):
-                pool.append(sr.item)
-            elif sr.item is not None and config.shuffle_dungeon_hearts and sr.item == Item.HEART_CONTAINER:
-                pool.append(sr.item)
+    def set(self, loc: Location, item: Item) -> None:
+        self._holders[loc].item = item
 
-    ow = game_world.overworld
-    cave_by_dest = {c.destination: c for c in ow.caves}
+    def snapshot(self) -> list[Item]:
+        """The items at the eligible locations, for restore()."""
+        return [self.get(loc) for loc in self.locations]
 
-    def _get_item_cave_item(dest: Destination) -> Item | None:
-        c = cave_by_dest.get(dest)
-        if c is not None and isinstance(c, ItemCave):
-            return c.item
-        return None
+    def restore(self, snapshot: list[Item]) -> None:
+        for loc, item in zip(self.locations, snapshot, strict=True):
+            self.set(loc, item)
 
-    def _get_overworld_item(dest: Destination) -> Item | None:
-        c = cave_by_dest.get(dest)
-        if c is not None and isinstance(c, OverworldItem):
-            return c.item
-        return None
-
-    if config.shuffle_wood_sword:
-        item = _get_item_cave_item(Destination.WOOD_SWORD_CAVE)
-        if item is not None and _is_major_item(item):
-            pool.append(item)
-    if config.shuffle_white_sword:
-        item = _get_item_cave_item(Destination.WHITE_SWORD_CAVE)
-        if item is not None and _is_major_item(item):
-            pool.append(item)
-    if config.shuffle_magical_sword:
-        item = _get_item_cave_item(Destination.MAGICAL_SWORD_CAVE)
-        if item is not None and _is_major_item(item):
-            pool.append(item)
-    if config.shuffle_letter:
-        item = _get_item_cave_item(Destination.LETTER_CAVE)
-        if item is not None and _is_major_item(item):
-            pool.append(item)
-    if config.shuffle_armos_item:
-        item = _get_overworld_item(Destination.ARMOS_ITEM)
-        if item is not None and (_is_major_item(item) or item == Item.HEART_CONTAINER):
-            pool.append(item)
-    if config.shuffle_coast_item:
-        item = _get_overworld_item(Destination.COAST_ITEM)
-        if item is not None and (_is_major_item(item) or item == Item.HEART_CONTAINER):
-            pool.append(item)
-
-    if config.shuffle_major_shop_items:
-        for dest in [Destination.SHOP_1, Destination.SHOP_2, Destination.SHOP_3, Destination.SHOP_4]:
-            c = cave_by_dest.get(dest)
-            if c is not None and isinstance(c, Shop):
-                for shop_item in c.items:
-                    if _is_major_item(shop_item.item):
-                        pool.append(shop_item.item)
-    if config.shuffle_blue_potion:
-        c = cave_by_dest.get(Destination.POTION_SHOP)
-        if c is not None and isinstance(c, Shop):
-            for shop_item in c.items:
-                if _is_major_item(shop_item.item):
-                    pool.append(shop_item.item)
 
-    if config.progressive_items:
-        pool = [_progressive_downgrade(item) for item in pool]
+def collect_item_locations(game_world: GameWorld, config: GameConfig) -> list[Location]:
+    """Collect all locations eligible for item placement based on flags."""
+    return ShuffleSurface(game_world, config).locations
 
-    return pool
+
+def _collect_item_pool(game_world: GameWorld, config: GameConfig) -> list[Item]:
+    """Collect all major items currently placed in the eligible locations."""
+    return ShuffleSurface(game_world, config).pool
 
 
 # Progressive item downgrade map: higher-tier items become their base version
@@ -409,7 +411,7 @@ _PROGRESSIVE_MAX_COUNTS: dict[Item, int] = {
 
 
 def _check_progressive_placement_invariants(
-    game_world: GameWorld,
+    surface: ShuffleSurface,
     location_pool: list[Location],
     config: GameConfig,
 ) -> bool:
@@ -420,23 +422,7 @@ def _check_progressive_placement_invariants(
     """
     from collections import Counter
 
-    placed: list[Item] = []
-    for loc in location_pool:
-        if isinstance(loc, DungeonLocation):
-            level = game_world.levels[loc.level_num - 1]
-            for room in level.rooms:
-                if room.room_num == loc.room_num:
-                    placed.append(room.item)
-                    break
-            else:
-                for sr in level.staircase_rooms:
-                    if sr.room_num == loc.room_num:
-                        if sr.item is not None:
-                            placed.append(sr.item)
-                        break
-        else:
-            items = _get_cave_items_for_location(game_world, loc)
-            placed.extend(items)
+    placed = [surface.get(loc) for loc in location_pool]
 
     for item in placed:
         if item in _PROGRESSIVE_FORBIDDEN:
@@ -454,72 +440,6 @@ def _check_progressive_placement_invariants(
     return True
 
 
-def _get_cave_items_for_location(game_world: GameWorld, loc: CaveLocation) -> list[Item]:
-    """Return the item(s) at a CaveLocation in the current game world state."""
-    ow = game_world.overworld
-    cave_by_dest = {c.destination: c for c in ow.caves}
-    c = cave_by_dest.get(loc.destination)
-    if c is None:
-        return []
-    match loc.destination:
-        case (Destination.WOOD_SWORD_CAVE | Destination.WHITE_SWORD_CAVE
-              | Destination.MAGICAL_SWORD_CAVE | Destination.LETTER_CAVE):
-            assert isinstance(c, ItemCave)
-            return [c.item]
-        case Destination.ARMOS_ITEM | Destination.COAST_ITEM:
-            assert isinstance(c, OverworldItem)
-            return [c.item]
-        case _:
-            if loc.destination in _SHOP_DESTINATIONS:
-                assert isinstance(c, Shop)
-                return [c.items[loc.position].item]
-            return []
-
-
-# ---------------------------------------------------------------------------
-# Item placement into GameWorld
-# ---------------------------------------------------------------------------
-
-def _place_item(game_world: GameWorld, item: Item, location: Location) -> None:
-    """Write an item placement into the GameWorld (mutates in place)."""
-    if isinstance(location, DungeonLocation):
-        level = game_world.levels[location.level_num - 1]
-        for room in level.rooms:
-            if room.room_num == location.room_num:
-                room.item = item
-                return
-        for sr in level.staircase_rooms:
-            if sr.room_num == location.room_num:
-                sr.item = item
-                return
-        raise ValueError(f"Room {location.room_num:#04x} not found in level {location.level_num}")
-
-    # CaveLocation
-    ow = game_world.overworld
-    dest = location.destination
-    cave_by_dest = {c.destination: c for c in ow.caves}
-    c = cave_by_dest[dest]
-    match dest:
-        case (Destination.WOOD_SWORD_CAVE | Destination.WHITE_SWORD_CAVE
-              | Destination.MAGICAL_SWORD_CAVE | Destination.LETTER_CAVE):
-            assert isinstance(c, ItemCave)
-            c.item = item
-        case Destination.ARMOS_ITEM | Destination.COAST_ITEM:
-            assert isinstance(c, OverworldItem)
-            c.item = item
-        case Destination.TAKE_ANY:
-            assert isinstance(c, TakeAnyCave)
-            c.items[location.position] = item
-        case _:
-            assert isinstance(c, Shop)
-            c.items[location.position].item = item
-
-
-def _clear_location(game_world: GameWorld, location: Location) -> None:
-    """set a location to Item.NOTHING (used before assumed fill begins)."""
-    _place_item(game_world, Item.NOTHING, location)
-
-
 def compute_self_blocking_locations(
     game_world: GameWorld,
     location_pool: list[Location],
@@ -534,11 +454,12 @@ def compute_self_blocking_locations(
     - DIGDOGGER rooms require RECORDER.
     """
     forbidden: dict[Item, set[Location]] = defaultdict(set)
+    pool_locations = set(location_pool)
 
     for level in game_world.levels:
         for room in level.rooms:
             loc = DungeonLocation(level.level_num, room.room_num)
-            if loc not in location_pool:
+            if loc not in pool_locations:
                 continue
             if room.room_action != RoomAction.KILLING_ENEMIES_OPENS_SHUTTERS_AND_DROPS_ITEM:
                 continue
@@ -551,26 +472,63 @@ def compute_self_blocking_locations(
     return forbidden
 
 
+# ---------------------------------------------------------------------------
+# Item x location validity matrix
+# ---------------------------------------------------------------------------
+#
+# Location sets inside assumed fill are int bitsets of LocationRegistry ids
+# (bit i set <=> the location with id i is in the set).
+
+def build_validity_matrix(
+    items: Iterable[Item],
+    location_pool: list[Location],
+    constraints: Constraints,
+    self_blocking: dict[Item, set[Location]],
+    registry: LocationRegistry | None = None,
+) -> dict[Item, int]:
+    """Return, for each distinct item, the bitset of locations it may occupy.
+
+    Combines is_item_valid_for_location with the self-blocking rooms from
+    compute_self_blocking_locations. Neither depends on fill progress, so the
+    matrix is built once per fill. Bits are registry ids; without a registry,
+    bit i stands for location_pool[i].
+    """
+    if registry is None:
+        registry = LocationRegistry(location_pool)
+    bits = [registry.bit(loc) for loc in location_pool]
+    matrix: dict[Item, int] = {}
+    for item in items:
+        if item in matrix:
+            continue
+        blocked = self_blocking.get(item, set())
+        row = 0
+        for loc, bit in zip(location_pool, bits, strict=True):
+            if loc not in blocked and is_item_valid_for_location(item, loc, constraints):
+                row |= bit
+        matrix[item] = row
+    return matrix
+
+
 # ---------------------------------------------------------------------------
 # Pre-placement pass
 # ---------------------------------------------------------------------------
 
 def _force_place(
-    game_world: GameWorld,
+    surface: ShuffleSurface,
     item: Item,
     location: Location,
     item_pool: list[Item],
     location_pool: list[Location],
 ) -> None:
     """Place item at location and remove both from their pools."""
-    _place_item(game_world, item, location)
+    surface.set(location, item)
     item_pool.remove(item)
     if location in location_pool:
         location_pool.remove(location)
 
 
 def _pre_place_forced_items(
-    game_world: GameWorld,
+    surface: ShuffleSurface,
     item_pool: list[Item],
     location_pool: list[Location],
     constraints: Constraints,
@@ -588,15 +546,15 @@ def _pre_place_forced_items(
             swords_and_wands = [i for i in item_pool if i in _SWORD_OR_WAND]
             if swords_and_wands:
                 item = rng.choice(swords_and_wands)
-                _force_place(game_world, item, wood_sword_loc, item_pool, location_pool)
+                _force_place(surface, item, wood_sword_loc, item_pool, location_pool)
 
     if constraints.force_heart_container_to_armos:
         loc = CaveLocation(Destination.ARMOS_ITEM, 0)
-        _force_place(game_world, Item.HEART_CONTAINER, loc, item_pool, location_pool)
+        _force_place(surface, Item.HEART_CONTAINER, loc, item_pool, location_pool)
 
     if constraints.force_heart_container_to_coast:
         loc = CaveLocation(Destination.COAST_ITEM, 0)
-        _force_place(game_world, Item.HEART_CONTAINER, loc, item_pool, location_pool)
+        _force_place(surface, Item.HEART_CONTAINER, loc, item_pool, location_pool)
         # Rebuild level_9_locs since location_pool may have changed
         level_9_locs = [loc for loc in location_pool
                         if isinstance(loc, DungeonLocation) and loc.level_num == 9]
@@ -608,7 +566,7 @@ def _pre_place_forced_items(
         if arrows and level_9_locs:
             dloc = rng.choice(level_9_locs)
             item = rng.choice(arrows)
-            _force_place(game_world, item, dloc, item_pool, location_pool)
+            _force_place(surface, item, dloc, item_pool, location_pool)
 
     if constraints.force_ring_to_level_nine:
         level_9_locs = [loc for loc in location_pool
@@ -617,7 +575,7 @@ def _pre_place_forced_items(
         if rings and level_9_locs:
             dloc = rng.choice(level_9_locs)
             item = rng.choice(rings)
-            _force_place(game_world, item, dloc, item_pool, location_pool)
+            _force_place(surface, item, dloc, item_pool, location_pool)
 
     # Item enum forced placements (white_sword_item, armos_item, coast_item)
     # force_heart_container cases are already handled above; skip here to avoid double-placing.
@@ -630,22 +588,49 @@ def _pre_place_forced_items(
         if forced_item is None or forced_item == Item.HEART_CONTAINER:
             continue  # None = random, heart_container already handled above
         if loc in location_pool and forced_item in item_pool:
-            _force_place(game_world, forced_item, loc, item_pool, location_pool)
+            _force_place(surface, forced_item, loc, item_pool, location_pool)
 
 
 # ---------------------------------------------------------------------------
-# Assumed fill
+# Fill engines
 # ---------------------------------------------------------------------------
 
-def assumed_fill(game_world: GameWorld, config: GameConfig, rng: Rng) -> bool:
-    """Place all major items using assumed fill. Mutates game_world in place.
+class FillEngine(Protocol):
+    """A placement algorithm for the shuffled major items.
 
-    Returns True if a valid seed was generated, False if placement was
-    impossible (rare with assumed fill; indicates over-constrained input).
+    Places every item of surface.pool into surface.locations, mutating
+    game_world in place, and returns True if the result passed
+    is_seed_valid(). On False the surface may be left partly filled;
+    randomize_items restores it before the next attempt.
     """
+
+    def __call__(self, game_world: GameWorld, config: GameConfig, rng: Rng,
+                 stats: FillStats, surface: ShuffleSurface) -> bool: ...
+
+
+@dataclass
+class _FillSetup:
+    """State shared by the fill engines after the common setup steps."""
+
+    surface: ShuffleSurface
+    validator: GameValidator
+    item_pool: list[Item]                  # items left to place after pre-placement
+    all_shuffled_locations: list[Location]
+    validity: dict[Item, int]              # item -> bitset of location ids it may occupy
+    empty_mask: int                        # bitset of location ids still to fill
+
+
+def _prepare_fill(
+    game_world: GameWorld,
+    config: GameConfig,
+    rng: Rng,
+    surface: ShuffleSurface | None,
+    validator_type: type[GameValidator] = GameValidator,
+) -> _FillSetup:
+    """Collect the pools, clear the shuffled locations and pre-place forced items."""
     constraints = Constraints.from_config(config)
-    validator = GameValidator(game_world, config.avoid_required_hard_combat,
-                              progressive_items=config.progressive_items)
+    validator = validator_type(game_world, config.avoid_required_hard_combat,
+                               progressive_items=config.progressive_items)
 
     # Progressive items + magical sword cave not shuffled: overwrite the cave
     # with a WOOD_SWORD so the player finds a sword upgrade there instead of
@@ -657,9 +642,13 @@ def assumed_fill(game_world: GameWorld, config: GameConfig, rng: Rng) -> bool:
             c.item = Item.WOOD_SWORD
 
     # Collect pools from the current game world state
-    item_pool = _collect_item_pool(game_world, config)
-    location_pool = collect_item_locations(game_world, config)
+    if surface is None:
+        surface = ShuffleSurface(game_world, config)
+    item_pool = list(surface.pool)
+    location_pool = list(surface.locations)
     all_shuffled_locations = list(location_pool)  # snapshot before pool is mutated
+    registry = validator.locations
+    registry.mask(all_shuffled_locations)  # register before any query, in pool order
 
     assert len(item_pool) == len(location_pool), (
         f"Pool size mismatch: {len(item_pool)} items vs {len(location_pool)} locations"
@@ -670,187 +659,307 @@ def assumed_fill(game_world: GameWorld, config: GameConfig, rng: Rng) -> bool:
 
     # Clear all shuffled locations so the validator sees empty slots
     for loc in location_pool:
-        _clear_location(game_world, loc)
+        surface.set(loc, Item.NOTHING)
 
     # Pre-place forced items
-    _pre_place_forced_items(game_world, item_pool, location_pool, constraints, rng)
+    _pre_place_forced_items(surface, item_pool, location_pool, constraints, rng)
 
     # Compute self-blocking constraints: rooms where an item can't go because
     # collecting it from that room requires the item itself to be in inventory.
     self_blocking = compute_self_blocking_locations(game_world, location_pool)
 
-    # Track which locations from location_pool have been filled.
-    # Pre-placed locations were removed from location_pool by _pre_place_forced_items
-    # but are already filled — seed them into the set so the final assert counts them.
-    filled: set[Location] = set(all_shuffled_locations) - set(location_pool)
+    # Static item x location validity, as bitsets of location ids. The
+    # shuffled locations were registered first, so ids ascend in location_pool
+    # order and picking from a bitset sees locations in pool order.
+    validity = build_validity_matrix(item_pool, location_pool, constraints, self_blocking, registry)
+    # Locations still to fill. Pre-placed ones were removed from location_pool
+    # by _pre_place_forced_items and are already filled.
+    empty_mask = registry.mask(location_pool)
 
-    # Assumed fill loop
-    rng.shuffle(item_pool)
+    return _FillSetup(surface, validator, item_pool, all_shuffled_locations, validity, empty_mask)
 
-    # Cache reachable_without results across outer iterations.
-    # A cache entry is valid as long as the item pool hasn't changed (i.e. no
-    # placement has occurred). The cache is cleared immediately after each
-    # _place_item call so stale entries never survive into the next iteration.
-    _reachable_without_cache: dict[tuple[Item, ...], set[Location]] = {}
 
-    while item_pool:
-        # Build assumed inventory: everything still unplaced
-        assumed = Inventory()
-        for item in item_pool:
-            assumed.items.add(item)
-        # Triforces are tracked by level, not as generic items.  Credit one
-        # assumed level per unplaced triforce so the validator can open L9.
-        assumed_triforce_count = item_pool.count(Item.TRIFORCE)
-        for lvl in range(1, assumed_triforce_count + 1):
-            if lvl not in assumed.levels_with_triforce_obtained:
-                assumed.levels_with_triforce_obtained.append(lvl)
-
-        # Find all reachable empty locations under assumed inventory
-        reachable = validator.get_reachable_locations(assumed_inventory=assumed)
-        reachable_set = set(reachable)
-
-        empty_reachable = [
-            loc for loc in location_pool
-            if loc not in filled and loc in reachable_set
-        ]
-
-        if not empty_reachable:
-            return False
+def assumed_fill(game_world: GameWorld, config: GameConfig, rng: Rng,
+                 max_backtracks: int = 0, stats: FillStats | None = None,
+                 surface: ShuffleSurface | None = None,
+                 validator_type: type[GameValidator] = GameValidator) -> bool:
+    """Place all major items using assumed fill. Mutates game_world in place.
 
-        # Score each item by how many valid locations it has (without itself assumed).
-        # Sort ascending (most constrained first) so items with few options are
-        # placed before items that can go almost anywhere. Ties are broken randomly
-        # by pre-shuffling before the stable sort.
-        #
-        # Cache reachable_without results by the remaining pool's sorted tuple —
-        # using a tuple (not frozenset) to preserve duplicate counts correctly.
-        # Items of the same type (e.g. multiple HEART_CONTAINERs) produce the
-        # same remaining multiset when removed, so they share one traversal.
-        candidates = list(item_pool)
-        rng.shuffle(candidates)
-
-        item_valid_locs: list[tuple[Item, list[Location]]] = []
-        for item in candidates:
-            remaining_for_check = list(item_pool)
-            remaining_for_check.remove(item)
-            cache_key = tuple(sorted(remaining_for_check, key=lambda i: i.value))
-
-            if cache_key not in _reachable_without_cache:
-                assumed_without = Inventory()
-                for other in remaining_for_check:
-                    assumed_without.items.add(other)
-                without_triforce_count = remaining_for_check.count(Item.TRIFORCE)
-                for lvl in range(1, without_triforce_count + 1):
-                    if lvl not in assumed_without.levels_with_triforce_obtained:
-                        assumed_without.levels_with_triforce_obtained.append(lvl)
-                rw = validator.get_reachable_locations(assumed_inventory=assumed_without)
-                _reachable_without_cache[cache_key] = set(rw)
-
-            reachable_without_set = _reachable_without_cache[cache_key]
-
-            valid_locs = [
-                loc for loc in empty_reachable
-                if loc in reachable_without_set
-                and is_item_valid_for_location(item, loc, constraints)
-                and loc not in self_blocking.get(item, set())
-            ]
-            item_valid_locs.append((item, valid_locs))
-
-        # Place the most-constrained item (fewest valid locations, >0)
-        item_valid_locs.sort(key=lambda x: len(x[1]) if x[1] else float("inf"))
-
-        placed = False
-        for item, valid_locs in item_valid_locs:
-            if not valid_locs:
-                continue
-            loc = rng.choice(valid_locs)
-            _place_item(game_world, item, loc)
-            _reachable_without_cache.clear()
-            item_pool.remove(item)
-            filled.add(loc)
-            placed = True
-            break
+    Returns True if a valid seed was generated, False if placement was
+    impossible (rare with assumed fill; indicates over-constrained input).
 
-        if not placed:
+    Args:
+        max_backtracks: Recover from up to this many dead ends by undoing recent
+            placements before giving up. The earliest undone (item, location)
+            is remembered as a nogood for the placements before it, so the
+            same dead end is not re-entered. 0 (the default) gives up on the
+            first dead end.
+        stats: Filled with backtracking counters if provided.
+        surface: Index of game_world's shuffled locations; built here if
+            omitted. A surface built earlier may be reused only if the items
+            at its locations are back to what they were when it was built.
+        validator_type: GameValidator subclass to answer reachability
+            queries with (e.g. an instrumented one in benchmarks).
+    """
+    if stats is None:
+        stats = FillStats()
+    setup = _prepare_fill(game_world, config, rng, surface, validator_type)
+    surface, validator, registry = setup.surface, setup.validator, setup.validator.locations
+    item_pool, validity, empty_mask = setup.item_pool, setup.validity, setup.empty_mask
+    all_shuffled_locations = setup.all_shuffled_locations
+
+    # Assumed fill loop
+    rng.shuffle(item_pool)
+
+    # Placements made by the loop, for backtracking: (item, location, index
+    # the item had in item_pool).
+    placements: list[tuple[Item, Location, int]] = []
+    # Learned nogoods: for a set of earlier placements, the locations each item
+    # already failed from. Only filled in when backtracking is enabled.
+    nogoods: dict[frozenset[tuple[Item, Location]], dict[Item, int]] = {}
+    jump = 0
+    deepest_dead_end = 0
+
+    while True:
+        if item_pool:
+            best_item, valid_mask = _choose_placement(
+                validator, item_pool, validity, empty_mask, rng,
+                nogoods.get(_placement_key(placements)) if nogoods else None,
+            )
+            if best_item is not None:
+                loc = rng.choice(registry.locations(valid_mask))
+                surface.set(loc, best_item)
+                placements.append((best_item, loc, item_pool.index(best_item)))
+                item_pool.remove(best_item)
+                empty_mask &= ~registry.bit(loc)
+                continue
+        elif _is_fill_complete(surface, validator, config, all_shuffled_locations, item_pool, empty_mask):
+            return True
+
+        # Dead end. Without backtracking budget (the default), give up and let
+        # randomize_items restart. Otherwise back-jump: undo the latest `jump`
+        # placements and mark the earliest of them as a nogood for the
+        # placements before it. The placement that caused a dead end is often
+        # well before the last one, so the jump doubles every time the fill
+        # gets stuck again without getting past the deepest dead end so far.
+        if stats.backtracks >= max_backtracks or not placements:
             return False
+        jump = jump * 2 if len(placements) <= deepest_dead_end else 1
+        deepest_dead_end = max(deepest_dead_end, len(placements))
+        depth = min(jump, len(placements))
+        for _ in range(depth):
+            item, loc, index = placements.pop()
+            surface.set(loc, Item.NOTHING)
+            item_pool.insert(index, item)
+            empty_mask |= registry.bit(loc)
+        prefix_nogoods = nogoods.setdefault(_placement_key(placements), {})
+        prefix_nogoods[item] = prefix_nogoods.get(item, 0) | registry.bit(loc)
+        stats.backtracks += 1
+        stats.max_backtrack_depth = max(stats.max_backtrack_depth, depth)
+
+
+def _placement_key(placements: list[tuple[Item, Location, int]]) -> frozenset[tuple[Item, Location]]:
+    return frozenset((item, loc) for item, loc, _ in placements)
+
+
+def _choose_placement(
+    validator: GameValidator,
+    item_pool: list[Item],
+    validity: dict[Item, int],
+    empty_mask: int,
+    rng: Rng,
+    nogoods: dict[Item, int] | None,
+) -> tuple[Item | None, int]:
+    """Pick the next item to place and the mask of locations it may go to.
 
+    Returns (None, 0) at a dead end: no empty location is reachable, or no
+    item has a valid one.
+    """
+    # Find all reachable empty locations assuming everything still unplaced,
+    # and, in the same call, what stays reachable without each item.
+    reachable, reachable_without = validator.get_reachable_masks_without_each(item_pool)
+    empty_reachable = empty_mask & reachable
+
+    if not empty_reachable:
+        return None, 0
+
+    # Score each item by how many valid locations it has (without itself assumed).
+    # The most constrained item is placed first, so items with few options are
+    # placed before items that can go almost anywhere. Ties are broken randomly
+    # by pre-shuffling the candidates.
+    #
+    # An item's valid locations are its validity row ANDed with the empty
+    # reachable set and the set still reachable without that item. Copies
+    # of the same item share one row.
+    valid_masks: dict[Item, int] = {}
+    for item, without in reachable_without.items():
+        valid_masks[item] = validity[item] & empty_reachable & without
+        if nogoods is not None:
+            valid_masks[item] &= ~nogoods.get(item, 0)
+    candidates = list(item_pool)
+    rng.shuffle(candidates)
+
+    # Place the most-constrained item: fewest valid locations (>0), ties going
+    # to the earliest candidate in shuffled order. Scoring is a popcount per
+    # candidate; only the chosen item's locations are materialized.
+    best_item: Item | None = None
+    best_count = 0
+    for item in candidates:
+        count = valid_masks[item].bit_count()
+        if count and (best_item is None or count < best_count):
+            best_item, best_count = item, count
+
+    if best_item is None:
+        return None, 0
+    return best_item, valid_masks[best_item]
+
+
+def _is_fill_complete(
+    surface: ShuffleSurface,
+    validator: GameValidator,
+    config: GameConfig,
+    all_shuffled_locations: list[Location],
+    item_pool: list[Item],
+    empty_mask: int,
+) -> bool:
+    """Final checks once every item is placed. False means the fill is a dead end."""
     # All items placed — verify nothing was left behind
     assert len(item_pool) == 0, f"item_pool not empty after fill: {[i.name for i in item_pool]}"
-    unfilled = [loc for loc in all_shuffled_locations if loc not in filled]
-    assert len(unfilled) == 0, (
+    assert empty_mask == 0, (
         "unfilled locations after fill: "
         + ", ".join(
             f"L{loc.level_num} R{loc.room_num:#04x}" if isinstance(loc, DungeonLocation)
             else f"{loc.destination.name} pos={loc.position}"
-            for loc in unfilled
+            for loc in validator.locations.locations(empty_mask)
         )
     )
 
     # Progressive placement invariant: no higher-tier items in shuffled locations,
     # no base item appearing more times than its chain length.
     if config.progressive_items:
-        if not _check_progressive_placement_invariants(game_world, all_shuffled_locations, config):
+        if not _check_progressive_placement_invariants(surface, all_shuffled_locations, config):
             return False
 
     # Final sanity check
     return validator.is_seed_valid()
 
 
+# Items the validator counts instead of testing for, so they never show up
+# in a traversal's probed set, yet can still open more of the world when
+# assumed: build_assumed_inventory credits each triforce as a level. Heart
+# containers are counted too, but traverse() ignores assumed ones, so a
+# heart container probe can never open anything; they go in as filler.
+_COUNTED_ITEMS = frozenset({Item.TRIFORCE})
+
+
+def forward_fill(game_world: GameWorld, config: GameConfig, rng: Rng,
+                 stats: FillStats | None = None, surface: ShuffleSurface | None = None) -> bool:
+    """Place all major items by forward fill. Mutates game_world in place.
+
+    Cheaper than assumed_fill: it never asks what stays reachable without
+    each unplaced item. Each sphere is the set of empty locations reachable
+    with the items placed so far. Into it go one key, an item that opens
+    more of the world, plus random filler into about half of the remaining
+    open slots. Once every empty location is reachable the rest is placed
+    most-constrained first, and the result gets a single is_seed_valid()
+    check.
+
+    Every item lands somewhere already reachable when it is placed, so the
+    only failure is running out of open locations before the pool is empty.
+    That happens more often than with assumed_fill; randomize_items retries.
+
+    Args:
+        stats: Accepted for FillEngine compatibility; forward fill never
+            backtracks.
+        surface: As for assumed_fill.
+    """
+    setup = _prepare_fill(game_world, config, rng, surface)
+    surface, validator, registry = setup.surface, setup.validator, setup.validator.locations
+    item_pool, validity, empty_mask = setup.item_pool, setup.validity, setup.empty_mask
+    rng.shuffle(item_pool)
+
+    def place(item: Item, mask: int) -> None:
+        nonlocal empty_mask
+        loc = rng.choice(registry.locations(mask))
+        surface.set(loc, item)
+        item_pool.remove(item)
+        empty_mask &= ~registry.bit(loc)
+
+    while item_pool:
+        reachable, probed = validator.get_reachable_mask_and_probes()
+        open_mask = empty_mask & reachable
+        if not open_mask:
+            return False
+
+        if open_mask == empty_mask:
+            # Whole world open: place what is left, fewest options first.
+            for item in sorted(item_pool, key=lambda i: (validity[i] & empty_mask).bit_count()):
+                if not validity[item] & empty_mask:
+                    return False
+                place(item, validity[item] & empty_mask)
+            break
+
+        # Key: an item that opens new empty locations on its own. Only items
+        # the traversal tested for, or triforces (see _COUNTED_ITEMS), can;
+        # each candidate costs one traversal, so stop at the first that
+        # works. If none does alone, place any of them.
+        candidates = [i for i in dict.fromkeys(item_pool)
+                      if validity[i] & open_mask and (i in probed or i in _COUNTED_ITEMS)]
+        if not candidates:
+            candidates = [i for i in dict.fromkeys(item_pool) if validity[i] & open_mask]
+            if not candidates:
+                return False
+        key = next(
+            (i for i in candidates
+             if validator.get_reachable_mask(build_assumed_inventory([i])) & empty_mask & ~reachable),
+            candidates[0],
+        )
+        place(key, validity[key] & open_mask)
+        open_mask &= empty_mask
+
+        # Filler: items the traversal did not ask about cannot open anything
+        # yet, so spend up to half the remaining open slots on them.
+        filler = [i for i in item_pool if i not in probed and i not in _COUNTED_ITEMS]
+        for item in filler[:(open_mask.bit_count() - 1) // 2]:
+            if validity[item] & open_mask:
+                place(item, validity[item] & open_mask)
+                open_mask &= empty_mask
+
+    return _is_fill_complete(surface, validator, config, setup.all_shuffled_locations, item_pool, empty_mask)
+
+
+def _assumed_fill_engine(game_world: GameWorld, config: GameConfig, rng: Rng,
+                         stats: FillStats, surface: ShuffleSurface) -> bool:
+    return assumed_fill(game_world, config, rng, config.max_fill_backtracks, stats, surface)
+
+
+# Fill engines by name, selected with GameConfig.fill_engine.
+FILL_ENGINES: dict[str, FillEngine] = {
+    "assumed": _assumed_fill_engine,
+    "forward": forward_fill,
+}
+
+
 # ---------------------------------------------------------------------------
 # Helper: collect all placed items (for test comparison)
 # ---------------------------------------------------------------------------
 
-def _snapshot_locations(game_world: GameWorld, config: GameConfig) -> dict[Location, Item]:
-    """Capture the current item at every major-item location."""
-    snapshot: dict[Location, Item] = {}
-    for loc in collect_item_locations(game_world, config):
-        if isinstance(loc, DungeonLocation):
-            level = game_world.levels[loc.level_num - 1]
-            for room in level.rooms:
-                if room.room_num == loc.room_num:
-                    snapshot[loc] = room.item
-                    break
-            else:
-                for sr in level.staircase_rooms:
-                    if sr.room_num == loc.room_num:
-                        snapshot[loc] = sr.item if sr.item is not None else Item.NOTHING
-                        break
-        else:
-            ow = game_world.overworld
-            cave_by_dest = {c.destination: c for c in ow.caves}
-            c = cave_by_dest[loc.destination]
-            match loc.destination:
-                case (Destination.WOOD_SWORD_CAVE | Destination.WHITE_SWORD_CAVE
-                      | Destination.MAGICAL_SWORD_CAVE | Destination.LETTER_CAVE):
-                    assert isinstance(c, ItemCave)
-                    snapshot[loc] = c.item
-                case Destination.ARMOS_ITEM | Destination.COAST_ITEM:
-                    assert isinstance(c, OverworldItem)
-                    snapshot[loc] = c.item
-                case Destination.TAKE_ANY:
-                    assert isinstance(c, TakeAnyCave)
-                    snapshot[loc] = c.items[loc.position]
-                case _:
-                    assert isinstance(c, Shop)
-                    snapshot[loc] = c.items[loc.position].item
-    return snapshot
-
-
-def _restore_locations(game_world: GameWorld, snapshot: dict[Location, Item]) -> None:
-    """Restore item placements from a snapshot."""
-    for loc, item in snapshot.items():
-        _place_item(game_world, item, loc)
-
-
 def randomize_items(game_world: GameWorld, config: GameConfig, rng: Rng) -> None:
     max_attempts = 3
+    fill = FILL_ENGINES[config.fill_engine]
+    surface = ShuffleSurface(game_world, config)
+    snapshot = surface.snapshot()
     for attempt in range(max_attempts):
-        snapshot = _snapshot_locations(game_world, config)
-        success = assumed_fill(game_world, config, rng)
+        stats = FillStats()
+        success = fill(game_world, config, rng, stats, surface)
+        if stats.backtracks:
+            log.info("%s fill attempt %d: %s after %d backtracks (max depth %d)",
+                     config.fill_engine, attempt + 1, "succeeded" if success else "failed",
+                     stats.backtracks, stats.max_backtrack_depth)
         if success:
             return
         if attempt < max_attempts - 1:
-            _restore_locations(game_world, snapshot)
+            surface.restore(snapshot)
     raise RuntimeError("Randomizer could not produce a valid seed")
 
 
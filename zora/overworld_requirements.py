@@ -0,0 +1,74 @@
+"""
+Overworld screen requirement masks.
+
+Each overworld screen's entry requirement is compiled once into a bitmask of
+REQ_* bits. Screen accessibility then becomes a single mask test against the
+bits an inventory satisfies:
+
+    accessible = (screen_mask & ~inventory_mask) == 0
+
+Used by GameValidator for reachability and by the entrance shuffler for its
+placement rules (wood sword cave placement, overworld block check).
+"""
+from zora.data_model import EntranceType, GameWorld, Item
+from zora.inventory import Inventory
+
+REQ_SWORD_OR_WAND   = 1 << 0  # bomb walls: logic requires a weapon, not bombs
+REQ_CANDLE          = 1 << 1
+REQ_RECORDER        = 1 << 2
+REQ_RAFT            = 1 << 3
+REQ_LADDER          = 1 << 4
+REQ_POWER_BRACELET  = 1 << 5
+REQ_LOST_HILLS_HINT = 1 << 6
+REQ_DEAD_WOODS_HINT = 1 << 7
+REQ_NEVER           = 1 << 8  # no entrance; never satisfied by any inventory
+
+ENTRANCE_TYPE_REQUIREMENTS: dict[EntranceType, int] = {
+    EntranceType.NONE:                    REQ_NEVER,
+    EntranceType.OPEN:                    0,
+    EntranceType.BOMB:                    REQ_SWORD_OR_WAND,
+    EntranceType.CANDLE:                  REQ_CANDLE,
+    EntranceType.RECORDER:                REQ_RECORDER,
+    EntranceType.RAFT:                    REQ_RAFT,
+    EntranceType.RAFT_AND_BOMB:           REQ_RAFT | REQ_SWORD_OR_WAND,
+    EntranceType.LADDER:                  REQ_LADDER,
+    EntranceType.LADDER_AND_BOMB:         REQ_LADDER | REQ_SWORD_OR_WAND,
+    EntranceType.POWER_BRACELET:          REQ_POWER_BRACELET,
+    EntranceType.POWER_BRACELET_AND_BOMB: REQ_POWER_BRACELET | REQ_SWORD_OR_WAND,
+    EntranceType.LOST_HILLS_HINT:         REQ_LOST_HILLS_HINT,
+    EntranceType.DEAD_WOODS_HINT:         REQ_DEAD_WOODS_HINT,
+}
+
+# Single items that satisfy a requirement bit on their own.
+_ITEM_REQUIREMENTS: tuple[tuple[Item, int], ...] = (
+    (Item.RECORDER,                      REQ_RECORDER),
+    (Item.RAFT,                          REQ_RAFT),
+    (Item.LADDER,                        REQ_LADDER),
+    (Item.POWER_BRACELET,                REQ_POWER_BRACELET),
+    (Item.LOST_HILLS_HINT_VIRTUAL_ITEM,  REQ_LOST_HILLS_HINT),
+    (Item.DEAD_WOODS_HINT_VIRTUAL_ITEM,  REQ_DEAD_WOODS_HINT),
+)
+
+
+def screen_requirement_masks(game_world: GameWorld) -> list[int]:
+    """Return one requirement mask per entry of game_world.overworld.screens (same order)."""
+    return [ENTRANCE_TYPE_REQUIREMENTS[s.entrance_type] for s in game_world.overworld.screens]
+
+
+def inventory_requirement_mask(inventory: Inventory) -> int:
+    """Return the REQ_* bits satisfied by the inventory's current items."""
+    mask = 0
+    if inventory.has_sword_or_wand():
+        mask |= REQ_SWORD_OR_WAND
+    if inventory.has_candle():
+        mask |= REQ_CANDLE
+    items = inventory.items
+    for item, bit in _ITEM_REQUIREMENTS:
+        if item in items:
+            mask |= bit
+    return mask
+
+
+def is_satisfied(requirement_mask: int, inventory_mask: int) -> bool:
+    """True if every bit of requirement_mask is present in inventory_mask."""
+    return not requirement_mask & ~inventory_mask